@@ -3,13 +3,27 @@ import time
 import math
 import tkinter as tk
 from tkinter import messagebox, filedialog
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk, ImageSequence, ImageChops, ImageDraw, ImageFont, ImageColor, GifImagePlugin
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # keep stdout clean for --bench-scenes JSON
 import pygame
 import calendar
 from datetime import datetime
 from tkinter import font as tkfont
 import random
 import json
+import csv
+import sys
+import contextlib
+import bisect
+import struct
+import threading
+import weakref
+import queue
+import hashlib
+import mmap
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------- Configuration ----------------
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
@@ -36,10 +50,12 @@ TORN_SOUND = os.path.join(ASSETS_DIR, 'tear.wav')      # optional paper tear sfx
 #   'fixed'  -> always use FIXED_SCALE
 #   'auto'   -> pick the largest integer scale that fits within MAX_DISPLAY_* bounds
 #   'none'   -> no enlargement (scale = 1)
+#   'fractional' -> largest (possibly non-integer) scale that fits, nearest-neighbour so pixels stay crisp
 SCALE_MODE = 'auto'
 FIXED_SCALE = 4
 MAX_DISPLAY_WIDTH = 800
 MAX_DISPLAY_HEIGHT = 600
+FRACTIONAL_FIT_SCREEN = True  # 'fractional' fits the actual screen instead of MAX_DISPLAY_*
 # RESIZE/FRAME FIT MODE:
 #   'letterbox' -> preserve aspect, pad with bars (old behavior)
 #   'fill'      -> cover: scale up preserving aspect then center-crop to base size (no bars)
@@ -47,22 +63,57 @@ MAX_DISPLAY_HEIGHT = 600
 RESIZE_MODE = 'fill'
 
 FPS_LIMIT = 120
+SIM_STEP_HZ = 60               # fixed simulation rate: fades, tear, timers and GIF clocks advance in 1/SIM_STEP_HZ s steps
+SIM_MAX_STEPS = 120            # longest stall replayed at once; time beyond it is dropped instead of fast-forwarded
+EVENT_DRIVEN_RENDERING = True  # redraw only on input, animation, or a scene GIF frame change
+IDLE_REDRAW_MS = 1000          # longest gap between redraws while nothing is known to change
+HOVER_SOUND_MIN_INTERVAL_MS = 80  # shortest gap between hover blips (a fast sweep over a menu plays a few, not one per row)
 CROSSFADE_FRAMES = 30  # Duration of fade transition (frames)
 TEAR_DURATION_FRAMES = 50  # frames for torn page transition
-USE_TORN_TRANSITION = False
+USE_TORN_TRANSITION = True
 TEAR_EDGE_SEGMENTS = 18    # how many horizontal jitter points across width
 TEAR_WOBBLE_Y = 24         # vertical random wobble amplitude of edge
 TEAR_DEBRIS_COUNT = 22     # small paper debris particles spawned along edge
 TEAR_BG_SHADE = (245,242,233,255)  # paper color for revealed edge fringe
 TEAR_FRINGE_THICKNESS = 14 # thickness of fringe highlight mask
 LOOP = True
+GIF_STREAMING = True       # decode scene GIF frames on demand instead of all at startup
+GIF_FRAME_WINDOW = None    # max decoded (and cached) frames kept per streaming GIF; None = only GIF_FRAME_BUDGET_MB bounds it
+GIF_FRAME_BUDGET_MB = 192  # total memory for scene frames: every streaming GIF's decoded frames and scene caches share it (LRU)
+GIF_PREFETCH_FRAMES = 4    # frames decoded ahead of playback on a worker thread
+# FRAME STORAGE MODE:
+#   'compact' -> keep opaque frames as 'P' (1 byte/px) or 'RGB' (3 bytes/px); RGBA only with real transparency
+#   'rgba'    -> expand every frame to RGBA (4 bytes/px, old behavior)
+FRAME_STORAGE_MODE = 'compact'
+FRAME_CACHE_ENABLED = True  # keep standardized scene frames on disk so later launches skip GIF decoding (--no-frame-cache turns it off)
+FRAME_CACHE_MAX_MB = 128    # disk budget for FRAME_CACHE_DIR; least recently used GIF entries are evicted beyond it
+FRAME_CACHE_MAX_RATIO = 24  # skip caching a GIF whose cached frames come to more than this many times its file size
+FRAME_CACHE_ZLIB_LEVEL = 1  # compression of cached RGB(A) frames ('P' frames stay raw so they can be mapped zero-copy)
+FRAME_CACHE_DIR = os.path.join(os.path.dirname(__file__), '.frame_cache')
+DIRTY_RECTS = True          # re-upload only the changed region of a scene frame to Tk
+DIRTY_RECT_MAX_STEPS = 4    # frames skipped in one tick beyond which a full upload is used
+DIRTY_RECT_MAX_FRACTION = 0.5  # changed area (fraction of frame) beyond which a full upload is cheaper
+RETAINED_CANVAS = True      # reuse canvas items across frames instead of delete("all") + recreate every tick
+# OVERLAY_BACKEND:
+#   'canvas' -> menus, badge, phone game, meditation and to-do overlays are individual Tk canvas items
+#   'pil'    -> they are drawn with ImageDraw into one logical-resolution RGBA layer, cached while
+#               unchanged, and shown as a single image over the scene
+OVERLAY_BACKEND = 'canvas'
+ASSET_LOADER_WORKERS = 2   # worker threads decoding scenes/sounds after the window opens
+ASSET_POLL_MS = 15         # how often the Tk thread collects finished asset loads
 
 # Door hotspot (x1, y1, x2, y2) in original GIF pixel coordinates - enlarged for easier clicking
 DOOR_HITBOX = (20, 20, 120, 120)  # Much larger door hitbox from left to right
 CLICK_ANYWHERE_OUTSIDE = True  # If True, any click while outside starts transition
 SHOW_DOOR_DEBUG = False        # If True, draws red door hotspot rectangle
 SHOW_FOCUSED_DEBUG = False     # If True, draws book/calendar hitboxes in focused scene
+SHOW_PHOTO_STATS = False       # If True, shows PhotoImage allocations per second (bottom-left)
+SHOW_FRAME_STATS = False       # If True, shows missed frame deadlines and dropped simulation time (bottom-left)
 SHOW_COORDS = True             # If True, displays logical cursor coordinates top-left
+SHOW_PERF_HUD = False          # If True, starts with the frame timing HUD in place of the coordinates text
+PERF_HUD_KEY = 'F3'            # toggles the frame timing HUD
+PERF_WINDOW = 240              # frames kept for the rolling p50/p95/p99
+PERF_CSV_PATH = None           # e.g. 'frame_times.csv': append one row of phase timings per drawn frame
 CURSOR_MODE = 'leaf'           # 'leaf' or 'crosshair' for precision aiming
 USE_LEAF_CURSOR = True         # Enable custom leaf cursor instead of system pointer
 LEAF_SCALE = 1                 # Optional extra scale on the leaf image (logical before canvas scale)
@@ -164,7 +215,7 @@ MOOD_MENU_HOVER_BG = "#2e2a23"
 MOOD_MENU_TEXT_COLOR = "#d8d0c0"
 MOOD_MENU_HOVER_TEXT = "#fff9e6"
 MOOD_MENU_ACCENT = "#c29552"  # left bar accent
-MOOD_MENU_ANIM_SPEED = 0.12   # slide-in speed (fraction per frame)
+MOOD_MENU_ANIM_SPEED = 0.12   # slide-in speed (fraction per simulation step)
 MOOD_MENU_FONT = ("Courier New", 12, "bold")
 MOOD_MENU_DESC_FONT = ("Courier New", 9, "normal")
 MOOD_BADGE_FONT = ("Courier New", 10, "bold")
@@ -182,6 +233,32 @@ MOOD_MENU_ICON_MAP = {       # map item label -> icon filename in assets (option
     "Creative": "icon_creative.png",
 }
 
+# Menus as data (see Menu): title, (label, description) rows, layout options and, per
+# label, the action run when it is chosen: (CafeApp method or dotted attribute, *args)
+MENUS = {
+    'mood': dict(title=MOOD_MENU_TITLE, items=MOOD_MENU_ITEMS, icons=True, slide_in=True, actions={
+        "Cozy": ('open_menu', 'cozy'),
+        "Focused": ('open_menu', 'focused'),
+        "Creative": ('open_menu', 'creative'),
+    }),
+    'cozy': dict(title="Cozy Options", items=COZY_SUBMENU_ITEMS, actions={
+        "Meditate": ('start_meditation',),
+        "Phone": ('start_phone_game',),
+        "Fireplace": ('toggle_fireplace',),
+        "Coffee": ('start_coffee_scene',),
+    }),
+    'focused': dict(title="Focused Options", items=FOCUSED_SUBMENU_ITEMS, actions={
+        "Study Zone": ('scene.trigger_fade_to_focused',),  # go to focused scene for study zone
+        "To-Do List": ('start_todo_list',),
+    }),
+    'creative': dict(title="Creative Options", items=CREATIVE_SUBMENU_ITEMS,
+                     row_offset=MOOD_MENU_PADDING, row_inset=4, backdrop="#1a1a1a", actions={
+        "Edit Code": ('open_code_editor',),
+        "Notebook": ('open_note_window',),
+        "Mood Menu": ('open_menu', 'mood', False),
+    }),
+}
+
 # Focused scene interactive element hitboxes (logical GIF coordinates)
 # Placeholder values; user will provide final positions.
 BOOK_HITBOX = (492, 680, 532, 720)       # approx centered on (512,700) size 40x40
@@ -238,6 +315,8 @@ TYPING_SOUND_COOLDOWN = 0.5
 BLOCKY_FONT_SIZE = 8  # base size for blocky characters
 BLOCKY_FONT_SCALE = 1  # additional scale multiplier
 BLOCKY_FONT_SPACING = 1  # extra spacing between characters
+BLOCKY_TEXT_MODE = 'image'  # 'image': one image item per string (glyph atlas) | 'vector': one rectangle per pixel run
+TEXT_RUN_CACHE_SIZE = 256  # rendered text runs kept (blocky PhotoImages + compositor text images)
 
 # Notebook persistence
 NOTEBOOK_SAVE_FILE = os.path.join(ASSETS_DIR, 'notebook_data.json')
@@ -252,45 +331,2270 @@ IPOD_ACCENT_COLOR = "#0080ff"
 
 # ------------------------------------------------
 
+_GIF_STRATEGY_LOCK = threading.Lock()
+_GIF_STRATEGY_USERS = 0     # scene GIF decodes in progress
+_GIF_STRATEGY_SAVED = None  # LOADING_STRATEGY to restore when the last one ends
+
+@contextlib.contextmanager
+def _scene_gif_decoding():
+    """Decode scene GIFs with the compact LOADING_STRATEGY, restoring Pillow's setting afterwards.
+
+    The strategy keeps frames in 'P' while they share the global palette
+    instead of expanding them to RGB(A). Pillow reads it on every seek, so it
+    is set only while a scene GIF is being opened or decoded (on any thread)
+    and the process-wide value is restored once none is.
+    """
+    global _GIF_STRATEGY_USERS, _GIF_STRATEGY_SAVED
+    if FRAME_STORAGE_MODE != 'compact' or not hasattr(GifImagePlugin, 'LoadingStrategy'):
+        yield
+        return
+    with _GIF_STRATEGY_LOCK:
+        if _GIF_STRATEGY_USERS == 0:
+            _GIF_STRATEGY_SAVED = GifImagePlugin.LOADING_STRATEGY
+            GifImagePlugin.LOADING_STRATEGY = GifImagePlugin.LoadingStrategy.RGB_AFTER_DIFFERENT_PALETTE_ONLY
+        _GIF_STRATEGY_USERS += 1
+    try:
+        yield
+    finally:
+        with _GIF_STRATEGY_LOCK:
+            _GIF_STRATEGY_USERS -= 1
+            if _GIF_STRATEGY_USERS == 0:
+                GifImagePlugin.LOADING_STRATEGY = _GIF_STRATEGY_SAVED
+
+def _compact_frame(frame: Image.Image, copy: bool = True) -> Image.Image:
+    """Copy a decoded GIF frame into its storage mode (see FRAME_STORAGE_MODE).
+
+    With copy=False a frame already in its storage mode is returned as-is, for
+    callers that resample it into a new image anyway.
+    """
+    if FRAME_STORAGE_MODE != 'compact':
+        return frame.convert('RGBA')
+    if frame.mode == 'P':
+        transparency = frame.info.get('transparency')
+        if isinstance(transparency, int) and frame.histogram()[transparency]:
+            return frame.convert('RGBA')
+        if not copy:
+            return frame
+        img = frame.copy()
+        img.info.pop('transparency', None)  # transparent index unused: frame is opaque
+        return img
+    if frame.mode in ('RGBA', 'LA', 'PA'):
+        rgba = frame.convert('RGBA')
+        if rgba.getextrema()[3][0] < 255:
+            return rgba
+    if frame.mode == 'RGB' and not copy:
+        return frame
+    return frame.convert('RGB')
+
+def _frame_diff_box(prev: Image.Image, cur: Image.Image):
+    """Bounding box of pixels that differ between two same-size frames (None if identical)."""
+    box = ImageChops.difference(_as_mode(prev, 'RGB'), _as_mode(cur, 'RGB')).getbbox()
+    return tuple(box) if box else None
+
+_DIRTY_UNKNOWN = object()  # dirty box not computed yet
+
+def _as_mode(img: Image.Image, mode: str) -> Image.Image:
+    """img in the given mode, converting (and so copying) only if needed."""
+    return img if img.mode == mode else img.convert(mode)
+
+def _fit_geometry(src_size, size, mode=None):
+    """Map a src_size frame onto `size` with RESIZE_MODE (or `mode`).
+
+    Returns (box, content_size, offset): the source-pixel box to sample, the
+    size it lands at and its top-left inside `size` (non-zero only for letterbox).
+    """
+    mode = mode or RESIZE_MODE
+    target_w, target_h = size
+    fw, fh = src_size
+    if mode == 'stretch':
+        return (0, 0, fw, fh), (target_w, target_h), (0, 0)
+    if mode == 'letterbox':
+        # scale to fit inside (no crop) then pad
+        scale_ratio = min(target_w / fw, target_h / fh)
+        new_w = max(1, int(fw * scale_ratio))
+        new_h = max(1, int(fh * scale_ratio))
+        return (0, 0, fw, fh), (new_w, new_h), ((target_w - new_w)//2, (target_h - new_h)//2)
+    # fill (cover): scale to cover entire target then center crop, expressed in source pixels
+    scale_ratio = max(target_w / fw, target_h / fh)
+    new_w = max(1, int(fw * scale_ratio))
+    new_h = max(1, int(fh * scale_ratio))
+    left = (new_w - target_w)//2
+    top = (new_h - target_h)//2
+    box = (left / scale_ratio, top / scale_ratio, (left + target_w) / scale_ratio, (top + target_h) / scale_ratio)
+    return box, (target_w, target_h), (0, 0)
+
+def _fit_frame(frame_img: Image.Image, size, scale: int = 1, mode=None) -> Image.Image:
+    """Return a frame exactly `size` (width, height) times `scale` using RESIZE_MODE.
+
+    Fit, crop and integer upscale happen in one resample straight from the
+    source pixels; letterbox adds only the padded canvas.
+    """
+    out_size = (size[0]*scale, size[1]*scale)
+    if frame_img.size == out_size:
+        return frame_img
+    box, (content_w, content_h), (ox, oy) = _fit_geometry(frame_img.size, size, mode)
+    content = frame_img.resize((content_w*scale, content_h*scale), Image.NEAREST, box=box)
+    if (content_w, content_h) == tuple(size):
+        return content
+    if content.mode == 'P':
+        palette = content.getpalette()
+        pad = _palette_index(frame_img, palette, (0, 0, 0))
+        if pad is not None:
+            # pad in 'P' so a letterboxed palette frame is never expanded at display size
+            canvas = Image.new('P', out_size, pad)
+            canvas.putpalette(palette)
+            canvas.info.update(content.info)
+            canvas.paste(content, (ox*scale, oy*scale))
+            return canvas
+    canvas = Image.new('RGBA' if frame_img.mode == 'RGBA' else 'RGB', out_size, (0,0,0))
+    canvas.paste(content, (ox*scale, oy*scale))
+    return canvas
+
+def _palette_index(img: Image.Image, palette, color):
+    """Palette index that renders as `color` without changing img's pixels.
+
+    Reuses an existing entry, else appends one or repaints an index img never
+    uses, updating the flat `palette` list in place. None if all 256 are in use.
+    The transparent index is never chosen.
+    """
+    if palette is None:
+        return None
+    transparency = img.info.get('transparency')
+    for i in range(0, len(palette) - 2, 3):
+        if tuple(palette[i:i+3]) == color and i // 3 != transparency:
+            return i // 3
+    if len(palette) < 768:
+        palette.extend(color)
+        return len(palette) // 3 - 1
+    for i, count in enumerate(img.histogram()[:256]):
+        if not count and i != transparency:
+            palette[i*3:i*3+3] = color
+            return i
+    return None
+
+def _read_gif_timeline(path: str):
+    """Return ((width, height), [duration_ms, ...]) by walking GIF blocks without decoding pixels."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:6] not in (b'GIF87a', b'GIF89a'):
+        raise ValueError('not a GIF file')
+    width, height, packed = struct.unpack('<HHB', data[6:11])
+    pos = 13
+    if packed & 0x80:  # global colour table
+        pos += 3 * (2 << (packed & 0x07))
+    durations = []
+    delay = None
+
+    def skip_sub_blocks(p):
+        while True:
+            n = data[p]
+            p += 1
+            if n == 0:
+                return p
+            p += n
+
+    while pos < len(data):
+        block = data[pos]
+        if block == 0x21:  # extension; 0xF9 = graphic control (frame delay)
+            if data[pos+1] == 0xF9 and data[pos+2] >= 4:
+                delay = struct.unpack('<H', data[pos+4:pos+6])[0] * 10
+            pos = skip_sub_blocks(pos + 2)
+        elif block == 0x2C:  # image descriptor
+            packed = data[pos+9]
+            pos += 10
+            if packed & 0x80:  # local colour table
+                pos += 3 * (2 << (packed & 0x07))
+            pos = skip_sub_blocks(pos + 1)  # skip LZW code size byte, then image data
+            durations.append(delay if delay is not None else 100)  # default 100ms
+        else:  # trailer (0x3B) or trailing garbage
+            break
+    return (width, height), durations
+
 class AnimatedGif:
-    def __init__(self, path: str):
+    """GIF frames plus timeline.
+
+    Eager mode decodes every frame at load. Streaming mode only reads the
+    frame timeline at load and decodes frames on demand from ImageSequence,
+    keeping at most `window` decoded frames (LRU) and prefetching the next
+    `prefetch` frames ahead of playback on a worker thread. Decoded frames
+    are charged to the shared FrameMemoryPool, which evicts the least
+    recently used scene frames once GIF_FRAME_BUDGET_MB is spent; a GIF that
+    fits is decoded once rather than on every loop.
+
+    With a target `size`, frames come out already fitted to it (RESIZE_MODE)
+    and are kept in the on-disk frame cache. Later loads memory-map that
+    file: 'P' frames are zero-copy Image.frombuffer views, so their pages are
+    shared between app instances and reclaimable by the OS; RGB(A) frames
+    are stored zlib-compressed and decompressed on demand.
+    """
+
+    def __init__(self, path: str, stream: bool = None, window: int = None, prefetch: int = None,
+                 load: bool = True, size=None):
         self.path = path
-        self.frames = []  # list of (PIL.Image, duration_ms)
+        self.size = tuple(size) if size else None  # (w, h) frames are fitted to, None = source size
+        self.stream = GIF_STREAMING if stream is None else stream
+        self._window = GIF_FRAME_WINDOW if window is None else window  # None = sized from the frame count in _load
+        self.window = None       # streaming mode: max decoded frames kept
+        self.prefetch = (GIF_PREFETCH_FRAMES if prefetch is None else prefetch) if self.stream else 0
+        self.durations = []  # duration_ms per frame
         self.width = 0
         self.height = 0
         self.total_duration = 0
         self.valid = False
-        self._load()
+        self.current_index = -1  # index returned by the last get_frame_index call
+        self._frame_ends = []    # cumulative end time (ms) of each frame, for bisect lookup
+        self._cur_start = 0      # [start, end) window of current_index in loop time
+        self._cur_end = 0
+        self._frames = []        # eager mode: decoded PIL.Image per frame
+        self._dirty = []         # per frame: box changed since the previous frame (frame 0: since the last)
+        self._decoded = OrderedDict()  # streaming mode: frame index -> PIL.Image (LRU order)
+        self._source = None      # streaming mode: open PIL GIF used for on-demand decoding
+        self._cache_entries = None  # frame cache hit: [mode, offset, length, palette_len] per frame
+        self._atlas = None          # frame cache hit: memoryview over the mmapped .frames file
+        self._cache_declined = False  # frame cache holds a "too large" marker for this GIF: don't rebuild
+        self._lock = threading.Lock()  # guards _source/_decoded/_prefetch_pending against the prefetch worker
+        self._prefetch_pending = False
+        if load:  # load=False gives an empty (invalid) placeholder until the real GIF arrives
+            self._load()
+            self._build_timeline()
+
+    @property
+    def frame_count(self):
+        return len(self.durations)
 
     def _load(self):
         if not os.path.isfile(self.path):
             return
         try:
-            im = Image.open(self.path)
-            self.width, self.height = im.size
-            for frame in ImageSequence.Iterator(im):
-                duration = frame.info.get('duration', 100)  # default 100ms
-                self.frames.append((frame.convert('RGBA'), duration))
-                self.total_duration += duration
-            if not self.frames:
-                # fallback single frame
-                self.frames.append((im.convert('RGBA'), 100))
-                self.total_duration = 100
+            cache_key = _frame_cache_key(self.path, self.size) if self.size and FRAME_CACHE_ENABLED else None
+            if cache_key and self._load_frame_cache(cache_key):
+                cache_key = None  # already cached
+            if self._cache_declined:
+                cache_key = None
+            elif self.stream:
+                (self.width, self.height), self.durations = _read_gif_timeline(self.path)
+                with _scene_gif_decoding():
+                    self._source = Image.open(self.path)
+                if not self.durations:
+                    self.durations = [100]
+            else:
+                with _scene_gif_decoding():
+                    im = Image.open(self.path)
+                    self.width, self.height = im.size
+                    for frame in ImageSequence.Iterator(im):
+                        self._frames.append(self._prepare(frame))
+                        self.durations.append(frame.info.get('duration', 100))  # default 100ms
+                    if not self._frames:
+                        # fallback single frame
+                        self._frames.append(self._prepare(im))
+                        self.durations = [100]
+            self.total_duration = sum(self.durations)
+            if self.stream:
+                self.window = self._window_size()
+            if len(self._dirty) != len(self.durations):
+                self._dirty = [_DIRTY_UNKNOWN] * len(self.durations)  # computed lazily by dirty_box
             self.valid = True
+            if cache_key:
+                frames = None if self.stream else list(self._frames)
+                _frame_cache_writer().submit(self._write_frame_cache, cache_key, frames)
         except Exception as e:
             print(f"[ERR] Failed to load GIF {self.path}: {e}")
 
-    def get_frame(self, elapsed_ms: int):
-        if not self.frames:
-            return None
-        if LOOP:
-            elapsed_ms = elapsed_ms % self.total_duration
+    def _window_size(self):
+        """Decoded frames to keep: the explicit window, else every frame (the memory pool bounds them)."""
+        if self._window is not None:
+            return max(1, self._window)
+        return max(1, self.frame_count)
+
+    def _prepare(self, frame):
+        """Decoded source frame -> stored frame (compact mode, fitted to self.size)."""
+        if not self.size or frame.size == self.size:
+            return _compact_frame(frame)
+        img = _fit_frame(_compact_frame(frame, copy=False), self.size)
+        if img.mode == 'P':
+            img.info.pop('transparency', None)  # _compact_frame kept 'P' only if the index is unused
+        return img
+
+    # -------- On-disk frame cache --------
+    def _cache_paths(self, key: str):
+        stem = os.path.join(FRAME_CACHE_DIR, f"{os.path.basename(self.path)}-{key[:16]}")
+        return stem + '.frames', stem + '.json'
+
+    def _load_frame_cache(self, key: str) -> bool:
+        """Map a valid cache entry; frames then become views into the mapping."""
+        data_path, meta_path = self._cache_paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('key') == key and 'too_large' in meta:
+                # marker from an earlier launch; only binding while the limit has not been raised since
+                self._cache_declined = self._frame_cache_limit() <= meta['too_large']
+                if self._cache_declined:
+                    os.utime(meta_path)  # keep the marker as recently used as a real entry
+                return False
+            if (meta.get('key') != key or not meta['frames']
+                    or not len(meta['frames']) == len(meta['durations']) == len(meta['dirty'])):
+                return False
+            with open(data_path, 'rb') as f:
+                atlas = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, KeyError):
+            return False
+        self.width, self.height = meta['source_size']
+        self.durations = meta['durations']
+        self._cache_entries = meta['frames']
+        self._dirty = [tuple(box) if box else None for box in meta['dirty']]
+        self._atlas = memoryview(atlas)
+        try:
+            os.utime(meta_path)  # mark the entry recently used for _trim_frame_cache
+        except OSError:
+            pass
+        if self.stream:
+            if all(entry[0] == 'P' for entry in self._cache_entries):
+                self.prefetch = 0  # views are free to create; the OS pages data in on demand
+        else:
+            self._frames = [self._read_cached_frame(i) for i in range(len(self._cache_entries))]
+        return True
+
+    def _read_cached_frame(self, idx: int):
+        """Frame from the atlas: a read-only view for 'P' frames, decompressed for RGB(A)."""
+        mode, offset, length, palette_len = self._cache_entries[idx]
+        end = offset + length
+        if mode != 'P':
+            return Image.frombytes(mode, self.size, zlib.decompress(self._atlas[offset:end]))
+        img = Image.frombuffer(mode, self.size, self._atlas[offset:end], 'raw', mode, 0, 1)
+        img.putpalette(bytes(self._atlas[end:end + palette_len]))
+        return img
+
+    def _write_frame_cache(self, key: str, frames=None):
+        """Write fitted frames and their dirty boxes to FRAME_CACHE_DIR (worker thread).
+
+        frames=None re-decodes the GIF. The entry is dropped once it grows past
+        FRAME_CACHE_MAX_RATIO times the GIF file or the whole FRAME_CACHE_MAX_MB;
+        a "too large" marker then takes its place so later launches skip the rebuild.
+        """
+        data_path, meta_path = self._cache_paths(key)
+        decoder = None
+        try:
+            os.makedirs(FRAME_CACHE_DIR, exist_ok=True)
+            if frames is None:
+                frames = decoder = self._decode_frames()
+            limit = self._frame_cache_limit()
+            entries = []
+            dirty = []
+            first = prev = None
+            with open(data_path + '.tmp', 'wb') as f:
+                for img in frames:
+                    entries.append(self._write_cached_frame(f, img))
+                    if f.tell() > limit:
+                        break
+                    dirty.append(None if prev is None else _frame_diff_box(prev, img))
+                    if first is None:
+                        first = img
+                    prev = img
+                too_big = f.tell() > limit
+            if too_big:
+                os.remove(data_path + '.tmp')
+                print(f"[INFO] Not caching frames of {os.path.basename(self.path)}: over {limit / (1 << 20):.0f} MB on disk")
+                meta = {'key': key, 'too_large': limit}
+            else:
+                if len(entries) != len(self.durations):
+                    raise ValueError(f"decoded {len(entries)} frames, timeline has {len(self.durations)}")
+                dirty[0] = _frame_diff_box(prev, first)  # loop wrap: last frame -> first frame
+                meta = {'key': key, 'source_size': [self.width, self.height],
+                        'durations': self.durations, 'frames': entries, 'dirty': dirty}
+            with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            if not too_big:
+                os.replace(data_path + '.tmp', data_path)
+            os.replace(meta_path + '.tmp', meta_path)  # meta last: it marks the entry valid
+            # Drop entries for older versions of this GIF
+            prefix = os.path.basename(self.path) + '-'
+            keep = {os.path.basename(data_path), os.path.basename(meta_path)}
+            for name in os.listdir(FRAME_CACHE_DIR):
+                if name.startswith(prefix) and name not in keep:
+                    os.remove(os.path.join(FRAME_CACHE_DIR, name))
+            _trim_frame_cache(keep=os.path.splitext(os.path.basename(data_path))[0])
+        except Exception as e:
+            print(f"[WARN] Could not write frame cache for {self.path}: {e}")
+        finally:
+            if decoder is not None:
+                decoder.close()
+
+    def _frame_cache_limit(self):
+        """Most bytes this GIF's cache entry may take on disk."""
+        return min(FRAME_CACHE_MAX_RATIO * os.path.getsize(self.path), FRAME_CACHE_MAX_MB << 20)
+
+    def _decode_frames(self):
+        """Yield every frame of the GIF, prepared, from a private source (frame cache writer)."""
+        with _scene_gif_decoding():
+            source = Image.open(self.path)
+        try:
+            idx = 0
+            while True:
+                with _scene_gif_decoding():
+                    try:
+                        source.seek(idx)
+                    except EOFError:
+                        return
+                    img = self._prepare(source)
+                yield img
+                idx += 1
+        finally:
+            source.close()
+
+    @staticmethod
+    def _write_cached_frame(f, img):
+        """Append one frame: 'P' pixels raw plus palette, other modes zlib-compressed."""
+        offset = f.tell()
+        if img.mode == 'P':
+            data = img.tobytes()
+            palette = bytes(img.getpalette())
+        else:
+            data = zlib.compress(img.tobytes(), FRAME_CACHE_ZLIB_LEVEL)
+            palette = b''
+        f.write(data)
+        f.write(palette)
+        return [img.mode, offset, len(data), len(palette)]
+
+    def _build_timeline(self):
+        """Precompute cumulative frame end times so lookups can bisect."""
+        self._frame_ends = []
         acc = 0
-        for img, dur in self.frames:
+        for dur in self.durations:
             acc += dur
-            if elapsed_ms < acc:
-                return img
-        return self.frames[-1][0]
+            self._frame_ends.append(acc)
+        self.current_index = -1
+        self._cur_start = self._cur_end = 0
+
+    def get_frame_index(self, elapsed_ms: int):
+        """Return the index of the frame shown at elapsed_ms (None if no frames).
+
+        O(1) when the frame is unchanged since the previous call, O(log n) otherwise.
+        """
+        if not self.durations:
+            return None
+        if LOOP and self.total_duration > 0:
+            elapsed_ms = elapsed_ms % self.total_duration
+        if self._cur_start <= elapsed_ms < self._cur_end:
+            return self.current_index
+        last = len(self.durations) - 1
+        idx = min(bisect.bisect_right(self._frame_ends, elapsed_ms), last)
+        self.current_index = idx
+        self._cur_start = self._frame_ends[idx-1] if idx > 0 else 0
+        # Past the end of a non-looping GIF the last frame holds forever
+        self._cur_end = float('inf') if idx == last and not LOOP else self._frame_ends[idx]
+        return idx
+
+    def frame_at(self, idx: int):
+        """Decoded frame by index in FRAME_STORAGE_MODE (decoding on demand in streaming mode)."""
+        if not self.stream:
+            return self._frames[idx]
+        reserved = 0 if idx in self._decoded else self._reserve_frame()
+        with self._lock:
+            img = self._decode_locked(idx, reserved)
+        self._schedule_prefetch(idx)
+        return img
+
+    def _reserve_frame(self):
+        """Reserve pool room for one decoded frame (4 bytes/px covers every storage mode)."""
+        w, h = self.size or (self.width, self.height)
+        return _frame_memory().reserve(w * h * 4)
+
+    def _decode_locked(self, idx: int, reserved: int = 0):
+        img = self._decoded.get(idx)
+        if img is not None:
+            self._decoded.move_to_end(idx)
+            _frame_memory().touch(self, idx)
+            _frame_memory().unreserve(reserved)
+            return img
+        try:
+            if self._atlas is not None:
+                img = self._read_cached_frame(idx)
+            else:
+                with _scene_gif_decoding():
+                    self._source.seek(idx)
+                    img = self._prepare(self._source)
+        except Exception as e:
+            print(f"[WARN] Failed to decode frame {idx} of {self.path}: {e}")
+            img = Image.new('RGB', self.size or (self.width, self.height), (0, 0, 0))
+        self._decoded[idx] = img
+        _frame_memory().charge(self, idx, img, reserved)
+        while len(self._decoded) > self.window:
+            _frame_memory().release(self, self._decoded.popitem(last=False)[0])
+        return img
+
+    def evict_frame(self, idx, img):
+        """Drop decoded frame idx if it is still `img` (called by the memory pool)."""
+        with self._lock:
+            if self._decoded.get(idx) is img:
+                del self._decoded[idx]
+
+    def _schedule_prefetch(self, idx: int):
+        if self.prefetch <= 0:
+            return
+        count = self.frame_count
+        ahead = [(idx + k) % count for k in range(1, min(self.prefetch, count - 1) + 1)]
+        with self._lock:
+            if self._prefetch_pending or all(i in self._decoded for i in ahead):
+                return
+            self._prefetch_pending = True
+        _frame_worker().submit(self._prefetch_frames, ahead)
+
+    def _prefetch_frames(self, indices):
+        try:
+            for i in indices:
+                if i in self._decoded:
+                    continue
+                reserved = self._reserve_frame()
+                with self._lock:
+                    self._decode_locked(i, reserved)
+        finally:
+            with self._lock:
+                self._prefetch_pending = False
+
+    def dirty_box(self, idx: int):
+        """Box (x1, y1, x2, y2) that changes from the previous frame into idx, None if nothing does."""
+        box = self._dirty[idx]
+        if box is _DIRTY_UNKNOWN:
+            box = _frame_diff_box(self.frame_at((idx - 1) % self.frame_count), self.frame_at(idx))
+            self._dirty[idx] = box
+        return box
+
+    def ms_until_next_frame(self, elapsed_ms: int):
+        """Milliseconds from elapsed_ms until the shown frame changes (inf if it never does)."""
+        if self.get_frame_index(elapsed_ms) is None or self._cur_end == float('inf'):
+            return float('inf')
+        if LOOP and self.total_duration > 0:
+            elapsed_ms = elapsed_ms % self.total_duration
+        return self._cur_end - elapsed_ms
+
+    def get_frame(self, elapsed_ms: int):
+        idx = self.get_frame_index(elapsed_ms)
+        if idx is None:
+            return None
+        return self.frame_at(idx)
+
+class FrameMemoryPool:
+    """Byte budget shared by every streaming GIF and scene frame cache.
+
+    Before making a frame, an owner reserves room for it (evicting the least
+    recently used frames across all owners, so the scene on screen takes
+    memory from idle ones); it then charges the frame under (owner, key)
+    against that reservation and touches it on every hit. Owners call
+    reserve()/trim() without their own lock held: the pool calls back into
+    owner.evict_frame(), which takes that lock.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget = budget_bytes
+        self.used = 0  # charged frames plus open reservations
+        self._frames = OrderedDict()  # (owner, key) -> (frame, bytes), least recently used first
+        self._lock = threading.Lock()
+
+    def reserve(self, size: int) -> int:
+        """Make room for a frame of at most `size` bytes; hand the result to charge() or unreserve()."""
+        self.trim(size)
+        return size
+
+    def unreserve(self, size: int):
+        with self._lock:
+            self.used -= size
+
+    def charge(self, owner, key, frame, reserved: int = 0):
+        size = frame.width * frame.height * len(frame.getbands())
+        with self._lock:
+            old = self._frames.pop((owner, key), None)
+            if old is not None:
+                self.used -= old[1]
+            self._frames[(owner, key)] = (frame, size)
+            self.used += size - reserved
+
+    def touch(self, owner, key):
+        with self._lock:
+            if (owner, key) in self._frames:
+                self._frames.move_to_end((owner, key))
+
+    def release(self, owner, key):
+        """The owner dropped this frame itself."""
+        with self._lock:
+            entry = self._frames.pop((owner, key), None)
+            if entry is not None:
+                self.used -= entry[1]
+
+    def release_owner(self, owner):
+        with self._lock:
+            for owner_key in [k for k in self._frames if k[0] is owner]:
+                self.used -= self._frames.pop(owner_key)[1]
+
+    def trim(self, reserve: int = 0):
+        """Evict until the pool fits its budget, with `reserve` more bytes set aside."""
+        victims = []
+        freeing = 0
+        with self._lock:
+            while self.used - freeing + reserve > self.budget and self._frames:
+                (owner, key), (frame, size) = self._frames.popitem(last=False)
+                freeing += size
+                victims.append((owner, key, frame))
+            self.used += reserve
+        for owner, key, frame in victims:
+            owner.evict_frame(key, frame)
+        victims = frame = None  # victims stay counted until nothing here holds them either
+        with self._lock:
+            self.used -= freeing
+
+_FRAME_MEMORY = None
+_FRAME_WORKER = None
+_FRAME_CACHE_WRITER = None
+_CROSSFADE_WORKER = None
+_FRAME_CACHE_VERSION = 5  # bump when the cache file layout changes
+
+def _frame_memory():
+    """The FrameMemoryPool for scene frames, created with GIF_FRAME_BUDGET_MB on first use."""
+    global _FRAME_MEMORY
+    if _FRAME_MEMORY is None:
+        _FRAME_MEMORY = FrameMemoryPool(GIF_FRAME_BUDGET_MB << 20)
+    return _FRAME_MEMORY
+
+def _frame_worker():
+    """Shared single-thread executor for background frame decoding."""
+    global _FRAME_WORKER
+    if _FRAME_WORKER is None:
+        _FRAME_WORKER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gif-frames')
+    return _FRAME_WORKER
+
+def _frame_cache_writer():
+    """Single-thread executor that fills the on-disk frame cache without delaying playback prefetch."""
+    global _FRAME_CACHE_WRITER
+    if _FRAME_CACHE_WRITER is None:
+        _FRAME_CACHE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='frame-cache')
+    return _FRAME_CACHE_WRITER
+
+def _crossfade_worker():
+    """Single-thread executor for crossfade blends, so a fade's prefetch never queues behind GIF decoding."""
+    global _CROSSFADE_WORKER
+    if _CROSSFADE_WORKER is None:
+        _CROSSFADE_WORKER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='crossfade')
+    return _CROSSFADE_WORKER
+
+def _trim_frame_cache(keep=None):
+    """Evict least recently used GIF entries until FRAME_CACHE_DIR fits FRAME_CACHE_MAX_MB.
+
+    An entry's last use is its .json mtime (touched on every cache hit); a
+    .frames file without its .json counts as unused. `keep` names an entry
+    stem that is never evicted.
+    """
+    entries = {}  # stem -> [last use, bytes]
+    for name in os.listdir(FRAME_CACHE_DIR):
+        stem, ext = os.path.splitext(name)
+        if ext not in ('.frames', '.json'):
+            continue
+        try:
+            st = os.stat(os.path.join(FRAME_CACHE_DIR, name))
+        except OSError:
+            continue
+        entry = entries.setdefault(stem, [0.0, 0])
+        entry[1] += st.st_size
+        if ext == '.json':
+            entry[0] = st.st_mtime
+    total = sum(size for _, size in entries.values())
+    for stem, (_, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+        if total <= FRAME_CACHE_MAX_MB << 20:
+            break
+        if stem == keep:
+            continue
+        for ext in ('.json', '.frames'):  # meta first: it marks the entry valid
+            try:
+                os.remove(os.path.join(FRAME_CACHE_DIR, stem + ext))
+            except OSError:
+                pass
+        total -= size
+
+def _frame_cache_key(path: str, size) -> str:
+    """Cache key: GIF content hash plus every setting that changes the stored frames."""
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    h.update(json.dumps([_FRAME_CACHE_VERSION, list(size), RESIZE_MODE, FRAME_STORAGE_MODE]).encode())
+    return h.hexdigest()
+
+class SceneFrameCache:
+    """Display-ready frames for one AnimatedGif at a fixed logical size and scale.
+
+    Each source frame is standardized (RESIZE_MODE fit) and upscaled at most
+    once, in a single resample from the source pixels (see _fit_frame); draw()
+    then only looks frames up by index instead of resizing every tick.
+    A frame that needs no fitting or scaling is the source image itself and
+    is not stored again. For streaming GIFs the caches are bounded to the
+    GIF's decode window and charged to the shared FrameMemoryPool.
+    """
+
+    def __init__(self, gif: AnimatedGif, scale_map, profiler=None):
+        self.gif = gif
+        self.width, self.height = scale_map.logical_size
+        self.scale_map = scale_map
+        self.profiler = profiler if profiler is not None else FrameProfiler(1)
+        self.capacity = gif.window  # None = unbounded (eager GIFs)
+        self._stores = {'logical': OrderedDict(),  # frame index -> standardized PIL.Image
+                        'display': OrderedDict()}  # frame index -> standardized + scaled PIL.Image
+        self._lock = threading.Lock()  # the memory pool may evict from another thread
+
+    @property
+    def valid(self):
+        return self.gif.valid
+
+    def index(self, elapsed_ms: int):
+        """Frame index for elapsed_ms; unchanged index means the cached frame can be reused."""
+        return self.gif.get_frame_index(elapsed_ms)
+
+    def _lookup(self, name, idx):
+        with self._lock:
+            frame = self._stores[name].get(idx)
+            if frame is not None and self.capacity is not None:
+                self._stores[name].move_to_end(idx)
+                _frame_memory().touch(self, (name, idx))
+        return frame
+
+    def _reserve(self, name):
+        """Reserve pool room for one frame of store `name` before it is made (4 bytes/px at most)."""
+        if self.capacity is None:
+            return 0
+        w, h = self.scale_map.display_size if name == 'display' else (self.width, self.height)
+        return _frame_memory().reserve(w * h * 4)
+
+    def _remember(self, name, idx, frame, source, reserved):
+        if frame is source:
+            _frame_memory().unreserve(reserved)
+            return  # the source store already holds (and accounts for) it
+        store = self._stores[name]
+        with self._lock:
+            store[idx] = frame
+            if self.capacity is None:
+                return
+            _frame_memory().charge(self, (name, idx), frame, reserved)
+            while len(store) > self.capacity:
+                _frame_memory().release(self, (name, store.popitem(last=False)[0]))
+
+    def evict_frame(self, key, frame):
+        """Drop a cached frame if it is still `frame` (called by the memory pool)."""
+        name, idx = key
+        with self._lock:
+            if self._stores[name].get(idx) is frame:
+                del self._stores[name][idx]
+
+    def release(self):
+        """Give this cache's frames back to the memory pool (the cache is being replaced)."""
+        with self._lock:
+            for store in self._stores.values():
+                store.clear()
+        _frame_memory().release_owner(self)
+
+    def logical_at(self, idx: int):
+        frame = self._lookup('logical', idx)
+        if frame is None:
+            source = self.gif.frame_at(idx)
+            reserved = self._reserve('logical')
+            with self.profiler.phase('standardize'):
+                frame = _fit_frame(source, (self.width, self.height))
+            self._remember('logical', idx, frame, source, reserved)
+        return frame
+
+    def display_at(self, idx: int):
+        frame = self._lookup('display', idx)
+        if frame is None:
+            reserved = 0
+            if self.scale_map.integer_scale == 1:
+                source = frame = self.logical_at(idx)
+            elif self.scale_map.integer_scale:
+                source = self.gif.frame_at(idx)
+                reserved = self._reserve('display')
+                with self.profiler.phase('standardize'):
+                    frame = _fit_frame(source, (self.width, self.height), self.scale_map.integer_scale)
+            else:
+                source = self.logical_at(idx)
+                reserved = self._reserve('display')
+                with self.profiler.phase('standardize'):
+                    frame = self.scale_map.apply(source)
+            self._remember('display', idx, frame, source, reserved)
+        return frame
+
+    def logical(self, elapsed_ms: int):
+        """Standardized frame for elapsed_ms, used as input to crossfades/tears."""
+        idx = self.gif.get_frame_index(elapsed_ms)
+        return None if idx is None else self.logical_at(idx)
+
+    def display(self, elapsed_ms: int):
+        """Standardized and scaled frame for elapsed_ms, ready for PhotoImage."""
+        idx = self.gif.get_frame_index(elapsed_ms)
+        return None if idx is None else self.display_at(idx)
+
+class ScaleMap:
+    """Nearest-neighbour pixel mapping between a logical frame and a display of any size.
+
+    cols[x] / rows[y] are the logical column / row shown at display x / y: the
+    gather Image.resize(NEAREST) performs, read back from Pillow once per size
+    pair so hit-testing always agrees with the pixels on screen.
+    col_starts / row_starts invert them (first display pixel of each logical one).
+    """
+
+    def __init__(self, logical_size, display_size):
+        self.logical_size = tuple(logical_size)
+        self.display_size = tuple(display_size)
+        (lw, lh), (dw, dh) = self.logical_size, self.display_size
+        self.cols = self._index_map(lw, dw)
+        self.rows = self._index_map(lh, dh)
+        self.col_starts = [bisect.bisect_left(self.cols, x) for x in range(lw + 1)]
+        self.row_starts = [bisect.bisect_left(self.rows, y) for y in range(lh + 1)]
+        k = dw // lw
+        self.integer_scale = k if k >= 1 and (lw*k, lh*k) == self.display_size else None
+
+    @staticmethod
+    def _index_map(src: int, dst: int):
+        ramp = Image.new('I', (src, 1))
+        ramp.putdata(range(src))
+        return list(ramp.resize((dst, 1), Image.NEAREST).getdata())
+
+    def apply(self, img: Image.Image) -> Image.Image:
+        """Gather a logical-size image into display pixels."""
+        return img if img.size == self.display_size else img.resize(self.display_size, Image.NEAREST)
+
+    def to_logical(self, x: int, y: int):
+        """Logical pixel under display point (x, y); points off the display extrapolate."""
+        (lw, lh), (dw, dh) = self.logical_size, self.display_size
+        lx = self.cols[x] if 0 <= x < dw else math.floor(x * lw / dw)
+        ly = self.rows[y] if 0 <= y < dh else math.floor(y * lh / dh)
+        return lx, ly
+
+    def display_box(self, box):
+        """Display pixel box covering logical box (x1, y1, x2, y2)."""
+        x1, y1, x2, y2 = box
+        return self.col_starts[x1], self.row_starts[y1], self.col_starts[x2], self.row_starts[y2]
+
+_SCALE_MAPS = {}  # (logical size, display size) -> ScaleMap
+
+def _scale_map(logical_size, display_size) -> ScaleMap:
+    key = (tuple(logical_size), tuple(display_size))
+    smap = _SCALE_MAPS.get(key)
+    if smap is None:
+        smap = _SCALE_MAPS[key] = ScaleMap(*key)
+    return smap
+
+def _probe_image_size(path: str):
+    """Return (width, height) from the image header only, or None if unreadable."""
+    if not os.path.isfile(path):
+        return None
+    try:
+        with Image.open(path) as im:
+            return im.size
+    except Exception:
+        return None
+
+class AssetLoader:
+    """Runs asset loading jobs on worker threads with completion callbacks on the Tk thread.
+
+    Workers only push results onto a queue; the Tk thread drains it from a
+    root.after poll, so callbacks may freely touch Tk widgets and app state.
+    on_applied() runs after each poll that applied at least one result.
+    """
+
+    def __init__(self, root, workers: int = ASSET_LOADER_WORKERS, on_applied=None):
+        self.root = root
+        self.on_applied = on_applied
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='assets')
+        self._done = queue.SimpleQueue()
+        self._pending = set()
+        self._polling = False
+
+    def submit(self, name: str, load, on_done):
+        """Run load() on a worker, then on_done(result) on the Tk thread."""
+        self._pending.add(name)
+
+        def job():
+            try:
+                self._done.put((name, on_done, load(), None))
+            except Exception as e:
+                self._done.put((name, on_done, None, e))
+
+        self._executor.submit(job)
+        if not self._polling:
+            self._polling = True
+            self.root.after(ASSET_POLL_MS, self._poll)
+
+    def is_pending(self, name: str) -> bool:
+        return name in self._pending
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._pending)
+
+    def _poll(self):
+        applied = False
+        while True:
+            try:
+                name, on_done, result, error = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.discard(name)
+            if error is not None:
+                print(f"[WARN] Failed to load {name}: {error}")
+                continue
+            try:
+                on_done(result)
+                applied = True
+            except Exception as e:
+                print(f"[WARN] Could not apply {name}: {e}")
+        if applied and self.on_applied is not None:
+            self.on_applied()
+        if self._pending:
+            self.root.after(ASSET_POLL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+class PhotoLayers:
+    """One long-lived Tk PhotoImage per named layer, updated in place with paste().
+
+    A layer allocates a new PhotoImage only when its size (or alpha) changes.
+    Content is tagged with an optional key; putting the same key again skips
+    the upload entirely, so static overlays cost nothing after the first frame.
+    All PhotoImage allocations go through here so they can be counted (and
+    their PIL->Tk conversion timed as the profiler's 'upload' phase).
+    """
+
+    def __init__(self, profiler=None, photo_factory=None):
+        self.profiler = profiler if profiler is not None else FrameProfiler(1)
+        self.photo_factory = photo_factory or ImageTk.PhotoImage
+        self._photos = {}  # layer name -> ImageTk.PhotoImage
+        self._keys = {}    # layer name -> key of the content currently in the photo
+        self._alpha = {}   # layer name -> whether the photo was created with an alpha channel
+        self._sources = {} # layer name -> logical-resolution image the content was made from
+        self._names = {}   # ImageTk.PhotoImage -> layer name (reverse of _photos, for source_of)
+        self.allocations = 0
+        self._rate_start = time.time()
+        self._rate_base = 0
+        self._rate = 0.0
+
+    def new_photo(self, pil_img):
+        """Allocate a PhotoImage outside any layer (still counted)."""
+        self.allocations += 1
+        with self.profiler.phase('upload'):
+            return self.photo_factory(pil_img)
+
+    def get(self, name, key):
+        """Layer photo if it already shows content `key`, else None."""
+        if key is not None and self._keys.get(name) == key:
+            return self._photos.get(name)
+        return None
+
+    def put(self, name, pil_img, key=None, source=None):
+        """Show a display-ready image in layer `name` and return its PhotoImage.
+
+        `source` optionally records the logical-resolution image it was scaled from.
+        """
+        photo = self._photos.get(name)
+        if key is not None and photo is not None and self._keys.get(name) == key:
+            return photo
+        self._sources[name] = source
+        has_alpha = pil_img.mode in ('RGBA', 'LA', 'PA')
+        if photo is not None and (photo.width(), photo.height()) == pil_img.size and self._alpha[name] == has_alpha:
+            with self.profiler.phase('upload'):
+                photo.paste(pil_img)
+        else:
+            self._names.pop(self._photos.get(name), None)
+            photo = self.new_photo(pil_img)
+            self._photos[name] = photo
+            self._names[photo] = name
+            self._alpha[name] = has_alpha
+        self._keys[name] = key
+        return photo
+
+    def drop(self, name):
+        """Forget layer `name` (its PhotoImage is freed once no canvas item shows it)."""
+        self._names.pop(self._photos.get(name), None)
+        for store in (self._photos, self._keys, self._alpha, self._sources):
+            store.pop(name, None)
+
+    def source_of(self, photo):
+        """Logical-resolution image recorded for a layer PhotoImage (None if unknown)."""
+        name = self._names.get(photo)
+        if name is None or self._photos.get(name) is not photo:
+            return None
+        return self._sources.get(name)
+
+    def allocations_per_second(self):
+        """Allocation rate over the last completed ~1 s window."""
+        now = time.time()
+        if now - self._rate_start >= 1.0:
+            self._rate = (self.allocations - self._rate_base) / (now - self._rate_start)
+            self._rate_start = now
+            self._rate_base = self.allocations
+        return self._rate
+
+def _flat_coords(coords):
+    """Flatten create_*/coords() arguments ((x, y) pairs or a list) to a tuple of numbers."""
+    if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+        coords = coords[0]
+    flat = []
+    for c in coords:
+        if isinstance(c, (list, tuple)):
+            flat.extend(c)
+        else:
+            flat.append(c)
+    return tuple(flat)
+
+class RetainedCanvas:
+    """Immediate-mode create_* calls on top of retained Tk canvas items.
+
+    draw() keeps issuing the same create_* calls every frame. Between
+    begin_frame() and end_frame() each call claims the next item slot: a slot
+    of the same kind is updated in place with only the coords/options that
+    changed, and slots left over at the end are hidden rather than deleted.
+    Per-frame Tk calls then scale with what changed, not with what is visible.
+    Everything else is passed through to the wrapped tk.Canvas.
+    """
+
+    def __init__(self, canvas, retained: bool = True):
+        self.canvas = canvas
+        self.retained = retained
+        self._slots = []  # [kind, item id, flat coords, options, visible] in stacking order
+        self._next = 0    # slot claimed by the next create_* call
+        self.tk_calls = 0          # canvas calls issued since begin_frame
+        self.last_frame_calls = 0  # tk_calls of the previous complete frame
+        self.frame_items = 0       # create_* calls (visible items) since begin_frame
+
+    def __getattr__(self, name):
+        return getattr(self.canvas, name)
+
+    def begin_frame(self):
+        self._next = 0
+        self.tk_calls = 0
+        self.frame_items = 0
+        if not self.retained:
+            self.canvas.delete('all')
+            self.tk_calls += 1
+
+    def end_frame(self):
+        """Hide the slots this frame did not claim."""
+        if self.retained:
+            for slot in self._slots[self._next:]:
+                if slot[4]:
+                    self.canvas.itemconfigure(slot[1], state='hidden')
+                    slot[4] = False
+                    self.tk_calls += 1
+        self.last_frame_calls = self.tk_calls
+
+    def delete(self, *items):
+        if 'all' in items:
+            self._slots.clear()
+            self._next = 0
+        self.canvas.delete(*items)
+
+    def _item(self, kind, coords, options):
+        create = getattr(self.canvas, 'create_' + kind)
+        self.frame_items += 1
+        if not self.retained:
+            self.tk_calls += 1
+            return create(*coords, **options)
+        flat = _flat_coords(coords)
+        idx = self._next
+        self._next += 1
+        if idx == len(self._slots):
+            item = create(*flat, **options)
+            self._slots.append([kind, item, flat, dict(options), True])
+            self.tk_calls += 1
+            return item
+        slot = self._slots[idx]
+        if slot[0] != kind or set(slot[3]) - set(options):
+            # Different kind (or an option reverted to its default): replace the item at the same depth
+            item = create(*flat, **options)
+            self.canvas.tag_raise(item, slot[1])
+            self.canvas.delete(slot[1])
+            self._slots[idx] = [kind, item, flat, dict(options), True]
+            self.tk_calls += 3
+            return item
+        if slot[2] != flat:
+            self.canvas.coords(slot[1], *flat)
+            slot[2] = flat
+            self.tk_calls += 1
+        changed = {k: v for k, v in options.items() if slot[3].get(k, _NO_OPTION) != v}
+        slot[3].update(changed)
+        if not slot[4]:
+            changed['state'] = 'normal'
+            slot[4] = True
+        if changed:
+            self.canvas.itemconfigure(slot[1], **changed)
+            self.tk_calls += 1
+        return slot[1]
+
+    def create_image(self, *coords, **options):
+        return self._item('image', coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._item('line', coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._item('oval', coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._item('polygon', coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._item('rectangle', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._item('text', coords, options)
+
+_NO_OPTION = object()  # option absent from a retained slot
+
+# Font files tried for Tk font families when overlays are rasterized with PIL: (regular, bold)
+_TK_FONT_FILES = {
+    'courier new': (('cour.ttf', 'Courier New.ttf'), ('courbd.ttf', 'Courier New Bold.ttf')),
+    'arial': (('arial.ttf', 'Arial.ttf'), ('arialbd.ttf', 'Arial Bold.ttf')),
+}
+_FALLBACK_FONT_FILES = (('DejaVuSansMono.ttf',), ('DejaVuSansMono-Bold.ttf',))
+_STIPPLE_ALPHA = {'gray12': 0.125, 'gray25': 0.25, 'gray50': 0.5, 'gray75': 0.75}
+# Tk anchor -> (fraction of width, fraction of height) to step back from the anchor point
+_ANCHOR_OFFSETS = {
+    'nw': (0, 0), 'n': (0.5, 0), 'ne': (1, 0), 'w': (0, 0.5), 'center': (0.5, 0.5),
+    'e': (1, 0.5), 'sw': (0, 1), 's': (0.5, 1), 'se': (1, 1),
+}
+
+class OverlayCompositor:
+    """Canvas stand-in that rasterizes overlay drawing with ImageDraw (OVERLAY_BACKEND 'pil').
+
+    The overlay draw_* methods run against this object between begin() and
+    end(). Their create_* calls (display coordinates, Tk options) are recorded;
+    when the list matches the previous frame's the cached layer is reused,
+    otherwise it is replayed into a logical-resolution RGBA image. end()
+    returns that layer cropped to its visible pixels, plus the crop box.
+    """
+
+    def __init__(self, scale_map, image_source, pixels_per_point: float = 96 / 72, text_runs=None):
+        self.scale_map = scale_map
+        self.image_source = image_source  # callable(PhotoImage) -> logical PIL.Image (or None)
+        self.pixels_per_point = pixels_per_point
+        self.text_runs = text_runs if text_runs is not None else TextRunCache(64)  # rendered text images
+        self.version = 0  # bumped whenever the rasterized layer changes
+        self._ops = []
+        self._images = {}
+        self._last_ops = None
+        self._last_images = {}  # sources named by _last_ops, held so their ids stay unique
+        self._layer = None
+        self._fonts = {}
+        self._colors = {}
+
+    def begin(self):
+        self._ops = []
+        self._images = {}
+
+    def end(self):
+        """(layer crop, logical box) for this frame's overlays; (None, None) if nothing is visible."""
+        if self._ops != self._last_ops:
+            self._last_ops = self._ops
+            self._last_images = self._images
+            self._layer = self._rasterize()
+            self.version += 1
+        return self._layer if self._layer is not None else (None, None)
+
+    def _record(self, kind, coords, options):
+        image = options.get('image')
+        if image is not None:
+            source = self.image_source(image)
+            options = dict(options, image=id(source))
+            self._images[id(source)] = source
+        self._ops.append((kind, _flat_coords(coords), tuple(sorted(options.items()))))
+        return len(self._ops)
+
+    def create_image(self, *coords, **options):
+        return self._record('image', coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._record('line', coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._record('oval', coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._record('polygon', coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._record('rectangle', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._record('text', coords, options)
+
+    # -------- Rasterizing --------
+    def _rasterize(self):
+        if not self._ops:
+            return None
+        layer = Image.new('RGBA', self.scale_map.logical_size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer, 'RGBA')
+        for kind, coords, options in self._ops:
+            getattr(self, '_draw_' + kind)(layer, draw, self._logical(coords), dict(options))
+        box = layer.getbbox()
+        if box is None:
+            return None
+        return layer.crop(box), box
+
+    def _logical(self, coords):
+        (lw, lh), (dw, dh) = self.scale_map.logical_size, self.scale_map.display_size
+        return [c * lw / dw if i % 2 == 0 else c * lh / dh for i, c in enumerate(coords)]
+
+    def _width(self, options, default=1):
+        width = float(options.get('width', default))
+        return max(1, round(width * self.scale_map.logical_size[0] / self.scale_map.display_size[0])) if width else 0
+
+    def _color(self, value, stipple=None):
+        """Tk colour string -> RGBA tuple, None for '' (no paint)."""
+        if not value:
+            return None
+        rgba = self._colors.get((value, stipple))
+        if rgba is None:
+            try:
+                rgb = ImageColor.getrgb(value)[:3]
+            except ValueError:
+                print(f"[WARN] Overlay colour {value!r} not understood; using white")
+                rgb = (255, 255, 255)
+            rgba = self._colors[(value, stipple)] = rgb + (round(255 * _STIPPLE_ALPHA.get(stipple, 1.0)),)
+        return rgba
+
+    def _font(self, spec):
+        """PIL font approximating a Tk font tuple at logical resolution."""
+        font = self._fonts.get(spec)
+        if font is not None:
+            return font
+        family, size, bold = 'TkDefaultFont', 10, False
+        if isinstance(spec, (tuple, list)) and spec:
+            family = spec[0]
+            size = spec[1] if len(spec) > 1 else size
+            bold = any('bold' in str(style) for style in spec[2:])
+        pixels = -size if size < 0 else size * self.pixels_per_point
+        pixels = max(6, round(pixels * self.scale_map.logical_size[1] / self.scale_map.display_size[1]))
+        names = _TK_FONT_FILES.get(str(family).lower(), ((), ()))[bold] + _FALLBACK_FONT_FILES[bold]
+        for name in names:
+            try:
+                font = ImageFont.truetype(name, pixels)
+                break
+            except OSError:
+                continue
+        else:
+            font = ImageFont.load_default(size=pixels)
+        self._fonts[spec] = font
+        return font
+
+    def _box(self, coords):
+        x1, y1, x2, y2 = coords[:4]
+        return [round(min(x1, x2)), round(min(y1, y2)), round(max(x1, x2)) - 1, round(max(y1, y2)) - 1]
+
+    def _draw_rectangle(self, layer, draw, coords, options):
+        box = self._box(coords)
+        if box[2] < box[0] or box[3] < box[1]:
+            return
+        draw.rectangle(box, fill=self._color(options.get('fill'), options.get('stipple')),
+                       outline=self._color(options.get('outline', 'black')), width=self._width(options))
+
+    def _draw_oval(self, layer, draw, coords, options):
+        box = self._box(coords)
+        if box[2] < box[0] or box[3] < box[1]:
+            return
+        draw.ellipse(box, fill=self._color(options.get('fill'), options.get('stipple')),
+                     outline=self._color(options.get('outline', 'black')), width=self._width(options))
+
+    def _draw_polygon(self, layer, draw, coords, options):
+        points = [(round(coords[i]), round(coords[i + 1])) for i in range(0, len(coords) - 1, 2)]
+        draw.polygon(points, fill=self._color(options.get('fill', 'black'), options.get('stipple')),
+                     outline=self._color(options.get('outline')))
+
+    def _draw_line(self, layer, draw, coords, options):
+        points = [(round(coords[i]), round(coords[i + 1])) for i in range(0, len(coords) - 1, 2)]
+        fill = self._color(options.get('fill', 'black'))
+        if fill is not None and len(points) > 1:
+            draw.line(points, fill=fill, width=self._width(options))
+
+    def _draw_text(self, layer, draw, coords, options):
+        text = str(options.get('text', ''))
+        fill = self._color(options.get('fill', 'black'))
+        if not text or fill is None:
+            return
+        justify = options.get('justify', 'left')
+        key = ('tk', text, fill, options.get('font'), justify, self.scale_map.display_size)
+        run = self.text_runs.get(key)
+        if run is None:
+            font = self._font(options.get('font'))
+            left, top, right, bottom = draw.multiline_textbbox((0, 0), text, font=font)
+            run = Image.new('RGBA', (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+            ImageDraw.Draw(run).multiline_text((-left, -top), text, font=font, fill=fill, align=justify, spacing=2)
+            self.text_runs.put(key, run)
+        fx, fy = _ANCHOR_OFFSETS.get(options.get('anchor', 'center'), (0.5, 0.5))
+        self._paste(layer, run, round(coords[0] - fx * run.width), round(coords[1] - fy * run.height))
+
+    def _draw_image(self, layer, draw, coords, options):
+        img = self._images.get(options.get('image'))
+        if img is None:
+            return
+        img = _as_mode(img, 'RGBA')
+        fx, fy = _ANCHOR_OFFSETS.get(options.get('anchor', 'center'), (0.5, 0.5))
+        self._paste(layer, img, round(coords[0] - fx * img.width), round(coords[1] - fy * img.height))
+
+    def _paste(self, layer, img, x, y):
+        # alpha_composite needs the source clipped to the layer
+        src_box = (max(0, -x), max(0, -y), min(img.width, layer.width - x), min(img.height, layer.height - y))
+        if src_box[2] > src_box[0] and src_box[3] > src_box[1]:
+            layer.alpha_composite(img, (x + src_box[0], y + src_box[1]), src_box)
+
+class FrameMemo:
+    """Small LRU of results derived from source Images, keyed by their identity.
+
+    Scene caches hand out the same Image object while a frame is cached, so
+    identity is a cheap frame key. Entries hold weak references to their
+    sources and are dropped once a source is freed, so a recycled id() never
+    finds another frame's result.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._entries = OrderedDict()  # (ids of sources, extra) -> (weak refs to sources, value)
+        self._lock = threading.Lock()  # memos may be filled from worker threads
+        self._dead = deque()  # keys whose sources were freed, dropped on the next get/put
+
+    def _purge(self):
+        # called with the lock held; a key may have been refilled since its source died
+        while self._dead:
+            key = self._dead.popleft()
+            entry = self._entries.get(key)
+            if entry is not None and any(ref() is None for ref in entry[0]):
+                del self._entries[key]
+
+    def get(self, sources, extra=None):
+        key = (tuple(id(img) for img in sources), extra)
+        with self._lock:
+            self._purge()
+            entry = self._entries.get(key)
+            if entry is None or any(ref() is not img for ref, img in zip(entry[0], sources)):
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, sources, extra, value):
+        key = (tuple(id(img) for img in sources), extra)
+        on_free = lambda ref, key=key: self._dead.append(key)
+        with self._lock:
+            self._purge()
+            self._entries[key] = (tuple(weakref.ref(img, on_free) for img in sources), value)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+class TextRunCache:
+    """Bounded LRU of rendered text runs, shared by the blocky-font and Tk-font paths.
+
+    Keys name the run (path, text, colour, font, scale); values are what the
+    path draws with: a PhotoImage for blocky canvas text, an RGBA image for
+    text rasterized by the OverlayCompositor. Hit/miss/eviction counts are
+    kept so the capacity can be sized.
+    """
+
+    def __init__(self, capacity: int, on_evict=None):
+        self.capacity = max(1, capacity)
+        self.on_evict = on_evict  # callable(key, value) for entries pushed out
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            old_key, old_value = self._entries.popitem(last=False)
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(old_key, old_value)
+        return value
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'size': len(self._entries), 'capacity': self.capacity, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'hit_rate': round(self.hits / lookups, 4) if lookups else None}
+
+class CrossfadeEngine:
+    """Crossfade frames for SceneManager fades, cached per (from frame, to frame, step).
+
+    Blends run in RGB at logical resolution and are stored display-ready
+    (already scaled), so replaying a cached step only costs the PhotoImage
+    paste. prefetch() blends the rest of a fade between two static frames
+    on a worker thread. A fade's blends are display-size, so clear() drops
+    them (and stops a running prefetch) once the fade is over.
+    """
+
+    def __init__(self, steps: int, display_size, capacity: int = None):
+        self.steps = max(1, steps)
+        self.display_size = display_size
+        self._blends = FrameMemo(capacity or self.steps)  # (a, b), step -> blended display image
+        self._lock = threading.Lock()  # guards _prefetching/_generation against the prefetch worker
+        self._prefetching = None  # (a, b) frames of the sequence being prefetched
+        self._generation = 0      # bumped by clear(); a prefetch from an older generation stops
+
+    @property
+    def holding(self):
+        """True while blends are cached or being prefetched."""
+        return len(self._blends) > 0 or self._prefetching is not None
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._prefetching = None
+            self._blends.clear()
+
+    def _blend(self, a, b, step):
+        img = Image.blend(_as_mode(a, 'RGB'), _as_mode(b, 'RGB'), step / self.steps)
+        if img.size != self.display_size:
+            img = img.resize(self.display_size, Image.NEAREST)
+        return img
+
+    def frame(self, a, b, step: int):
+        """Display-ready blend of logical frames a -> b at fade step (0..steps)."""
+        img = self._blends.get((a, b), step)
+        if img is None:
+            img = self._blends.put((a, b), step, self._blend(a, b, step))
+        return img
+
+    def prefetch(self, a, b, first_step: int):
+        """Blend steps first_step..steps-1 of a fade between two static frames in the background."""
+        with self._lock:
+            if self._prefetching is not None and self._prefetching[0] is a and self._prefetching[1] is b:
+                return
+            self._prefetching = (a, b)
+            generation = self._generation
+        _crossfade_worker().submit(self._prefetch, a, b, first_step, generation)
+
+    def _prefetch(self, a, b, first_step, generation):
+        try:
+            for step in range(first_step, self.steps):
+                if self._generation != generation:
+                    return
+                if self._blends.get((a, b), step) is None:
+                    img = self._blend(a, b, step)
+                    with self._lock:
+                        if self._generation != generation:
+                            return
+                        self._blends.put((a, b), step, img)
+        finally:
+            with self._lock:
+                if self._generation == generation:
+                    self._prefetching = None
+
+class TornTransition:
+    """Paper-tear reveal between two logical frames (inside -> focused).
+
+    The tear edge is a jagged polyline that slides right as the tear
+    progresses. start() draws the reveal mask once, into a mask twice the
+    frame width; each step then crops it at the step's offset and pastes the
+    revealed strip right of `pull` only, over an RGB copy of the base frame
+    (RGB conversions are memoized per source frame). The edge highlight is a
+    blended line. update() simulates paper debris shed from the edge; the app
+    draws it.
+    """
+
+    EDGE_COLOR = (255, 255, 255)
+    EDGE_ALPHA = 180
+    DEBRIS_GRAVITY = 0.15  # logical px per tick^2 at 60 ticks/s
+
+    def __init__(self, size, steps: int):
+        self.width, self.height = size
+        self.steps = max(1, steps)
+        self.points = []   # jagged edge (x, y) across the width at progress 0
+        self.debris = []   # particles: x, y, vx, vy (px per 1/60 s), life/age (s), spawn (progress)
+        self._reveal_mask = None  # 'L' (2w, h): 255 right of the edge drawn at x offset w
+        self._rgb_frames = FrameMemo(4)  # source frame -> RGB copy
+
+    def start(self):
+        """Roll a new edge and debris and draw its masks."""
+        w, h = self.width, self.height
+        self.points = []
+        for i in range(TEAR_EDGE_SEGMENTS+1):
+            x = int(i * w / TEAR_EDGE_SEGMENTS)
+            jitter = random.randint(-TEAR_WOBBLE_Y, TEAR_WOBBLE_Y)
+            y = int(h * 0.15 + (h*0.7 * (i/TEAR_EDGE_SEGMENTS))) + jitter
+            self.points.append((x, y))
+        shifted = [(x + w, y) for x, y in self.points]
+        self._reveal_mask = Image.new('L', (2*w, h), 0)
+        ImageDraw.Draw(self._reveal_mask).polygon(shifted + [(2*w-1, h-1), (2*w-1, 0)], fill=255)
+        # Debris detaches from random spots along the edge while the tear runs
+        self.debris = []
+        for _ in range(TEAR_DEBRIS_COUNT):
+            i = random.randrange(len(self.points) - 1)
+            t = random.random()
+            (x1, y1), (x2, y2) = self.points[i], self.points[i+1]
+            self.debris.append({'x': x1 + (x2-x1)*t, 'y': y1 + (y2-y1)*t,
+                                'vx': random.uniform(-1.5, 1.5), 'vy': random.uniform(-2.5, -0.5),
+                                'life': random.uniform(0.4, 1.2), 'age': 0.0,
+                                'spawn': random.uniform(0.0, 0.8), 'launched': False})
+
+    def pull(self, step: int) -> int:
+        """How far (logical px) the edge has moved right at step."""
+        return int(step / self.steps * self.width * 0.95)
+
+    def _rgb(self, img):
+        if img.mode == 'RGB':
+            return img
+        rgb = self._rgb_frames.get((img,))
+        if rgb is None:
+            rgb = self._rgb_frames.put((img,), None, img.convert('RGB'))
+        return rgb
+
+    def frame(self, base, reveal, step: int):
+        """Logical RGB frame for step: `reveal` shows through right of the edge."""
+        w, h = self.width, self.height
+        pull = self.pull(step)
+        comp = self._rgb(base).copy()
+        if pull < w:
+            # Everything left of `pull` is base; the mask at visible x lives at x + w - pull
+            strip = self._rgb(reveal).crop((pull, 0, w, h))
+            comp.paste(strip, (pull, 0), self._reveal_mask.crop((w, 0, 2*w - pull, h)))
+        edge = [(x + pull, y) for x, y in self.points]
+        ImageDraw.Draw(comp, 'RGBA').line(edge, fill=self.EDGE_COLOR + (self.EDGE_ALPHA,), width=2)
+        return comp
+
+    def update(self, dt: float, step: int):
+        """Advance debris; particles launch from the edge once the tear reaches their spawn point."""
+        progress = step / self.steps
+        ticks = dt * 60
+        for p in self.debris:
+            if not p['launched']:
+                if progress < p['spawn']:
+                    continue
+                p['launched'] = True
+                p['x'] += self.pull(step)
+            p['x'] += p['vx'] * ticks
+            p['y'] += p['vy'] * ticks
+            p['vy'] += self.DEBRIS_GRAVITY * ticks
+            p['age'] += dt
+
+    def live_debris(self):
+        """(x, y, size) in logical px of debris currently in flight, shrinking with age."""
+        out = []
+        for p in self.debris:
+            if p['launched'] and p['age'] < p['life']:
+                out.append((p['x'], p['y'], max(1, round(3 * (1 - p['age'] / p['life'])))))
+        return out
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling p50/p95/p99 and an optional CSV sink.
+
+    Phases nest: enter()/leave() charge elapsed time to the innermost open
+    phase only, so a standardize inside a frame lookup is not counted twice.
+    A frame is bracketed by begin_frame() and end_frame() (or cancel_frame()
+    for ticks that drew nothing).
+    """
+
+    PHASES = ('update', 'lookup', 'standardize', 'blend', 'upload', 'overlays', 'draw')
+
+    def __init__(self, window: int = 240, csv_path: str = None):
+        self.samples = {phase: deque(maxlen=window) for phase in self.PHASES + ('frame', 'items')}
+        self._acc = dict.fromkeys(self.PHASES, 0.0)
+        self._stack = []
+        self._mark = time.perf_counter()
+        self._csv_file = None
+        self._csv = None
+        if csv_path:
+            try:
+                new_file = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+                self._csv_file = open(csv_path, 'a', newline='', encoding='utf-8')
+                self._csv = csv.writer(self._csv_file)
+                if new_file:
+                    self._csv.writerow(('time',) + tuple(f"{phase}_ms" for phase in self.PHASES) + ('frame_ms', 'items'))
+            except OSError as e:
+                print(f"[WARN] Frame timing CSV disabled ({csv_path}): {e}")
+
+    def enter(self, phase: str):
+        now = time.perf_counter()
+        if self._stack:
+            self._acc[self._stack[-1]] += now - self._mark
+        self._stack.append(phase)
+        self._mark = now
+
+    def leave(self):
+        now = time.perf_counter()
+        self._acc[self._stack.pop()] += now - self._mark
+        self._mark = now
+
+    def phase(self, phase: str):
+        """`with profiler.phase('blend'):` - enter() now, leave() on exit."""
+        self.enter(phase)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.leave()
+
+    def reset(self, window: int = None):
+        """Drop all samples, optionally resizing the rolling window."""
+        window = window or self.samples['frame'].maxlen
+        self.samples = {name: deque(maxlen=window) for name in self.samples}
+
+    def begin_frame(self):
+        self._acc = dict.fromkeys(self.PHASES, 0.0)
+        self._stack.clear()
+
+    def cancel_frame(self):
+        self._acc = dict.fromkeys(self.PHASES, 0.0)
+
+    def end_frame(self, items: int):
+        """Record the frame's phase times (ms) and canvas item count."""
+        times = [self._acc[phase] * 1000.0 for phase in self.PHASES]
+        for phase, ms in zip(self.PHASES, times):
+            self.samples[phase].append(ms)
+        self.samples['frame'].append(sum(times))
+        self.samples['items'].append(items)
+        if self._csv is not None:
+            self._csv.writerow([f"{time.time():.3f}"] + [f"{ms:.3f}" for ms in times] + [f"{sum(times):.3f}", items])
+
+    def percentiles(self, name: str):
+        """(p50, p95, p99) over the rolling window (zeros before the first frame)."""
+        values = sorted(self.samples[name])
+        if not values:
+            return 0.0, 0.0, 0.0
+        last = len(values) - 1
+        return tuple(values[min(last, int(q * len(values)))] for q in (0.50, 0.95, 0.99))
+
+    def hud_lines(self):
+        lines = ['phase        p50    p95    p99 ms']
+        for name in self.PHASES + ('frame',):
+            p50, p95, p99 = self.percentiles(name)
+            lines.append(f"{name:<11}{p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        p50, p95, p99 = self.percentiles('items')
+        lines.append(f"{'items':<11}{p50:6.0f} {p95:6.0f} {p99:6.0f}")
+        return lines
+
+    def close(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv = None
+
+class FrameScheduler:
+    """Fixed-timestep clock for CafeApp.loop, built on time.perf_counter.
+
+    advance() turns the real time since the previous tick into whole
+    simulation steps (the remainder carries over, so nothing drifts), and
+    next_delay_ms() aims the next root.after at a fixed frame deadline, net of
+    the time the frame itself took.
+    """
+
+    def __init__(self, step_hz: float, max_steps: int):
+        self.step = 1.0 / step_hz
+        self.max_steps = max_steps
+        self._accumulator = 0.0
+        self._last = time.perf_counter()
+        self._deadline = None   # perf_counter time the next frame is due
+        self.frames = 0         # ticks seen
+        self.missed = 0         # frame deadlines that had already passed when the frame finished
+        self.dropped_s = 0.0    # simulation time discarded by the max_steps cap
+
+    def advance(self) -> int:
+        """Number of fixed steps due now."""
+        now = time.perf_counter()
+        self._accumulator += now - self._last
+        self._last = now
+        self.frames += 1
+        steps = int(self._accumulator / self.step)
+        if steps > self.max_steps:
+            self.dropped_s += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= steps * self.step
+        return steps
+
+    def next_delay_ms(self, period_ms: float) -> int:
+        """after() delay to the next frame deadline while ticking every period_ms."""
+        now = time.perf_counter()
+        deadline = (self._deadline if self._deadline is not None else now) + period_ms / 1000.0
+        if deadline <= now:
+            self.missed += 1
+            deadline = now  # start the next frame right away instead of bursting to catch up
+        self._deadline = deadline
+        return int(round((deadline - now) * 1000))
+
+    def sleep(self, delay_ms: int):
+        """Note an idle wait so the following frame is not counted as late."""
+        self._deadline = time.perf_counter() + delay_ms / 1000.0
+
+# 5x7 blocky font: one string of '0'/'1' per glyph row (1 = lit pixel)
+BLOCKY_GLYPHS = {
+    'A': [
+        "01110",
+        "10001",
+        "10001",
+        "11111",
+        "10001",
+        "10001",
+        "00000"
+    ],
+    'B': [
+        "11110",
+        "10001",
+        "11110",
+        "11110",
+        "10001",
+        "11110",
+        "00000"
+    ],
+    'C': [
+        "01111",
+        "10000",
+        "10000",
+        "10000",
+        "10000",
+        "01111",
+        "00000"
+    ],
+    'D': [
+        "11110",
+        "10001",
+        "10001",
+        "10001",
+        "10001",
+        "11110",
+        "00000"
+    ],
+    'E': [
+        "11111",
+        "10000",
+        "11110",
+        "10000",
+        "10000",
+        "11111",
+        "00000"
+    ],
+    'F': [
+        "11111",
+        "10000",
+        "11110",
+        "10000",
+        "10000",
+        "10000",
+        "00000"
+    ],
+    'G': [
+        "01111",
+        "10000",
+        "10011",
+        "10001",
+        "10001",
+        "01111",
+        "00000"
+    ],
+    'H': [
+        "10001",
+        "10001",
+        "11111",
+        "10001",
+        "10001",
+        "10001",
+        "00000"
+    ],
+    'I': [
+        "11111",
+        "00100",
+        "00100",
+        "00100",
+        "00100",
+        "11111",
+        "00000"
+    ],
+    'J': [
+        "11111",
+        "00001",
+        "00001",
+        "00001",
+        "10001",
+        "01110",
+        "00000"
+    ],
+    'K': [
+        "10001",
+        "10010",
+        "11100",
+        "10010",
+        "10001",
+        "10001",
+        "00000"
+    ],
+    'L': [
+        "10000",
+        "10000",
+        "10000",
+        "10000",
+        "10000",
+        "11111",
+        "00000"
+    ],
+    'M': [
+        "10001",
+        "11011",
+        "10101",
+        "10001",
+        "10001",
+        "10001",
+        "00000"
+    ],
+    'N': [
+        "10001",
+        "11001",
+        "10101",
+        "10011",
+        "10001",
+        "10001",
+        "00000"
+    ],
+    'O': [
+        "01110",
+        "10001",
+        "10001",
+        "10001",
+        "10001",
+        "01110",
+        "00000"
+    ],
+    'P': [
+        "11110",
+        "10001",
+        "11110",
+        "10000",
+        "10000",
+        "10000",
+        "00000"
+    ],
+    'Q': [
+        "01110",
+        "10001",
+        "10001",
+        "10101",
+        "10010",
+        "01101",
+        "00000"
+    ],
+    'R': [
+        "11110",
+        "10001",
+        "11110",
+        "10010",
+        "10001",
+        "10001",
+        "00000"
+    ],
+    'S': [
+        "01111",
+        "10000",
+        "01110",
+        "00001",
+        "00001",
+        "11110",
+        "00000"
+    ],
+    'T': [
+        "11111",
+        "00100",
+        "00100",
+        "00100",
+        "00100",
+        "00100",
+        "00000"
+    ],
+    'U': [
+        "10001",
+        "10001",
+        "10001",
+        "10001",
+        "10001",
+        "01110",
+        "00000"
+    ],
+    'V': [
+        "10001",
+        "10001",
+        "10001",
+        "10001",
+        "01010",
+        "00100",
+        "00000"
+    ],
+    'W': [
+        "10001",
+        "10001",
+        "10001",
+        "10101",
+        "11011",
+        "10001",
+        "00000"
+    ],
+    'X': [
+        "10001",
+        "01010",
+        "00100",
+        "01010",
+        "10001",
+        "10001",
+        "00000"
+    ],
+    'Y': [
+        "10001",
+        "01010",
+        "00100",
+        "00100",
+        "00100",
+        "00100",
+        "00000"
+    ],
+    'Z': [
+        "11111",
+        "00010",
+        "00100",
+        "01000",
+        "10000",
+        "11111",
+        "00000"
+    ],
+    ' ': [
+        "00000",
+        "00000",
+        "00000",
+        "00000",
+        "00000",
+        "00000",
+        "00000"
+    ],
+    ':': [
+        "00000",
+        "00100",
+        "00000",
+        "00000",
+        "00100",
+        "00000",
+        "00000"
+    ],
+    '.': [
+        "00000",
+        "00000",
+        "00000",
+        "00000",
+        "00000",
+        "00100",
+        "00000"
+    ],
+    '0': [
+        "01110",
+        "10001",
+        "10011",
+        "10101",
+        "11001",
+        "01110",
+        "00000"
+    ],
+    '1': [
+        "00100",
+        "01100",
+        "00100",
+        "00100",
+        "00100",
+        "01110",
+        "00000"
+    ],
+    '2': [
+        "01110",
+        "10001",
+        "00010",
+        "00100",
+        "01000",
+        "11111",
+        "00000"
+    ],
+    '3': [
+        "01110",
+        "10001",
+        "00110",
+        "00001",
+        "10001",
+        "01110",
+        "00000"
+    ],
+    '4': [
+        "00010",
+        "00110",
+        "01010",
+        "11111",
+        "00010",
+        "00010",
+        "00000"
+    ],
+    '5': [
+        "11111",
+        "10000",
+        "11110",
+        "00001",
+        "10001",
+        "01110",
+        "00000"
+    ],
+    '6': [
+        "01110",
+        "10000",
+        "11110",
+        "10001",
+        "10001",
+        "01110",
+        "00000"
+    ],
+    '7': [
+        "11111",
+        "00001",
+        "00010",
+        "00100",
+        "01000",
+        "01000",
+        "00000"
+    ],
+    '8': [
+        "01110",
+        "10001",
+        "01110",
+        "10001",
+        "10001",
+        "01110",
+        "00000"
+    ],
+    '9': [
+        "01110",
+        "10001",
+        "01111",
+        "00001",
+        "00001",
+        "01110",
+        "00000"
+    ]
+}
+
+class BlockyFont:
+    """Compiled 5x7 blocky font shared by every blocky text path.
+
+    Glyphs are parsed once into bit-packed rows and their horizontal pixel
+    runs. Text is laid out in logical pixels: each glyph pixel is
+    `scale * magnify` wide and glyphs advance by (5 * scale + spacing) * magnify.
+    runs() gives one rectangle per horizontal run (vector drawing); render()
+    composes one image per string from an atlas of glyph images per
+    (colour, magnify).
+    """
+
+    GLYPH_W = 5
+    GLYPH_H = 7
+
+    def __init__(self, glyphs, scale: int = 1, spacing: int = 1):
+        self.scale = scale
+        self.spacing = spacing
+        self._rows = {char: tuple(int(row, 2) for row in rows) for char, rows in glyphs.items()}
+        self._runs = {char: self._row_runs(rows) for char, rows in self._rows.items()}
+        self._blank = self._rows.get(' ', (0,) * self.GLYPH_H)
+        self._atlas = {}  # (char, rgba, magnify) -> RGBA glyph image
+
+    def _row_runs(self, rows):
+        """(row, first column, length) of every horizontal run of lit pixels."""
+        runs = []
+        for y, bits in enumerate(rows):
+            x = 0
+            while x < self.GLYPH_W:
+                if bits >> (self.GLYPH_W - 1 - x) & 1:
+                    start = x
+                    while x < self.GLYPH_W and bits >> (self.GLYPH_W - 1 - x) & 1:
+                        x += 1
+                    runs.append((y, start, x - start))
+                else:
+                    x += 1
+        return tuple(runs)
+
+    def _glyph(self, char):
+        char = char.upper()
+        return char if char in self._rows else ' '
+
+    def rows(self, char):
+        """Bit-packed rows of a glyph (bit 4 = leftmost column); unknown chars are blank."""
+        return self._rows.get(self._glyph(char), self._blank)
+
+    def advance(self, magnify: int = 1):
+        return (self.GLYPH_W * self.scale + self.spacing) * magnify
+
+    def height(self, magnify: int = 1):
+        return self.GLYPH_H * self.scale * magnify
+
+    def text_width(self, text, magnify: int = 1):
+        """Logical width of text (no trailing spacing)."""
+        if not text:
+            return 0
+        return len(text) * self.advance(magnify) - self.spacing * magnify
+
+    def runs(self, text, magnify: int = 1):
+        """Logical (x1, y1, x2, y2) rectangles covering text's lit pixels, one per merged horizontal run."""
+        pixel = self.scale * magnify
+        advance = self.advance(magnify)
+        open_runs = {}  # row -> [x1, x2] of the run being extended
+        rects = []
+        for i, char in enumerate(text):
+            origin = i * advance
+            for row, col, length in self._runs.get(self._glyph(char), ()):
+                x1 = origin + col * pixel
+                x2 = x1 + length * pixel
+                run = open_runs.get(row)
+                if run is not None and run[1] == x1:
+                    run[1] = x2  # touches the previous glyph's run (spacing 0)
+                else:
+                    if run is not None:
+                        rects.append((run[0], row * pixel, run[1], (row + 1) * pixel))
+                    open_runs[row] = [x1, x2]
+        for row, run in open_runs.items():
+            rects.append((run[0], row * pixel, run[1], (row + 1) * pixel))
+        return rects
+
+    def glyph_image(self, char, color, magnify: int = 1):
+        """Atlas entry: the glyph in `color` on transparency, at logical resolution."""
+        rgba = ImageColor.getrgb(color) if isinstance(color, str) else tuple(color)
+        key = (self._glyph(char), rgba, magnify)
+        img = self._atlas.get(key)
+        if img is None:
+            bits = bytes(255 if bits >> (self.GLYPH_W - 1 - x) & 1 else 0
+                         for bits in self.rows(char) for x in range(self.GLYPH_W))
+            pixel = self.scale * magnify
+            mask = Image.frombytes('L', (self.GLYPH_W, self.GLYPH_H), bits)
+            if pixel != 1:
+                mask = mask.resize((self.GLYPH_W * pixel, self.GLYPH_H * pixel), Image.NEAREST)
+            img = Image.new('RGBA', mask.size, rgba[:3] + (0,))
+            img.putalpha(mask)
+            self._atlas[key] = img
+        return img
+
+    def render(self, text, color, magnify: int = 1, bg_color=None):
+        """One RGBA image of text (logical resolution), glyphs pasted from the atlas.
+
+        bg_color fills each glyph cell (not the spacing), as the per-pixel renderer did.
+        """
+        width = max(1, self.text_width(text, magnify))
+        img = Image.new('RGBA', (width, self.height(magnify)), (0, 0, 0, 0))
+        advance = self.advance(magnify)
+        cell_w = self.GLYPH_W * self.scale * magnify
+        if bg_color:
+            draw = ImageDraw.Draw(img)
+            for i in range(len(text)):
+                draw.rectangle((i * advance, 0, i * advance + cell_w - 1, img.height - 1), fill=bg_color)
+        for i, char in enumerate(text):
+            if self._runs.get(self._glyph(char)):
+                img.alpha_composite(self.glyph_image(char, color, magnify), (i * advance, 0))
+        return img
+
+BLOCKY_FONT = BlockyFont(BLOCKY_GLYPHS, BLOCKY_FONT_SCALE, BLOCKY_FONT_SPACING)
+
+class Menu:
+    """A vertical list menu declared as data (see MENUS).
+
+    Layout is computed once for the logical size: a centred panel, a title
+    band and rows every MOOD_MENU_ITEM_HEIGHT. hit_test() finds the row
+    under a point arithmetically instead of scanning boxes. `dirty` is set
+    whenever what the panel shows changes and tells the render loop to draw;
+    CafeApp draws the panel through a cached sprite per hover row.
+    """
+
+    def __init__(self, name, title, items, logical_size, icons=False, slide_in=False,
+                 row_offset=0, row_inset=0, backdrop=None, actions=None):
+        self.name = name
+        self.title = title
+        self.items = list(items)  # (label, description)
+        self.icons = icons        # mood icon column left of the text
+        self.slide_in = slide_in  # slides down into place when (re)started
+        self.backdrop = backdrop  # stippled colour over the whole scene behind the panel, or None
+        self.actions = actions or {}
+        self.hover = -1
+        self.anim_progress = 1.0  # 0 -> 1 slide in
+        self.dirty = True
+        width, height = logical_size
+        panel_h = MOOD_MENU_TITLE_HEIGHT + MOOD_MENU_PADDING + len(self.items) * MOOD_MENU_ITEM_HEIGHT + MOOD_MENU_PADDING
+        x1 = (width - MOOD_MENU_WIDTH) // 2
+        y1 = (height - panel_h) // 2
+        self.panel_rect = (x1, y1, x1 + MOOD_MENU_WIDTH, y1 + panel_h)
+        self.icon_x = x1 + MOOD_MENU_PADDING
+        self.text_x = self.icon_x + (MOOD_ICON_SIZE + MOOD_ICON_TEXT_GAP if icons else 0)
+        self.text_right = x1 + MOOD_MENU_WIDTH - MOOD_MENU_PADDING
+        self.rows_top = y1 + MOOD_MENU_TITLE_HEIGHT + row_offset
+        self.row_pitch = MOOD_MENU_ITEM_HEIGHT
+        self.row_height = MOOD_MENU_ITEM_HEIGHT - row_inset
+
+    def row_box(self, index):
+        """Logical (x1, y1, x2, y2) of a row's text/hover area."""
+        y1 = self.rows_top + index * self.row_pitch
+        return (self.text_x, y1, self.text_right, y1 + self.row_height)
+
+    def hit_test(self, lx, ly):
+        """Row under logical (lx, ly), or -1; boxes are inclusive and a shared edge belongs to the upper row."""
+        if not self.text_x <= lx <= self.text_right:
+            return -1
+        rel = ly - self.rows_top
+        index = max(0, -((self.row_height - rel) // self.row_pitch))  # first row whose box reaches down to rel
+        if index < len(self.items) and index * self.row_pitch <= rel:
+            return int(index)
+        return -1
+
+    def set_hover(self, index):
+        """Hover row `index` (-1 for none); True if that changed."""
+        if index == self.hover:
+            return False
+        self.hover = index
+        self.dirty = True
+        return True
+
+    def step_hover(self, delta):
+        """Keyboard navigation: the first Up/Down picks the top row, then moves with wrap-around."""
+        self.set_hover(0 if self.hover == -1 else (self.hover + delta) % len(self.items))
+
+    def restart(self):
+        self.hover = -1
+        self.anim_progress = 0.0 if self.slide_in else 1.0
+        self.dirty = True
+
+    @property
+    def animating(self):
+        return self.anim_progress < 1.0
+
+    def advance(self):
+        """Advance the slide-in by one simulation step."""
+        if self.anim_progress < 1.0:
+            self.anim_progress = min(1.0, self.anim_progress + MOOD_MENU_ANIM_SPEED)
+            self.dirty = True
+
+    def slide_offset(self):
+        """Logical pixels the panel is still above its place (ease-out)."""
+        ease = 1 - (1 - self.anim_progress)**2
+        return int((1 - ease) * 40)
 
 class SceneManager:
     STATE_OUTSIDE = 'outside'
@@ -348,6 +2652,7 @@ class SceneManager:
         if self.state == self.STATE_OUTSIDE:
             self.state = self.STATE_FADING
             self.fade_counter = 0
+            self.app.arm_crossfade()
             self.app.play_bell()
 
     def trigger_fade_to_focused(self):
@@ -363,6 +2668,7 @@ class SceneManager:
         else:
             self.state = self.STATE_FADING_TO_FOCUSED
             self.fade_counter = 0
+            self.app.arm_crossfade()
 
     def trigger_fade_to_fireplace(self):
         # Allow triggering from INSIDE only (ignore if already fading or in fireplace)
@@ -372,6 +2678,7 @@ class SceneManager:
         print('[DEBUG] trigger_fade_to_fireplace start')
         self.state = self.STATE_FADING_TO_FIREPLACE
         self.fade_counter = 0
+        self.app.arm_crossfade()
     
     def trigger_fade_from_fireplace(self):
         # Allow triggering from FIREPLACE only
@@ -381,6 +2688,7 @@ class SceneManager:
         print('[DEBUG] trigger_fade_from_fireplace start')
         self.state = self.STATE_FADING_FROM_FIREPLACE
         self.fade_counter = 0
+        self.app.arm_crossfade()
 
     def trigger_fade_to_coffee(self):
         # Allow triggering from INSIDE only (ignore if already fading or in coffee scene)
@@ -390,6 +2698,7 @@ class SceneManager:
         print('[DEBUG] trigger_fade_to_coffee start')
         self.state = self.STATE_FADING_TO_COFFEE
         self.fade_counter = 0
+        self.app.arm_crossfade()
     
     def trigger_fade_from_coffee(self):
         # Allow triggering from COFFEE only
@@ -399,6 +2708,7 @@ class SceneManager:
         print('[DEBUG] trigger_fade_from_coffee start')
         self.state = self.STATE_FADING_FROM_COFFEE
         self.fade_counter = 0
+        self.app.arm_crossfade()
 
 class TeaTimerGame:
     """Tea Timer Challenge - hit the key at the perfect moment for ideal tea"""
@@ -619,35 +2929,61 @@ class MeditationTimer:
         return self.breathing_timer / self.breathing_cycle_time
 
 class CafeApp:
-    def __init__(self, root):
+    def __init__(self, root, canvas_factory=None, photo_factory=None, audio=True):
+        """canvas_factory / photo_factory replace tk.Canvas / ImageTk.PhotoImage and
+        audio=False skips the mixer, so the app can run offscreen (see benchmark_scenes)."""
         self.root = root
         self.root.title("Pixel Cafe Transition Prototype")
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.resizable(False, False)  # Prevent maximizing and resizing
         # Determine pixel-font to use once (lazy selection)
         self.pixel_font_family = self._choose_pixel_font()
+        self.profiler = FrameProfiler(PERF_WINDOW, PERF_CSV_PATH)  # per-phase frame timings (see loop/draw)
+        self.perf_hud_visible = SHOW_PERF_HUD
+        self.layers = PhotoLayers(self.profiler, photo_factory)  # long-lived PhotoImages (scene, overlays, sprites)
+        # Rendered text runs (blocky strings are PhotoLayers layers named by their key)
+        self.text_runs = TextRunCache(TEXT_RUN_CACHE_SIZE, on_evict=lambda key, value: self.layers.drop(key))
 
-        # Load assets
-        self.outside = AnimatedGif(OUTSIDE_GIF)
-        self.inside  = AnimatedGif(INSIDE_GIF)
-        self.focused_scene = AnimatedGif(FOCUSED_GIF)
-        self.fireplace = AnimatedGif(FIREPLACE_GIF)
-        self.coffee = AnimatedGif(COFFEE_GIF)
-        # Fallback: if specified INSIDE_GIF path didn't load but a generic 'inside.gif' exists, use it
+        # Logical (base) size comes from the GIF headers so the window can open before
+        # any frames are decoded; use max so both GIFs fit without cropping
+        self.inside_path = INSIDE_GIF
         alt_inside_path = os.path.join(ASSETS_DIR, 'inside.gif')
-        if not self.inside.valid and os.path.isfile(alt_inside_path):
+        if _probe_image_size(INSIDE_GIF) is None and os.path.isfile(alt_inside_path):
+            # Fallback: if specified INSIDE_GIF path can't be read but a generic 'inside.gif' exists, use it
             print('[INFO] Falling back to inside.gif (configured INSIDE_GIF missing or invalid)')
-            self.inside = AnimatedGif(alt_inside_path)
-        # Determine logical (base) size: use max so both GIFs fit without cropping
-        base_w_candidates = [w for w in (self.outside.width, self.inside.width) if w]
-        base_h_candidates = [h for h in (self.outside.height, self.inside.height) if h]
-        self.width = max(base_w_candidates) if base_w_candidates else 128
-        self.height = max(base_h_candidates) if base_h_candidates else 96
+            self.inside_path = alt_inside_path
+        base_sizes = [sz for sz in (_probe_image_size(OUTSIDE_GIF), _probe_image_size(self.inside_path)) if sz]
+        self.width = max(w for w, _ in base_sizes) if base_sizes else 128
+        self.height = max(h for _, h in base_sizes) if base_sizes else 96
+
+        # Scenes start as empty placeholders and are filled in by the background loader
+        self.outside = AnimatedGif(OUTSIDE_GIF, load=False)
+        self.inside = AnimatedGif(self.inside_path, load=False)
+        self.focused_scene = AnimatedGif(FOCUSED_GIF, load=False)
+        self.fireplace = AnimatedGif(FIREPLACE_GIF, load=False)
+        self.coffee = AnimatedGif(COFFEE_GIF, load=False)
 
         self.scale = self.compute_scale()
+        # Display pixel <-> logical pixel mapping (fractional scales included)
+        self.scale_map = _scale_map((self.width, self.height), (round(self.width*self.scale), round(self.height*self.scale)))
+        self.display_width, self.display_height = self.scale_map.display_size
+        self.build_scene_caches()
+        self.crossfades = CrossfadeEngine(CROSSFADE_FRAMES, self.scale_map.display_size)
+        self._placeholders = {}  # (size, label, colour) -> flat placeholder frame
+        self._vignettes = {}     # size -> vignette mask for the focused placeholder
+        self._focused_placeholders = FrameMemo(16)  # source frame -> focused placeholder
 
-        self.canvas = tk.Canvas(root, width=self.width*self.scale, height=self.height*self.scale, bg="#000", highlightthickness=0)
+        self.canvas = RetainedCanvas((canvas_factory or tk.Canvas)(root, width=self.display_width, height=self.display_height, bg="#000", highlightthickness=0),
+                                     RETAINED_CANVAS)
         self.canvas.pack()
+        try:
+            self.pixels_per_point = float(root.winfo_fpixels('1p'))
+        except Exception:
+            self.pixels_per_point = 96 / 72
+        self.overlay_compositor = None
+        if OVERLAY_BACKEND == 'pil':
+            self.overlay_compositor = OverlayCompositor(self.scale_map, self.layers.source_of, self.pixels_per_point, self.text_runs)
+        self._menu_sprites = {}  # (menu, hover index) -> (PhotoImage, logical top-left) of a pre-rendered panel
 
         # Custom cursor state
         self.leaf_img_original = None
@@ -676,75 +3012,39 @@ class CafeApp:
         self.music_loaded = False
         self.current_music_path = None
         self.cozy_music_button = None
-        # Torn transition data
-        self.tear_points = []  # list of (x,y) across width
-        self.tear_debris = []  # list of particles {x,y,vx,vy,life}
-        self.tear_cached_mask = None
-        try:
-            pygame.mixer.init()
-            if os.path.isfile(BELL_SOUND):
-                self.bell_loaded = True
-            if ENABLE_RAIN_AMBIENCE and os.path.isfile(RAIN_SOUND):
-                try:
-                    self.rain_sound = pygame.mixer.Sound(RAIN_SOUND)
-                    self.rain_sound.set_volume(RAIN_VOLUME)
-                    # Play on its own channel looping (-1)
-                    self.rain_channel = self.rain_sound.play(loops=-1)
-                    self.rain_loaded = True
-                except Exception as re:
-                    print("[WARN] Could not play rain ambience:", re)
-            
-            # Load fireplace sound but don't play it yet
-            if os.path.isfile(FIREPLACE_SOUND):
-                try:
-                    self.fireplace_sound = pygame.mixer.Sound(FIREPLACE_SOUND)
-                    self.fireplace_sound.set_volume(0.95)  # Moderate volume for fireplace
-                    self.fireplace_loaded = True
-                except Exception as fe:
-                    print("[WARN] Could not load fireplace sound:", fe)
-            
-            # Load coffee brewing sound but don't play it yet
-            if os.path.isfile(COFFEE_SOUND):
-                try:
-                    self.coffee_sound = pygame.mixer.Sound(COFFEE_SOUND)
-                    self.coffee_sound.set_volume(1.0)  # Maximum volume for coffee brewing
-                    self.coffee_loaded = True
-                except Exception as ce:
-                    print("[WARN] Could not load coffee sound:", ce)
-        except Exception as e:
-            print("[WARN] Pygame mixer init failed:", e)
+        # Torn transition (edge, masks and debris are rolled per tear)
+        self.tear = TornTransition((self.width, self.height), TEAR_DURATION_FRAMES)
+        self.mixer_ready = False
+        if audio:
+            try:
+                pygame.mixer.init()
+                self.mixer_ready = True
+                if os.path.isfile(BELL_SOUND):
+                    self.bell_loaded = True
+            except Exception as e:
+                print("[WARN] Pygame mixer init failed:", e)
 
         self.scene = SceneManager(self)
-        self.last_time = time.time()
+        self.frame_clock = FrameScheduler(SIM_STEP_HZ, SIM_MAX_STEPS)
         self.elapsed_outside_ms = 0
         self.elapsed_inside_ms = 0
         self.elapsed_focused_ms = 0
         self._frame_refs = []  # keep references to PhotoImage
+        # Event-driven rendering state (see loop / request_redraw)
+        self._needs_redraw = True
+        self._drawn_frame_key = None  # (state, frame index) of the last drawn stable scene
+        self._last_draw_time = 0.0
+        self._loop_after_id = None
+        self._loop_fast = True  # loop is ticking at FPS_LIMIT rather than idling
+        self._pending_motion = None  # latest <Motion> event, handled once per loop tick
+        self.motion_events_raw = 0        # <Motion> events delivered by Tk
+        self.motion_events_processed = 0  # of those, handled by on_mouse_move
+        self._last_hover_sound = 0.0
 
-        # Mood menu state
-        self.menu_active = False
-        self.menu_boxes = []  # list of (item_index, (x1,y1,x2,y2)) in logical coords
-        self.menu_hover_index = -1
-        self.menu_selected_index = -1
-        self.menu_anim_progress = 0.0  # 0 -> 1 slide in
-        
-        # Cozy submenu state
-        self.cozy_submenu_active = False
-        self.cozy_submenu_boxes = []
-        self.cozy_submenu_hover_index = -1
-        self.cozy_submenu_selected = ""
-        
-        # Focused submenu state
-        self.focused_submenu_active = False
-        self.focused_submenu_boxes = []
-        self.focused_submenu_hover_index = -1
-        self.focused_submenu_selected = ""
-        
-        # Creative submenu state
-        self.creative_submenu_active = False
-        self.creative_submenu_boxes = []
-        self.creative_submenu_hover_index = -1
-        self.creative_submenu_selected = ""
+        # Menus (see MENUS); at most one is open at a time
+        self.menus = {name: Menu(name, logical_size=(self.width, self.height), **spec) for name, spec in MENUS.items()}
+        self.active_menu = None
+        self.menu_selected_index = -1  # mood picked in the mood menu, -1 until one is
         
         # Phone game state
         self.phone_game_active = False
@@ -777,51 +3077,15 @@ class CafeApp:
         
         self.hover_sound_loaded = False
         self.typing_sound_loaded = False
+        self.pageflip_sound_loaded = False
+        self.tear_sound = None
         self.last_typing_sound_time = 0.0
         # Mood icons (logical sized PIL images, converted on draw via _to_menu_icon_photo)
         self.mood_icons = {}  # label -> PIL.Image (RGBA) resized to MOOD_ICON_SIZE
-        if ENABLE_MOOD_MENU and os.path.isfile(HOVER_SOUND):
-            try:
-                self.hover_sound = pygame.mixer.Sound(HOVER_SOUND)
-                self.hover_sound.set_volume(HOVER_VOLUME)
-                self.hover_sound_loaded = True
-            except Exception as e:
-                print("[WARN] Could not load hover sound:", e)
-        # Load typing sound if present
-        if os.path.isfile(TYPING_SOUND):
-            try:
-                self.typing_sound = pygame.mixer.Sound(TYPING_SOUND)
-                self.typing_sound.set_volume(0.8)
-                self.typing_sound_loaded = True
-            except Exception as e:
-                print('[WARN] Could not load typing sound:', e)
-        # Load page flip sound if present
-        self.pageflip_sound_loaded = False
-        if os.path.isfile(PAGEFLIP_SOUND):
-            try:
-                self.pageflip_sound = pygame.mixer.Sound(PAGEFLIP_SOUND)
-                self.pageflip_sound.set_volume(0.7)
-                self.pageflip_sound_loaded = True
-            except Exception as e:
-                print('[WARN] Could not load page flip sound:', e)
-        # load music default
-        if os.path.isfile(MUSIC_DEFAULT):
-            try:
-                self.background_music = pygame.mixer.Sound(MUSIC_DEFAULT)
-                self.background_music.set_volume(MUSIC_VOLUME)
-                self.music_channel = self.background_music.play(loops=-1)
-                self.music_loaded = True
-                self.current_music_path = MUSIC_DEFAULT
-            except Exception as e:
-                print('[WARN] Could not play default music:', e)
-        # tear sound
-        self.tear_sound = None
-        if os.path.isfile(TORN_SOUND):
-            try:
-                self.tear_sound = pygame.mixer.Sound(TORN_SOUND)
-                self.tear_sound.set_volume(0.6)
-            except Exception:
-                self.tear_sound = None
+
+        # Scenes and sounds decode on worker threads; outside first so it shows up soonest
+        self.loader = AssetLoader(self.root, on_applied=self.request_redraw)
+        self.load_assets_async()
 
         if ENABLE_MOOD_MENU:
             self.load_mood_icons()
@@ -833,84 +3097,38 @@ class CafeApp:
             except Exception as e:
                 print(f"[WARN] Could not load phone image: {e}")
 
-        self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<Button-1>", self._input(self.on_click))
         if USE_LEAF_CURSOR:
-            self.canvas.bind("<Motion>", self.on_mouse_move)
+            self.canvas.bind("<Motion>", self.on_motion)
         # Key bindings for menu navigation
-        self.root.bind('<Up>', self.on_key)
-        self.root.bind('<Down>', self.on_key)
-        self.root.bind('<Return>', self.on_key)
-        self.root.bind('<Escape>', self.on_key)
+        self.root.bind('<Up>', self._input(self.on_key))
+        self.root.bind('<Down>', self._input(self.on_key))
+        self.root.bind('<Return>', self._input(self.on_key))
+        self.root.bind('<Escape>', self._input(self.on_key))
         # Add W/S bindings for to-do list navigation
-        self.root.bind('<w>', self.on_key)
-        self.root.bind('<s>', self.on_key)
+        self.root.bind('<w>', self._input(self.on_key))
+        self.root.bind('<s>', self._input(self.on_key))
         
         # Key press/release tracking for smooth movement
-        self.root.bind('<KeyPress>', self.on_key_press)
-        self.root.bind('<KeyRelease>', self.on_key_release)
+        self.root.bind('<KeyPress>', self._input(self.on_key_press))
+        self.root.bind('<KeyRelease>', self._input(self.on_key_release))
+        self.root.bind(f'<{PERF_HUD_KEY}>', self._input(self.toggle_perf_hud))
         self.root.focus_set()  # Enable key events
         
         self.loop()
 
     def on_click(self, event):
-        # If cozy submenu active, handle submenu clicks
-        if self.cozy_submenu_active:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
-            for idx, (x1,y1,x2,y2) in self.cozy_submenu_boxes:
-                if x1 <= lx <= x2 and y1 <= ly <= y2:
-                    label, _ = COZY_SUBMENU_ITEMS[idx]
-                    self.cozy_submenu_selected = label
-                    self.cozy_submenu_active = False
-                    
-                    if label == "Phone":
-                        self.start_phone_game()
-                    elif label == "Meditate":
-                        self.start_meditation()
-                    elif label == "Fireplace":
-                        self.toggle_fireplace()
-                    elif label == "Coffee":
-                        self.start_coffee_scene()
-                    return
-                    
-        # If creative submenu active, handle submenu clicks
-        if self.creative_submenu_active:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
-            for idx, (x1,y1,x2,y2) in self.creative_submenu_boxes:
-                if x1 <= lx <= x2 and y1 <= ly <= y2:
-                    label, _ = CREATIVE_SUBMENU_ITEMS[idx]
-                    self.creative_submenu_selected = label
-                    self.creative_submenu_active = False
-                    
-                    if label == "Edit Code":
-                        self.open_code_editor()
-                    elif label == "Notebook":
-                        self.open_note_window()
-                    elif label == "Mood Menu":
-                        self.menu_active = True
-                    return
-                    
-        # If focused submenu active, handle submenu clicks  
-        if self.focused_submenu_active:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
-            for idx, (x1,y1,x2,y2) in self.focused_submenu_boxes:
-                if x1 <= lx <= x2 and y1 <= ly <= y2:
-                    label, _ = FOCUSED_SUBMENU_ITEMS[idx]
-                    self.focused_submenu_selected = label
-                    self.focused_submenu_active = False
-                    
-                    if label == "Study Zone":
-                        self.scene.trigger_fade_to_focused()  # Go to focused scene for study zone
-                    elif label == "To-Do List":
-                        self.start_todo_list()  # New to-do list function
-                    return
+        # If a menu is open, a click on a row chooses it
+        if self.active_menu is not None:
+            lx, ly = self.scale_map.to_logical(event.x, event.y)
+            idx = self.active_menu.hit_test(lx, ly)
+            if idx != -1:
+                self.choose_menu_item(self.active_menu, idx)
+                return
         
         # If todo list active, handle button clicks
         if self.todo_list_active and hasattr(self, 'todo_button_boxes'):
-            lx = event.x // self.scale
-            ly = event.y // self.scale
+            lx, ly = self.scale_map.to_logical(event.x, event.y)
             for idx, (x1,y1,x2,y2) in enumerate(self.todo_button_boxes):
                 if x1 <= lx <= x2 and y1 <= ly <= y2:
                     button_names = ["Add New", "Edit", "Delete", "Toggle"]
@@ -939,32 +3157,9 @@ class CafeApp:
                             self.save_todo_items()
                     return
                     
-        # If menu active, interpret click as selection attempt
-        if self.menu_active:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
-            for idx, (x1,y1,x2,y2) in self.menu_boxes:
-                if x1 <= lx <= x2 and y1 <= ly <= y2:
-                    self.menu_selected_index = idx
-                    # For now simply close menu after selection
-                    self.menu_active = False
-                    # If Cozy mood chosen, show submenu; if Focused, start transition
-                    label, _ = MOOD_MENU_ITEMS[idx]
-                    if label == 'Cozy':
-                        print('[DEBUG] Cozy selected - showing submenu')
-                        self.activate_cozy_submenu()
-                    elif label == 'Creative':
-                        print('[DEBUG] Creative selected - showing submenu')
-                        self.activate_creative_submenu()
-                    elif label == 'Focused':
-                        print('[DEBUG] Focused selected - showing submenu')
-                        self.activate_focused_submenu()
-                    return
-              
         # Focused scene interactive clicks
         if self.scene.state == SceneManager.STATE_FOCUSED:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
+            lx, ly = self.scale_map.to_logical(event.x, event.y)
             if self._point_in_box(lx, ly, BOOK_HITBOX):
                 self.open_note_window()
                 return
@@ -990,8 +3185,7 @@ class CafeApp:
                 self.scene.trigger_fade()
                 return
             # Fallback to hitbox logic if flag disabled
-            lx = event.x // self.scale
-            ly = event.y // self.scale
+            lx, ly = self.scale_map.to_logical(event.x, event.y)
             x1, y1, x2, y2 = DOOR_HITBOX
             if x1 <= lx <= x2 and y1 <= ly <= y2:
                 self.scene.trigger_fade()
@@ -1010,25 +3204,135 @@ class CafeApp:
             print("[WARN] Ring play failed:", e)
 
     def loop(self):
-        now = time.time()
-        dt = now - self.last_time
-        self.last_time = now
+        self._loop_after_id = None
+        profiler = self.profiler
+        profiler.begin_frame()
+        with profiler.phase('update'):
+            self.advance_simulation()
+            self._process_motion()
+            if self.scene.state not in self.CROSSFADE_SCENES and self.crossfades.holding:
+                self.crossfades.clear()  # fade over (or cancelled): release its display-size blends
+        now = time.perf_counter()
+
+        frame_key = self._visible_frame_key()
+        menu_dirty = self.active_menu is not None and self.active_menu.dirty
+        # _loop_fast: the last tick was animating, so draw the state the simulation settled on
+        if (not EVENT_DRIVEN_RENDERING or self._needs_redraw or menu_dirty or self._is_animating() or self._loop_fast
+                or frame_key != self._drawn_frame_key or (now - self._last_draw_time) * 1000 >= IDLE_REDRAW_MS):
+            with profiler.phase('draw'):
+                self.draw()
+            profiler.end_frame(self.canvas.frame_items)
+            self._needs_redraw = False
+            self._drawn_frame_key = frame_key
+            self._last_draw_time = now
+        else:
+            profiler.cancel_frame()
+
+        # Aim for FPS limit while animating; otherwise sleep until the next scene GIF frame
+        self._loop_fast = not EVENT_DRIVEN_RENDERING or self._is_animating()
+        if self._loop_fast:
+            delay = self.frame_clock.next_delay_ms(1000 / FPS_LIMIT)
+        else:
+            idle_ms = IDLE_REDRAW_MS - (now - self._last_draw_time) * 1000
+            delay = max(int(1000 / FPS_LIMIT), int(min(idle_ms, self._ms_until_next_scene_frame())) + 1)
+            self.frame_clock.sleep(delay)
+        self._loop_after_id = self.root.after(delay, self.loop)
+
+    # -------- Event-Driven Rendering --------
+    # Stable scene state -> (SceneFrameCache attribute, elapsed-time attribute) it shows
+    SCENE_CLOCKS = {
+        SceneManager.STATE_OUTSIDE: ('outside_frames', 'elapsed_outside_ms'),
+        SceneManager.STATE_INSIDE: ('inside_frames', 'elapsed_inside_ms'),
+        SceneManager.STATE_FOCUSED: ('focused_frames', 'elapsed_focused_ms'),
+        SceneManager.STATE_FIREPLACE: ('fireplace_frames', 'elapsed_inside_ms'),
+        SceneManager.STATE_COFFEE: ('coffee_frames', 'elapsed_inside_ms'),
+    }
+
+    def _is_animating(self):
+        """True while something on screen changes every tick (fades, tear, timers, games)."""
+        return (self.scene.state not in self.SCENE_CLOCKS
+                or self.phone_game_active or self.meditation_active or self.coffee_brewing
+                or (self.active_menu is not None and self.active_menu.animating))
+
+    def _visible_frame_key(self):
+        clock = self.SCENE_CLOCKS.get(self.scene.state)
+        if clock is None:
+            return None
+        cache = getattr(self, clock[0])
+        return (self.scene.state, cache.index(getattr(self, clock[1])) if cache.valid else None)
+
+    def _ms_until_next_scene_frame(self):
+        clock = self.SCENE_CLOCKS.get(self.scene.state)
+        if clock is None:
+            return 0
+        cache = getattr(self, clock[0])
+        if not cache.valid:
+            return float('inf')
+        return cache.gif.ms_until_next_frame(getattr(self, clock[1]))
+
+    def request_redraw(self):
+        """Mark the frame dirty; wake the loop if it is idling until the next GIF frame.
+
+        The wake-up is immediate unless the last draw was less than a frame
+        (1/FPS_LIMIT) ago, so a burst of input is drawn at most at FPS_LIMIT.
+        """
+        self._needs_redraw = True
+        if not self._loop_fast and self._loop_after_id is not None:
+            self.root.after_cancel(self._loop_after_id)
+            wait_ms = 1000 / FPS_LIMIT - (time.perf_counter() - self._last_draw_time) * 1000
+            if wait_ms > 0:
+                self._loop_after_id = self.root.after(int(wait_ms) + 1, self.loop)
+            else:
+                self._loop_after_id = self.root.after_idle(self.loop)
+            self._loop_fast = True  # one wake-up is enough until the loop reschedules itself
 
+    def _input(self, handler):
+        """Wrap an input handler so the frame is redrawn right after it runs."""
+        def wrapped(event):
+            self.advance_simulation()  # time up to the input belongs to the state before it
+            result = handler(event)
+            self.request_redraw()
+            return result
+        return wrapped
+
+    def on_motion(self, event):
+        """Record the pointer; the loop hands only the latest position to on_mouse_move."""
+        self.motion_events_raw += 1
+        self._pending_motion = event
+        self.request_redraw()
+
+    def _process_motion(self):
+        event, self._pending_motion = self._pending_motion, None
+        if event is not None:
+            self.motion_events_processed += 1
+            self.on_mouse_move(event)
+
+    def advance_simulation(self):
+        """Run every fixed simulation step that is due by now."""
+        for _ in range(self.frame_clock.advance()):
+            self.step_simulation(self.frame_clock.step)
+
+    def step_simulation(self, dt):
+        """Advance everything time-based by one fixed step of dt seconds."""
         self.scene.update(dt)
         self.update_animation_time(dt)
-        
+        if self.active_menu is not None:
+            self.active_menu.advance()
+        if self.scene.state == SceneManager.STATE_TEARING:
+            self.tear.update(dt, self.scene.fade_counter)
+
         # Update phone game if active
         if self.phone_game_active and self.tea_timer_game:
             # Update tea timer game
             self.tea_timer_game.update(dt)
-            
+
         # Update meditation timer if active
         if self.meditation_active and self.meditation_timer:
             self.meditation_timer.update(dt)
             if not self.meditation_timer.is_active:
                 # Timer finished
                 self.meditation_active = False
-                
+
         # Update coffee brewing timer if brewing
         if self.coffee_brewing:
             self.coffee_brew_timer += dt
@@ -1047,128 +3351,103 @@ class CafeApp:
                 self.coffee_reading_visible = True  # Reset reading visibility for new session
                 self.current_coffee_reading = self.get_random_coffee_reading()  # Generate new reading
                 self.scene.trigger_fade_to_coffee()
-                
-        self.draw()
-
-        # Aim for FPS limit
-        delay = int(1000 / FPS_LIMIT)
-        self.root.after(delay, self.loop)
 
     def update_animation_time(self, dt):
-        # Advance elapsed times (ms)
-        self.elapsed_outside_ms += int(dt * 1000)
-        self.elapsed_inside_ms += int(dt * 1000)
-        self.elapsed_focused_ms += int(dt * 1000)
+        # Advance elapsed times (ms); kept fractional so fixed steps do not drift
+        step_ms = dt * 1000.0
+        self.elapsed_outside_ms += step_ms
+        self.elapsed_inside_ms += step_ms
+        self.elapsed_focused_ms += step_ms
 
     def draw(self):
         if hasattr(self.scene, 'state'):
             if self.scene.state in (SceneManager.STATE_FADING_TO_FOCUSED, SceneManager.STATE_FADING, SceneManager.STATE_TEARING):
                 print(f"[DEBUG] draw state={self.scene.state} fade_counter={self.scene.fade_counter}")
-        self.canvas.delete("all")
+        self.canvas.begin_frame()
         self._frame_refs.clear()
 
-        # Determine frames for each scene state
+        # Determine frames for each scene state (already standardized by the scene caches)
+        self.profiler.enter('lookup')
         frame_out = None
         frame_in = None
         frame_focus = None
         frame_fireplace = None
         frame_coffee = None
         if self.scene.state in (SceneManager.STATE_OUTSIDE, SceneManager.STATE_FADING):
-            frame_out = self.outside.get_frame(self.elapsed_outside_ms) if self.outside.valid else self.placeholder_frame("OUTSIDE")
-        if self.scene.state in (SceneManager.STATE_INSIDE, SceneManager.STATE_FADING, SceneManager.STATE_FADING_TO_FOCUSED, SceneManager.STATE_FADING_TO_FIREPLACE, SceneManager.STATE_FADING_FROM_FIREPLACE, SceneManager.STATE_FADING_TO_COFFEE, SceneManager.STATE_FADING_FROM_COFFEE):
-            frame_in = self.inside.get_frame(self.elapsed_inside_ms) if self.inside.valid else None
-        if self.scene.state in (SceneManager.STATE_FOCUSED, SceneManager.STATE_FADING_TO_FOCUSED):
-            frame_focus = self.focused_scene.get_frame(self.elapsed_focused_ms) if self.focused_scene.valid else None
+            frame_out = self.outside_frames.logical(self.elapsed_outside_ms) if self.outside.valid else self.placeholder_frame("OUTSIDE")
+        if self.scene.state in (SceneManager.STATE_INSIDE, SceneManager.STATE_FADING, SceneManager.STATE_FADING_TO_FOCUSED, SceneManager.STATE_TEARING, SceneManager.STATE_FADING_TO_FIREPLACE, SceneManager.STATE_FADING_FROM_FIREPLACE, SceneManager.STATE_FADING_TO_COFFEE, SceneManager.STATE_FADING_FROM_COFFEE):
+            frame_in = self.inside_frames.logical(self.elapsed_inside_ms) if self.inside.valid else None
+        if self.scene.state in (SceneManager.STATE_FOCUSED, SceneManager.STATE_FADING_TO_FOCUSED, SceneManager.STATE_TEARING):
+            frame_focus = self.focused_frames.logical(self.elapsed_focused_ms) if self.focused_scene.valid else None
         if self.scene.state in (SceneManager.STATE_FIREPLACE, SceneManager.STATE_FADING_TO_FIREPLACE, SceneManager.STATE_FADING_FROM_FIREPLACE):
-            frame_fireplace = self.fireplace.get_frame(self.elapsed_inside_ms) if self.fireplace.valid else None
+            frame_fireplace = self.fireplace_frames.logical(self.elapsed_inside_ms) if self.fireplace.valid else None
         if self.scene.state in (SceneManager.STATE_COFFEE, SceneManager.STATE_FADING_TO_COFFEE, SceneManager.STATE_FADING_FROM_COFFEE):
-            frame_coffee = self.coffee.get_frame(self.elapsed_inside_ms) if self.coffee.valid else self.placeholder_frame("COFFEE", COFFEE_BG_COLOR)
-
-        if frame_out is not None:
-            frame_out = self._standardize_frame(frame_out)
-        if frame_in is not None:
-            frame_in = self._standardize_frame(frame_in)
-        if frame_focus is not None:
-            frame_focus = self._standardize_frame(frame_focus)
-        if frame_fireplace is not None:
-            frame_fireplace = self._standardize_frame(frame_fireplace)
-        if frame_coffee is not None:
-            frame_coffee = self._standardize_frame(frame_coffee)
+            frame_coffee = self.coffee_frames.logical(self.elapsed_inside_ms) if self.coffee.valid else self.placeholder_frame("COFFEE", COFFEE_BG_COLOR)
 
         # Blend logic across transitions
         if self.scene.state == SceneManager.STATE_FADING and frame_out and frame_in:
-            alpha = self.scene.fade_counter / max(1, CROSSFADE_FRAMES)
-            blended = Image.blend(frame_out, frame_in, alpha)
-            disp = self._to_photo(blended)
+            disp = self._crossfade_photo(frame_out, frame_in)
         elif self.scene.state == SceneManager.STATE_FADING_TO_FOCUSED:
             # Provide fallback placeholder focus frame if missing
             if frame_in is None:
                 frame_in = self.placeholder_frame('INSIDE')
             if frame_focus is None:
                 frame_focus = self._focused_placeholder_from(frame_in)
-            alpha = self.scene.fade_counter / max(1, CROSSFADE_FRAMES)
-            blended = Image.blend(frame_in, frame_focus, alpha)
-            disp = self._to_photo(blended)
+            disp = self._crossfade_photo(frame_in, frame_focus)
         elif self.scene.state == SceneManager.STATE_FADING_TO_FIREPLACE:
             # Provide fallback placeholder fireplace frame if missing
             if frame_in is None:
                 frame_in = self.placeholder_frame('INSIDE')
             if frame_fireplace is None:
                 frame_fireplace = self.placeholder_frame('FIREPLACE')
-            alpha = self.scene.fade_counter / max(1, CROSSFADE_FRAMES)
-            blended = Image.blend(frame_in, frame_fireplace, alpha)
-            disp = self._to_photo(blended)
+            disp = self._crossfade_photo(frame_in, frame_fireplace)
         elif self.scene.state == SceneManager.STATE_FADING_FROM_FIREPLACE:
             # Fade from fireplace back to inside
             if frame_fireplace is None:
                 frame_fireplace = self.placeholder_frame('FIREPLACE')
             if frame_in is None:
                 frame_in = self.placeholder_frame('INSIDE')
-            alpha = self.scene.fade_counter / max(1, CROSSFADE_FRAMES)
-            blended = Image.blend(frame_fireplace, frame_in, alpha)
-            disp = self._to_photo(blended)
+            disp = self._crossfade_photo(frame_fireplace, frame_in)
         elif self.scene.state == SceneManager.STATE_FADING_TO_COFFEE:
             # Fade from inside to coffee scene
             if frame_coffee is None:
                 frame_coffee = self.placeholder_frame('COFFEE', COFFEE_BG_COLOR)
             if frame_in is None:
                 frame_in = self.placeholder_frame('INSIDE')
-            alpha = self.scene.fade_counter / max(1, CROSSFADE_FRAMES)
-            blended = Image.blend(frame_in, frame_coffee, alpha)
-            disp = self._to_photo(blended)
+            disp = self._crossfade_photo(frame_in, frame_coffee)
         elif self.scene.state == SceneManager.STATE_FADING_FROM_COFFEE:
             # Fade from coffee scene back to inside
             if frame_coffee is None:
                 frame_coffee = self.placeholder_frame('COFFEE', COFFEE_BG_COLOR)
             if frame_in is None:
                 frame_in = self.placeholder_frame('INSIDE')
-            alpha = self.scene.fade_counter / max(1, CROSSFADE_FRAMES)
-            blended = Image.blend(frame_coffee, frame_in, alpha)
-            disp = self._to_photo(blended)
+            disp = self._crossfade_photo(frame_coffee, frame_in)
         elif self.scene.state == SceneManager.STATE_TEARING:
             # Render tearing effect (with placeholder if needed)
             if frame_in is None:
                 frame_in = self.placeholder_frame('INSIDE')
             if frame_focus is None:
                 frame_focus = self._focused_placeholder_from(frame_in)
-            progress = self.scene.fade_counter / max(1, TEAR_DURATION_FRAMES)
-            tear_img = self.render_torn_transition(frame_in, frame_focus, progress)
-            disp = self._to_photo(tear_img)
+            with self.profiler.phase('blend'):
+                tear_img = self.tear.frame(frame_in, frame_focus, self.scene.fade_counter)
+            disp = self._layer_photo('transition', tear_img)
         else:
-            # choose highest priority frame by current state
+            # choose highest priority frame by current state (display-ready from the scene caches)
             if self.scene.state == SceneManager.STATE_COFFEE and frame_coffee is not None:
-                base = frame_coffee
+                disp = self._scene_photo_for(self.coffee_frames, self.elapsed_inside_ms, frame_coffee)
             elif self.scene.state == SceneManager.STATE_FIREPLACE and frame_fireplace is not None:
-                base = frame_fireplace
+                disp = self._scene_photo_for(self.fireplace_frames, self.elapsed_inside_ms, frame_fireplace)
             elif self.scene.state == SceneManager.STATE_FOCUSED and frame_focus is not None:
-                base = frame_focus
+                disp = self._scene_photo_for(self.focused_frames, self.elapsed_focused_ms, frame_focus)
             elif self.scene.state in (SceneManager.STATE_INSIDE, SceneManager.STATE_FADING_TO_FOCUSED) and frame_in is not None:
-                base = frame_in
+                disp = self._scene_photo_for(self.inside_frames, self.elapsed_inside_ms, frame_in)
             else:
-                base = frame_out
-            disp = self._to_photo(base)
+                disp = self._scene_photo_for(self.outside_frames, self.elapsed_outside_ms, frame_out)
+        self.profiler.leave()
         self.canvas.create_image(0, 0, anchor="nw", image=disp)
         self._frame_refs.append(disp)
+        if self.scene.state == SceneManager.STATE_TEARING:
+            self.draw_tear_debris()
 
         # Draw coffee scene overlay when in coffee mode
         if self.scene.state == SceneManager.STATE_COFFEE:
@@ -1179,9 +3458,9 @@ class CafeApp:
             x1,y1,x2,y2 = DOOR_HITBOX
             self.canvas.create_rectangle(x1*self.scale, y1*self.scale, x2*self.scale, y2*self.scale, outline="#ff0000")
 
-        if not self.outside.valid:
+        if not self.outside.valid and not self.loader.is_pending('outside'):
             self.canvas.create_text(10, 10, anchor="nw", fill="#fff", text="Add outside.gif", font=("Courier New", 10, "bold"))
-        if not self.inside.valid:
+        if not self.inside.valid and not self.loader.is_pending('inside'):
             self.canvas.create_text(10, 26, anchor="nw", fill="#fff", text="Add inside.gif", font=("Courier New", 10, "bold"))
         if self.scene.state in (SceneManager.STATE_FOCUSED, SceneManager.STATE_FADING_TO_FOCUSED, SceneManager.STATE_TEARING) and not self.focused_scene.valid:
             self.canvas.create_text(10, 42, anchor="nw", fill="#fff", text="(focused placeholder)", font=("Courier New", 10, "bold"))
@@ -1191,9 +3470,18 @@ class CafeApp:
             self._draw_hitbox(BOOK_HITBOX, '#00ff00')
             self._draw_hitbox(CALENDAR_HITBOX, '#00bfff')
 
+        if SHOW_PHOTO_STATS:
+            rate = self.layers.allocations_per_second()
+            self.canvas.create_text(6, self.display_height - 6, anchor="sw", fill="#fff", text=f"PhotoImage allocs/s: {rate:.1f}", font=("Courier New", 10, "bold"))
+        if SHOW_FRAME_STATS:
+            clock = self.frame_clock
+            self.canvas.create_text(6, self.display_height - 22, anchor="sw", fill="#fff", font=("Courier New", 10, "bold"),
+                                    text=f"missed deadlines: {clock.missed}/{clock.frames}  dropped sim: {clock.dropped_s:.2f}s  "
+                                         f"canvas calls: {self.canvas.last_frame_calls}")
+
         # Activate menu first time we are inside
-        if ENABLE_MOOD_MENU and self.scene.state == SceneManager.STATE_INSIDE and not self.menu_active and self.menu_selected_index == -1:
-            self.activate_mood_menu()
+        if ENABLE_MOOD_MENU and self.scene.state == SceneManager.STATE_INSIDE and self.active_menu is None and self.menu_selected_index == -1:
+            self.open_menu('mood')
 
         # Show coffee brewing message when brewing
         if self.coffee_brewing:
@@ -1214,35 +3502,11 @@ class CafeApp:
                                       fill="#d7ccc8", 
                                       font=("Courier New", 72, "bold"))
 
-        if self.menu_active:
-            # advance animation progress
-            if self.menu_anim_progress < 1.0:
-                self.menu_anim_progress = min(1.0, self.menu_anim_progress + MOOD_MENU_ANIM_SPEED)
-            self.draw_mood_menu()
-            # Also draw music button when menu is active if a mood was previously selected
-            if self.menu_selected_index != -1:
-                self.draw_cozy_music_button()
-        elif self.cozy_submenu_active:
-            self.draw_cozy_submenu()
-        elif self.focused_submenu_active:
-            self.draw_focused_submenu()
-        elif self.creative_submenu_active:
-            self.draw_creative_submenu()
-        elif self.menu_selected_index != -1:
-            self.draw_selection_badge()
-            self.draw_cozy_music_button()
-            
-        # Draw phone game overlay
-        if self.phone_game_active:
-            self.draw_phone_game()
-            
-        # Draw meditation overlay
-        if self.meditation_active:
-            self.draw_meditation()
-            
-        # Draw to-do list in focused scene
-        if self.todo_list_active:
-            self.draw_todo_list_overlay()
+        with self.profiler.phase('overlays'):
+            if OVERLAY_BACKEND == 'pil':
+                self._draw_overlay_layer()
+            else:
+                self.draw_overlays()
 
         # Hover highlight for focused interactive zones
         if self.scene.state == SceneManager.STATE_FOCUSED:
@@ -1278,73 +3542,81 @@ class CafeApp:
             self.canvas.create_line(cx, cy - size, cx, cy + size, fill="#fffbcc")
             self.canvas.create_rectangle(cx-2, cy-2, cx+2, cy+2, outline="#ff2", fill="#ff2")
 
+        # Frame timing HUD (replaces the coordinate overlay while shown)
+        if self.perf_hud_visible:
+            runs = self.text_runs.stats()
+            hud = self.profiler.hud_lines() + [f"text runs  {runs['size']}/{runs['capacity']}  hit {runs['hit_rate'] or 0:.0%}  "
+                                               f"evicted {runs['evictions']}",
+                                               f"pointer    {self.motion_events_raw} events  handled {self.motion_events_processed}"]
+            self.canvas.create_text(4, 4, anchor='nw', text="\n".join(hud), fill='#ffaa44', font=("Courier New", 10, 'bold'))
         # Coordinate overlay
-        if SHOW_COORDS:
+        elif SHOW_COORDS:
             lx, ly = self.current_logical_xy
             self.canvas.create_text(4, 4, anchor='nw', text=f"{lx},{ly}", fill='#ffaa44', font=("Courier New", 10, 'bold'))
 
+        self.canvas.end_frame()
+
+    def draw_overlays(self):
+        """Menus, selection badge and the phone game / meditation / to-do overlays."""
+        menu = self.active_menu
+        if menu is not None:
+            self.draw_menu(menu)
+            # Also draw music button over the mood menu if a mood was previously selected
+            if menu.name == 'mood' and self.menu_selected_index != -1:
+                self.draw_cozy_music_button()
+        elif self.menu_selected_index != -1:
+            self.draw_selection_badge()
+            self.draw_cozy_music_button()
+
+        # Draw phone game overlay
+        if self.phone_game_active:
+            self.draw_phone_game()
+
+        # Draw meditation overlay
+        if self.meditation_active:
+            self.draw_meditation()
+
+        # Draw to-do list in focused scene
+        if self.todo_list_active:
+            self.draw_todo_list_overlay()
+
+    def _draw_overlay_layer(self):
+        """draw_overlays() rasterized into one image and shown as a single canvas item."""
+        compositor = self.overlay_compositor
+        canvas, self.canvas = self.canvas, compositor
+        compositor.begin()
+        try:
+            self.draw_overlays()
+        finally:
+            self.canvas = canvas
+        layer, box = compositor.end()
+        if layer is None:
+            return
+        x1, y1, x2, y2 = self.scale_map.display_box(box)
+        if x2 <= x1 or y2 <= y1:
+            return
+        photo = self.layers.get('overlays', compositor.version)
+        if photo is None:
+            if layer.size != (x2 - x1, y2 - y1):
+                layer = layer.resize((x2 - x1, y2 - y1), Image.NEAREST)
+            photo = self.layers.put('overlays', layer, compositor.version)
+        self.canvas.create_image(x1, y1, anchor='nw', image=photo)
+        self._frame_refs.append(photo)
+
     # -------- Torn Transition --------
     def start_torn_transition(self):
-        # Generate jittered edge points across width
-        w, h = self.width, self.height
-        self.tear_points = []
-        for i in range(TEAR_EDGE_SEGMENTS+1):
-            x = int(i * w / TEAR_EDGE_SEGMENTS)
-            jitter = random.randint(-TEAR_WOBBLE_Y, TEAR_WOBBLE_Y)
-            y = int(h * 0.15 + (h*0.7 * (i/TEAR_EDGE_SEGMENTS))) + jitter
-            self.tear_points.append((x, y))
-        # Debris
-        self.tear_debris = []
-        for _ in range(TEAR_DEBRIS_COUNT):
-            px = random.randint(0, w)
-            py = random.randint(0, h)
-            vx = random.uniform(-1.5,1.5)
-            vy = random.uniform(-2.5,-0.5)
-            life = random.uniform(0.4,1.2)
-            self.tear_debris.append({'x':px,'y':py,'vx':vx,'vy':vy,'life':life,'age':0})
+        self.tear.start()
         if self.tear_sound:
             try:
                 self.tear_sound.play()
             except Exception:
                 pass
 
-    def render_torn_transition(self, img_in, img_focus, progress: float):
-        # progress 0..1: reveal from top-left to bottom-right masked by tear polygon
-        w, h = self.width, self.height
-        base_in = img_in.copy()
-        reveal = img_focus.copy()
-        # Build a vertical split proportion based on progress (simulate paper peel)
-        # Determine path along tear points, then offset horizontally
-        mask = Image.new('L', (w,h), 0)
-        import math
-        from PIL import ImageDraw
-        draw = ImageDraw.Draw(mask)
-        # compute dynamic x offset of edge (pulling to right)
-        pull = int(progress * w * 0.95)
-        # build polygon: edge -> bottom-right corner -> top-right corner
-        poly = []
-        for (x,y) in self.tear_points:
-            poly.append((min(w-1, x + pull), y))
-        poly.append((w-1,h-1))
-        poly.append((w-1,0))
-        draw.polygon(poly, fill=255)
-        # composite reveal over base
-        comp = Image.composite(reveal, base_in, mask)
-        # fringe highlight (paper edge)
-        from PIL import ImageFilter
-        edge_mask = mask.filter(ImageFilter.BoxBlur(2))
-        edge_img = Image.new('RGBA',(w,h),(0,0,0,0))
-        edge_draw = ImageDraw.Draw(edge_img)
-        # draw jagged edge along points
-        scaled = []
-        for (x,y) in self.tear_points:
-            scaled.append((min(w-1, x + pull), y))
-        for i in range(len(scaled)-1):
-            x1,y1 = scaled[i]
-            x2,y2 = scaled[i+1]
-            edge_draw.line((x1,y1,x2,y2), fill=(255,255,255,180), width=2)
-        comp.alpha_composite(edge_img)
-        return comp
+    def draw_tear_debris(self):
+        px = self.scale
+        for x, y, size in self.tear.live_debris():
+            self.canvas.create_rectangle(int(x)*px, int(y)*px, (int(x)+size)*px, (int(y)+size)*px,
+                                         fill='#%02x%02x%02x' % TEAR_BG_SHADE[:3], outline='')
 
     # -------- Background Music --------
     def pick_new_music(self):
@@ -1361,68 +3633,258 @@ class CafeApp:
         except Exception as e:
             messagebox.showerror('Music Error', f'Could not play file:\n{e}')
 
-    def draw_cozy_music_button(self):
-        # Always show the music button when in the inside scene
-        if self.scene.state != SceneManager.STATE_INSIDE:
-            self.cozy_music_button = None
-            return
-        
-        # Show music button always when inside, regardless of mood selection
-        # draw top-right small button
-        w = self.width * self.scale
-        pad = 6
-        bw, bh = 120, 28
-        x1 = w - bw - pad
-        y1 = pad
-        x2 = x1 + bw
-        y2 = y1 + bh
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill='#22201b', outline='#c29552', width=2)
-        self.canvas.create_text((x1+x2)//2, (y1+y2)//2, text='Change Music', fill='#ffd9a3', font=('Courier New', 10, 'bold'))
-        self.cozy_music_button = (x1, y1, x2, y2)
+    def draw_cozy_music_button(self):
+        # Always show the music button when in the inside scene
+        if self.scene.state != SceneManager.STATE_INSIDE:
+            self.cozy_music_button = None
+            return
+        
+        # Show music button always when inside, regardless of mood selection
+        # draw top-right small button
+        w = self.display_width
+        pad = 6
+        bw, bh = 120, 28
+        x1 = w - bw - pad
+        y1 = pad
+        x2 = x1 + bw
+        y2 = y1 + bh
+        self.canvas.create_rectangle(x1, y1, x2, y2, fill='#22201b', outline='#c29552', width=2)
+        self.canvas.create_text((x1+x2)//2, (y1+y2)//2, text='Change Music', fill='#ffd9a3', font=('Courier New', 10, 'bold'))
+        self.cozy_music_button = (x1, y1, x2, y2)
+
+    def _display_image(self, pil_img):
+        if pil_img is None:
+            pil_img = self.placeholder_frame("MISSING")
+        if pil_img.size == self.scale_map.logical_size:
+            pil_img = self.scale_map.apply(pil_img)
+        elif pil_img.size != self.scale_map.display_size and self.scale != 1:
+            # sprites (e.g. the phone) scale by the display factor instead of filling the display
+            w, h = pil_img.size
+            pil_img = pil_img.resize((max(1, round(w*self.scale)), max(1, round(h*self.scale))), Image.NEAREST)
+        if pil_img.mode not in ('RGB', 'RGBA'):
+            pil_img = pil_img.convert('RGB')  # compact 'P' frames expand only when shown
+        return pil_img
+
+    def _layer_photo(self, name, pil_img, key=None):
+        """PhotoImage of a logical image, reusing layer `name`'s PhotoImage (see PhotoLayers)."""
+        photo = self.layers.get(name, key)
+        if photo is None:
+            photo = self.layers.put(name, self._display_image(pil_img), key, source=pil_img)
+        return photo
+
+    # -------- Crossfades --------
+    # Fade state -> ((cache, clock) it fades from, (cache, clock) it fades to)
+    CROSSFADE_SCENES = {
+        SceneManager.STATE_FADING: (('outside_frames', 'elapsed_outside_ms'), ('inside_frames', 'elapsed_inside_ms')),
+        SceneManager.STATE_FADING_TO_FOCUSED: (('inside_frames', 'elapsed_inside_ms'), ('focused_frames', 'elapsed_focused_ms')),
+        SceneManager.STATE_FADING_TO_FIREPLACE: (('inside_frames', 'elapsed_inside_ms'), ('fireplace_frames', 'elapsed_inside_ms')),
+        SceneManager.STATE_FADING_FROM_FIREPLACE: (('fireplace_frames', 'elapsed_inside_ms'), ('inside_frames', 'elapsed_inside_ms')),
+        SceneManager.STATE_FADING_TO_COFFEE: (('inside_frames', 'elapsed_inside_ms'), ('coffee_frames', 'elapsed_inside_ms')),
+        SceneManager.STATE_FADING_FROM_COFFEE: (('coffee_frames', 'elapsed_inside_ms'), ('inside_frames', 'elapsed_inside_ms')),
+    }
+
+    def arm_crossfade(self):
+        """Called by SceneManager when a fade starts: blend the rest of a static fade on the worker now.
+
+        Fades with a side still on its placeholder are blended on demand.
+        """
+        sides = self.CROSSFADE_SCENES.get(self.scene.state)
+        if not sides or not self._crossfade_is_static():
+            return
+        frames = []
+        for cache_attr, clock_attr in sides:
+            cache = getattr(self, cache_attr)
+            if not cache.valid:
+                return
+            frames.append(cache.logical(getattr(self, clock_attr)))
+        self.crossfades.prefetch(frames[0], frames[1], self.scene.fade_counter + 1)
+
+    def _crossfade_photo(self, frame_from, frame_to):
+        step = self.scene.fade_counter
+        with self.profiler.phase('blend'):
+            frame = self.crossfades.frame(frame_from, frame_to, step)
+        return self.layers.put('transition', frame)
+
+    def _crossfade_is_static(self):
+        """True if neither side of the current fade changes frame before the fade ends."""
+        remaining_ms = (CROSSFADE_FRAMES - self.scene.fade_counter) * 1000 / SIM_STEP_HZ
+        for cache_attr, clock_attr in self.CROSSFADE_SCENES.get(self.scene.state, ()):
+            cache = getattr(self, cache_attr)
+            if cache.valid and cache.gif.ms_until_next_frame(getattr(self, clock_attr)) < remaining_ms:
+                return False
+        return True
+
+    # -------- Scene Frame Caches --------
+    # (AnimatedGif attribute, SceneFrameCache attribute) for every scene
+    SCENE_ATTRS = (
+        ('outside', 'outside_frames'),
+        ('inside', 'inside_frames'),
+        ('focused_scene', 'focused_frames'),
+        ('fireplace', 'fireplace_frames'),
+        ('coffee', 'coffee_frames'),
+    )
+
+    def build_scene_caches(self):
+        """(Re)create per-scene frame caches for the current logical size and scale."""
+        for gif_attr, cache_attr in self.SCENE_ATTRS:
+            gif = getattr(self, gif_attr)
+            if getattr(self, cache_attr, None) is not None:
+                getattr(self, cache_attr).release()
+            setattr(self, cache_attr, SceneFrameCache(gif, self.scale_map, self.profiler))
+        self._scene_photo_key = None  # (cache id, frame index) of _scene_photo
+        self._scene_photo = None
+
+    def install_scene(self, gif_attr, gif):
+        """Swap a freshly loaded GIF in for its placeholder (Tk thread only)."""
+        cache_attr = dict(self.SCENE_ATTRS)[gif_attr]
+        setattr(self, gif_attr, gif)
+        getattr(self, cache_attr).release()
+        setattr(self, cache_attr, SceneFrameCache(gif, self.scale_map, self.profiler))
+        self._scene_photo_key = None
+        self.request_redraw()
+
+    # -------- Background Asset Loading --------
+    def load_assets_async(self):
+        """Queue scene GIFs and sounds on the loader, most urgently needed first."""
+        def load_gif(path):
+            gif = AnimatedGif(path, size=(self.width, self.height))
+            if gif.valid:
+                gif.frame_at(0)  # decode the first frame off the Tk thread too
+            return gif
+
+        def queue_scene(gif_attr):
+            path = getattr(self, gif_attr).path
+            if os.path.isfile(path):
+                self.loader.submit(gif_attr, lambda: load_gif(path),
+                                   lambda gif: self.install_scene(gif_attr, gif))
+
+        def queue_sound(name, path, volume, on_ready):
+            if not self.mixer_ready or not os.path.isfile(path):
+                return
+            def load():
+                snd = pygame.mixer.Sound(path)
+                snd.set_volume(volume)
+                return snd
+            self.loader.submit(name, load, on_ready)
+
+        def on_rain(snd):
+            self.rain_sound = snd
+            # Play on its own channel looping (-1)
+            self.rain_channel = snd.play(loops=-1)
+            self.rain_loaded = True
+
+        def on_music(snd):
+            if self.current_music_path is not None:
+                return  # user already picked other music while the default was loading
+            self.background_music = snd
+            self.music_channel = snd.play(loops=-1)
+            self.music_loaded = True
+            self.current_music_path = MUSIC_DEFAULT
+
+        def on_fireplace(snd):
+            self.fireplace_sound = snd
+            self.fireplace_loaded = True
+
+        def on_coffee(snd):
+            self.coffee_sound = snd
+            self.coffee_loaded = True
+
+        def on_hover(snd):
+            self.hover_sound = snd
+            self.hover_sound_loaded = True
+
+        def on_typing(snd):
+            self.typing_sound = snd
+            self.typing_sound_loaded = True
+
+        def on_pageflip(snd):
+            self.pageflip_sound = snd
+            self.pageflip_sound_loaded = True
+
+        def on_tear(snd):
+            self.tear_sound = snd
 
-    def _to_photo(self, pil_img):
-        if pil_img is None:
-            pil_img = self.placeholder_frame("MISSING")
-        if self.scale != 1:
-            pil_img = pil_img.resize((self.width*self.scale, self.height*self.scale), Image.NEAREST)
-        return ImageTk.PhotoImage(pil_img)
-
-    def _standardize_frame(self, frame_img: Image.Image) -> Image.Image:
-        """Return a frame exactly (self.width, self.height) using RESIZE_MODE."""
-        target_w, target_h = self.width, self.height
-        if frame_img.size == (target_w, target_h):
-            return frame_img
-        fw, fh = frame_img.size
-        if RESIZE_MODE == 'stretch':
-            return frame_img.resize((target_w, target_h), Image.NEAREST)
-        if RESIZE_MODE == 'letterbox':
-            # scale to fit inside (no crop) then pad
-            scale_ratio = min(target_w / fw, target_h / fh)
-            new_w = max(1, int(fw * scale_ratio))
-            new_h = max(1, int(fh * scale_ratio))
-            resized = frame_img.resize((new_w, new_h), Image.NEAREST)
-            canvas = Image.new('RGBA', (target_w, target_h), (0,0,0,255))
-            ox = (target_w - new_w)//2
-            oy = (target_h - new_h)//2
-            canvas.paste(resized, (ox, oy))
-            return canvas
-        # fill (cover): scale to cover entire target then center crop
-        scale_ratio = max(target_w / fw, target_h / fh)
-        new_w = max(1, int(fw * scale_ratio))
-        new_h = max(1, int(fh * scale_ratio))
-        resized = frame_img.resize((new_w, new_h), Image.NEAREST)
-        # center crop
-        left = (new_w - target_w)//2
-        top = (new_h - target_h)//2
-        right = left + target_w
-        bottom = top + target_h
-        return resized.crop((left, top, right, bottom))
-
-    def compute_scale(self) -> int:
+        queue_scene('outside')
+        queue_scene('inside')
+        if ENABLE_RAIN_AMBIENCE:
+            queue_sound('rain', RAIN_SOUND, RAIN_VOLUME, on_rain)
+        queue_sound('music', MUSIC_DEFAULT, MUSIC_VOLUME, on_music)
+        if ENABLE_MOOD_MENU:
+            queue_sound('hover', HOVER_SOUND, HOVER_VOLUME, on_hover)
+        queue_scene('focused_scene')
+        queue_scene('fireplace')
+        queue_scene('coffee')
+        queue_sound('fireplace_sound', FIREPLACE_SOUND, 0.95, on_fireplace)  # moderate volume
+        queue_sound('coffee_sound', COFFEE_SOUND, 1.0, on_coffee)  # maximum volume for brewing
+        queue_sound('typing', TYPING_SOUND, 0.8, on_typing)
+        queue_sound('pageflip', PAGEFLIP_SOUND, 0.7, on_pageflip)
+        queue_sound('tear', TORN_SOUND, 0.6, on_tear)
+
+    def _scene_photo_for(self, cache, elapsed_ms, fallback):
+        """PhotoImage for a scene's current frame, reused while the frame index is unchanged.
+
+        Invalid scenes fall back to converting the given (logical) fallback frame.
+        """
+        if not cache.valid:
+            return self._layer_photo('transition', fallback)
+        idx = cache.index(elapsed_ms)
+        key = (id(cache), idx)
+        if key == self._scene_photo_key:
+            return self._scene_photo
+        box = self._scene_update_box(cache, idx) if DIRTY_RECTS else False
+        if box is False:
+            self._scene_photo = self._layer_photo('scene', cache.display_at(idx))
+        elif box is not None:
+            self._paste_region(self._scene_photo, cache.display_at(idx), box)
+        self._scene_photo_key = key
+        return self._scene_photo
+
+    def _scene_update_box(self, cache, idx):
+        """Logical box to re-upload when _scene_photo advances to idx of cache.
+
+        None means the frame is unchanged; False means upload the whole frame
+        (different scene, long jump, or a change too large to be worth a region).
+        """
+        if self._scene_photo is None or self._scene_photo_key is None or self._scene_photo_key[0] != id(cache):
+            return False
+        gif = cache.gif
+        steps = (idx - self._scene_photo_key[1]) % gif.frame_count
+        if steps > DIRTY_RECT_MAX_STEPS:
+            return False
+        box = None
+        for k in range(steps):
+            step_box = gif.dirty_box((idx - k) % gif.frame_count)
+            if step_box is None:
+                continue
+            box = step_box if box is None else (min(box[0], step_box[0]), min(box[1], step_box[1]),
+                                                max(box[2], step_box[2]), max(box[3], step_box[3]))
+        if box is not None and (box[2]-box[0]) * (box[3]-box[1]) > DIRTY_RECT_MAX_FRACTION * cache.width * cache.height:
+            return False
+        return box
+
+    def _paste_region(self, photo, frame, box):
+        """Upload only `box` (logical coords) of a display-size frame into an existing PhotoImage."""
+        x1, y1, x2, y2 = self.scale_map.display_box(box)
+        if x2 <= x1 or y2 <= y1:
+            return  # downscaled display shows none of the box's pixels
+        region = frame.crop((x1, y1, x2, y2))
+        if region.mode not in ('RGB', 'RGBA'):
+            region = region.convert('RGB')
+        region_photo = self.layers.new_photo(region)
+        with self.profiler.phase('upload'):
+            self.root.tk.call(str(photo), 'copy', str(region_photo), '-to', x1, y1, '-compositingrule', 'set')
+
+    def compute_scale(self):
         if SCALE_MODE == 'none':
             return 1
         if SCALE_MODE == 'fixed':
             return max(1, int(FIXED_SCALE))
+        if SCALE_MODE == 'fractional':
+            if FRACTIONAL_FIT_SCREEN:
+                bound_w, bound_h = self.root.winfo_screenwidth(), self.root.winfo_screenheight()
+            else:
+                bound_w, bound_h = MAX_DISPLAY_WIDTH, MAX_DISPLAY_HEIGHT
+            return min(bound_w / self.width, bound_h / self.height)
         if SCALE_MODE == 'auto':
             # largest integer scale that keeps within max display bounds
             for s in range(8, 0, -1):  # try downwards
@@ -1432,38 +3894,47 @@ class CafeApp:
         # fallback
         return 1
 
-    def placeholder_frame(self, label: str):
-        img = Image.new('RGBA', (self.width, self.height), (20,20,20,255))
+    def placeholder_frame(self, label: str, color=(20, 20, 20)):
+        """Flat logical-size stand-in for a missing scene, shared per (size, label, colour).
+
+        The returned image is shared between callers and must not be modified.
+        """
+        key = ((self.width, self.height), label, color)
+        img = self._placeholders.get(key)
+        if img is None:
+            img = self._placeholders[key] = Image.new('RGB', (self.width, self.height), color)
         return img
 
+    # Bluish desaturated tint for the focused placeholder: each output channel is
+    # scale * (r+g+b)/3 + offset, as a convert() matrix
+    FOCUSED_PLACEHOLDER_TINT = (
+        0.55/3, 0.55/3, 0.55/3, 8,
+        0.6/3, 0.6/3, 0.6/3, 12,
+        0.9/3, 0.9/3, 0.9/3, 50,
+    )
+
     def _focused_placeholder_from(self, base_img: Image.Image):
         """Generate a visually distinct placeholder for focused scene when focused.gif missing."""
-        try:
-            img = base_img.copy().convert('RGBA')
-        except Exception:
-            img = self.placeholder_frame('FOCUSED')
-        px = img.load()
-        w,h = img.size
-        for y in range(h):
-            for x in range(w):
-                r,g,b,a = px[x,y]
-                avg = (r+g+b)//3
-                # bluish desaturated tint to differentiate
-                r = int((avg*0.55) + 8)
-                g = int((avg*0.6) + 12)
-                b = int((avg*0.9) + 50)
-                dx = (x - w/2)/(w/2)
-                dy = (y - h/2)/(h/2)
-                dist = (dx*dx + dy*dy)**0.5
-                if dist > 0.65:
-                    fade = min(1.0, (dist-0.65)/0.5)
-                    dim = 1 - fade*0.55
-                    r = int(r*dim)
-                    g = int(g*dim)
-                    b = int(b*dim)
-                px[x,y] = (r,g,b,a)
+        img = self._focused_placeholders.get((base_img,))
+        if img is None:
+            tinted = _as_mode(base_img, 'RGB').convert('RGB', self.FOCUSED_PLACEHOLDER_TINT)
+            vignette = self._vignette_mask(tinted.size).convert('RGB')
+            img = self._focused_placeholders.put((base_img,), None, ImageChops.multiply(tinted, vignette))
         return img
 
+    def _vignette_mask(self, size):
+        """Multiplicative 'L' vignette: full brightness within 0.65 of the half-size ellipse, 45% from 1.15 out."""
+        mask = self._vignettes.get(size)
+        if mask is None:
+            # radial_gradient is 256x256, 0 at the centre and ~180 at the edge midpoints (255 in the corners)
+            lut = []
+            for v in range(256):
+                fade = min(1.0, max(0.0, (v/180 - 0.65) / 0.5))
+                lut.append(int(round(255 * (1 - fade*0.55))))
+            mask = Image.radial_gradient('L').point(lut).resize(size, Image.BILINEAR)
+            self._vignettes[size] = mask
+        return mask
+
     # -------- Leaf Cursor Helpers --------
     def load_leaf_cursor(self):
         if not os.path.isfile(LEAF_IMAGE):
@@ -1506,8 +3977,8 @@ class CafeApp:
         else:
             if self.scale != 1:
                 w, h = img.size
-                img = img.resize((w*self.scale, h*self.scale), Image.NEAREST)
-        self.leaf_img_scaled = ImageTk.PhotoImage(img)
+                img = img.resize((max(1, round(w*self.scale)), max(1, round(h*self.scale))), Image.NEAREST)
+        self.leaf_img_scaled = self.layers.put('cursor', img)
 
     def on_mouse_move(self, event):
         # event.x / event.y are in display (scaled) coords
@@ -1516,69 +3987,20 @@ class CafeApp:
             self.cursor_x = event.x
             self.cursor_y = event.y
         else:
-            self.cursor_x = event.x // self.scale
-            self.cursor_y = event.y // self.scale
+            self.cursor_x, self.cursor_y = self.scale_map.to_logical(event.x, event.y)
         # Always store logical coords for debug overlay
-        self.current_logical_xy = (event.x // self.scale, event.y // self.scale)
+        self.current_logical_xy = self.scale_map.to_logical(event.x, event.y)
         
-        # Hover detection for cozy submenu
-        if self.cozy_submenu_active:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
-            new_hover = -1
-            for idx, (x1,y1,x2,y2) in self.cozy_submenu_boxes:
-                if x1 <= lx <= x2 and y1 <= ly <= y2:
-                    new_hover = idx
-                    break
-            if new_hover != self.cozy_submenu_hover_index:
-                self.cozy_submenu_hover_index = new_hover
-                if new_hover != -1 and self.hover_sound_loaded:
-                    try:
-                        self.hover_sound.play()
-                    except Exception:
-                        pass
-            return
-            
-        # Hover detection for creative submenu
-        if self.creative_submenu_active:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
-            new_hover = -1
-            for idx, (x1,y1,x2,y2) in self.creative_submenu_boxes:
-                if x1 <= lx <= x2 and y1 <= ly <= y2:
-                    new_hover = idx
-                    break
-            if new_hover != self.creative_submenu_hover_index:
-                self.creative_submenu_hover_index = new_hover
-                if new_hover != -1 and self.hover_sound_loaded:
-                    try:
-                        self.hover_sound.play()
-                    except Exception:
-                        pass
-            return
-            
-        # Hover detection for focused submenu
-        if self.focused_submenu_active:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
-            new_hover = -1
-            for idx, (x1,y1,x2,y2) in self.focused_submenu_boxes:
-                if x1 <= lx <= x2 and y1 <= ly <= y2:
-                    new_hover = idx
-                    break
-            if new_hover != self.focused_submenu_hover_index:
-                self.focused_submenu_hover_index = new_hover
-                if new_hover != -1 and self.hover_sound_loaded:
-                    try:
-                        self.hover_sound.play()
-                    except Exception:
-                        pass
+        # Hover detection for the open menu (logical coordinates)
+        if self.active_menu is not None:
+            lx, ly = self.current_logical_xy
+            if self.active_menu.set_hover(self.active_menu.hit_test(lx, ly)) and self.active_menu.hover != -1:
+                self._play_hover_sound()
             return
         
         # Hover detection for todo list buttons
         if self.todo_list_active and hasattr(self, 'todo_button_boxes'):
-            lx = event.x // self.scale
-            ly = event.y // self.scale
+            lx, ly = self.scale_map.to_logical(event.x, event.y)
             new_hover = -1
             for idx, (x1,y1,x2,y2) in enumerate(self.todo_button_boxes):
                 if x1 <= lx <= x2 and y1 <= ly <= y2:
@@ -1586,31 +4008,33 @@ class CafeApp:
                     break
             if new_hover != self.todo_button_hover:
                 self.todo_button_hover = new_hover
-                if new_hover != -1 and self.hover_sound_loaded:
-                    try:
-                        self.hover_sound.play()
-                    except Exception:
-                        pass
+                if new_hover != -1:
+                    self._play_hover_sound()
             return
-            
-        # Hover detection for menu (use logical coordinates)
-        if self.menu_active:
-            lx = event.x // self.scale
-            ly = event.y // self.scale
-            new_hover = -1
-            for idx, (x1,y1,x2,y2) in self.menu_boxes:
-                if x1 <= lx <= x2 and y1 <= ly <= y2:
-                    new_hover = idx
-                    break
-            if new_hover != self.menu_hover_index:
-                self.menu_hover_index = new_hover
-                if new_hover != -1 and self.hover_sound_loaded:
-                    try:
-                        self.hover_sound.play()
-                    except Exception:
-                        pass
+
+    def _play_hover_sound(self):
+        """Play the hover blip unless one started less than HOVER_SOUND_MIN_INTERVAL_MS ago."""
+        if not self.hover_sound_loaded:
+            return
+        now = time.perf_counter()
+        if (now - self._last_hover_sound) * 1000 < HOVER_SOUND_MIN_INTERVAL_MS:
+            return
+        self._last_hover_sound = now
+        try:
+            self.hover_sound.play()
+        except Exception:
+            pass
+
+    def toggle_perf_hud(self, event=None):
+        """Show/hide the frame timing HUD (PERF_HUD_KEY)."""
+        self.perf_hud_visible = not self.perf_hud_visible
 
     def on_close(self):
+        self.loader.shutdown()
+        self.profiler.close()
+        if self.motion_events_raw:
+            print(f"[INFO] Pointer motion: {self.motion_events_raw} events, {self.motion_events_processed} handled "
+                  f"({1 - self.motion_events_processed / self.motion_events_raw:.0%} coalesced)")
         try:
             if pygame.mixer.get_init():
                 # Stop rain if playing
@@ -1646,7 +4070,7 @@ class CafeApp:
                     # For other states, immediate transition to inside
                     self.scene.state = SceneManager.STATE_INSIDE
                 # Reactivate the menu when returning from focus mode, fireplace, or coffee
-                self.activate_mood_menu()
+                self.open_menu('mood')
                 return
         
         # Coffee brewing controls - allow ESC to cancel brewing
@@ -1663,7 +4087,7 @@ class CafeApp:
             if event.keysym == 'Escape':
                 self.meditation_active = False
                 self.meditation_timer = None
-                self.cozy_submenu_active = True  # Return to cozy submenu
+                self.open_menu('cozy', restart=False)  # Return to cozy submenu
                 return
                 
         # Phone game controls - Tea Timer Challenge
@@ -1671,7 +4095,7 @@ class CafeApp:
             if event.keysym == 'Escape':
                 self.phone_game_active = False
                 self.tea_timer_game = None
-                self.cozy_submenu_active = True  # Return to cozy submenu
+                self.open_menu('cozy', restart=False)  # Return to cozy submenu
                 return
             elif event.keysym == 'Return':
                 # Only Enter key triggers tea timing attempt
@@ -1693,7 +4117,7 @@ class CafeApp:
                     # Exit to-do list
                     self.save_todo_items()
                     self.todo_list_active = False
-                    self.focused_submenu_active = True
+                    self.open_menu('focused', restart=False)
                 return
             elif event.keysym.lower() in ('w', 's'):
                 if not self.todo_editing and not self.todo_input_mode and self.todo_items:
@@ -1741,138 +4165,25 @@ class CafeApp:
                     self.todo_edit_text = self.todo_items[self.todo_selected_index]['text']
             return
                 
-        # Cozy submenu navigation
-        if self.cozy_submenu_active:
-            if event.keysym in ('Up','Down'):
-                if self.cozy_submenu_hover_index == -1:
-                    self.cozy_submenu_hover_index = 0
-                else:
-                    delta = -1 if event.keysym == 'Up' else 1
-                    total = len(COZY_SUBMENU_ITEMS)
-                    self.cozy_submenu_hover_index = (self.cozy_submenu_hover_index + delta) % total
-                if self.hover_sound_loaded:
-                    try:
-                        self.hover_sound.play()
-                    except Exception:
-                        pass
-            elif event.keysym == 'Return':
-                if self.cozy_submenu_hover_index != -1:
-                    label, _ = COZY_SUBMENU_ITEMS[self.cozy_submenu_hover_index]
-                    self.cozy_submenu_selected = label
-                    self.cozy_submenu_active = False
-                    if label == "Phone":
-                        self.start_phone_game()
-                    elif label == "Meditate":
-                        self.start_meditation()
-                    elif label == "Fireplace":
-                        self.toggle_fireplace()
-                    elif label == "Coffee":
-                        self.start_coffee_scene()
-                    elif label == "iPod":
-                        self.start_ipod()
-            elif event.keysym == 'Escape':
-                self.cozy_submenu_active = False
-                self.menu_active = True  # Go back to main menu
-                # Stop fireplace sound when exiting cozy submenu
-                if self.fireplace_playing:
-                    if self.fireplace_channel:
-                        self.fireplace_channel.stop()
-                        self.fireplace_channel = None
-                    self.fireplace_playing = False
-            return
-            
-        # Creative submenu navigation
-        if self.creative_submenu_active:
-            if event.keysym in ('Up','Down'):
-                if self.creative_submenu_hover_index == -1:
-                    self.creative_submenu_hover_index = 0
-                else:
-                    delta = -1 if event.keysym == 'Up' else 1
-                    total = len(CREATIVE_SUBMENU_ITEMS)
-                    self.creative_submenu_hover_index = (self.creative_submenu_hover_index + delta) % total
-                if self.hover_sound_loaded:
-                    try:
-                        self.hover_sound.play()
-                    except Exception:
-                        pass
-            elif event.keysym == 'Return':
-                if self.creative_submenu_hover_index != -1:
-                    label, _ = CREATIVE_SUBMENU_ITEMS[self.creative_submenu_hover_index]
-                    self.creative_submenu_selected = label
-                    self.creative_submenu_active = False
-                    if label == "Edit Code":
-                        self.open_code_editor()
-                    elif label == "Notebook":
-                        self.open_note_window()
-                    elif label == "Mood Menu":
-                        self.menu_active = True
-            elif event.keysym == 'Escape':
-                self.creative_submenu_active = False
-                self.menu_active = True  # Go back to main menu
-            return
-            
-        # Focused submenu navigation
-        if self.focused_submenu_active:
-            if event.keysym in ('Up','Down'):
-                if self.focused_submenu_hover_index == -1:
-                    self.focused_submenu_hover_index = 0
-                else:
-                    delta = -1 if event.keysym == 'Up' else 1
-                    total = len(FOCUSED_SUBMENU_ITEMS)
-                    self.focused_submenu_hover_index = (self.focused_submenu_hover_index + delta) % total
-                if self.hover_sound_loaded:
-                    try:
-                        self.hover_sound.play()
-                    except Exception:
-                        pass
-            elif event.keysym == 'Return':
-                if self.focused_submenu_hover_index != -1:
-                    label, _ = FOCUSED_SUBMENU_ITEMS[self.focused_submenu_hover_index]
-                    self.focused_submenu_selected = label
-                    self.focused_submenu_active = False
-                    if label == "Study Zone":
-                        self.scene.trigger_fade_to_focused()  # Go to focused scene for study zone
-                    elif label == "To-Do List":
-                        self.start_todo_list()  # New to-do list function
-            elif event.keysym == 'Escape':
-                self.focused_submenu_active = False
-                self.menu_active = True  # Go back to main menu
-            return
-            
-        # Main menu navigation
-        if not self.menu_active:
+        # Menu navigation
+        menu = self.active_menu
+        if menu is None:
             return
         if event.keysym in ('Up','Down'):
-            if self.menu_hover_index == -1:
-                self.menu_hover_index = 0
-            else:
-                delta = -1 if event.keysym == 'Up' else 1
-                total = len(MOOD_MENU_ITEMS)
-                self.menu_hover_index = (self.menu_hover_index + delta) % total
+            menu.step_hover(-1 if event.keysym == 'Up' else 1)
             # sound on move
-            if self.hover_sound_loaded:
-                try:
-                    self.hover_sound.play()
-                except Exception:
-                    pass
+            self._play_hover_sound()
         elif event.keysym == 'Return':
-            if self.menu_hover_index != -1:
-                self.menu_selected_index = self.menu_hover_index
-                self.menu_active = False
-                # Handle selection
-                try:
-                    label, _ = MOOD_MENU_ITEMS[self.menu_selected_index]
-                    if label == 'Cozy':
-                        print('[DEBUG] Cozy selected - showing submenu')
-                        self.activate_cozy_submenu()
-                    elif label == 'Creative':
-                        print('[DEBUG] Creative selected - showing submenu')
-                        self.activate_creative_submenu()
-                    elif label == 'Focused':
-                        print('[DEBUG] Focused selected - showing submenu')
-                        self.activate_focused_submenu()
-                except Exception:
-                    pass
+            if menu.hover != -1:
+                self.choose_menu_item(menu, menu.hover)
+        elif event.keysym == 'Escape' and menu.name != 'mood':
+            if menu.name == 'cozy' and self.fireplace_playing:
+                # Stop fireplace sound when exiting cozy submenu
+                if self.fireplace_channel:
+                    self.fireplace_channel.stop()
+                    self.fireplace_channel = None
+                self.fireplace_playing = False
+            self.open_menu('mood', restart=False)  # Go back to main menu
 
     def on_key_press(self, event):
         """Handle key press events for continuous movement tracking"""
@@ -1896,11 +4207,33 @@ class CafeApp:
         """Handle key release events for continuous movement tracking"""
         self.keys_pressed.discard(event.keysym)
 
-    # -------- Mood Menu Helpers --------
-    def activate_mood_menu(self):
-        self.menu_active = True
-        self.menu_anim_progress = 0.0
-        self.build_menu_layout()
+    # -------- Menu Helpers --------
+    def open_menu(self, name, restart=True):
+        """Show MENUS[name] in place of any open menu; restart resets hover and replays the slide-in."""
+        menu = self.menus[name]
+        if restart:
+            menu.restart()
+        menu.dirty = True
+        self.active_menu = menu
+
+    def close_menu(self):
+        self.active_menu = None
+        self.request_redraw()
+
+    def choose_menu_item(self, menu, index):
+        """Close `menu` and run the action declared for its row `index`."""
+        label, _ = menu.items[index]
+        if menu.name == 'mood':
+            self.menu_selected_index = index
+        self.close_menu()
+        print(f'[DEBUG] {label} selected')
+        action = menu.actions.get(label)
+        if action is None:
+            return
+        target = self
+        for attr in action[0].split('.'):
+            target = getattr(target, attr)
+        target(*action[1:])
 
     def load_mood_icons(self):
         """Load or create placeholder icons for each mood label."""
@@ -1942,71 +4275,78 @@ class CafeApp:
             self.mood_icons[label] = img
 
     def _to_menu_icon_photo(self, label):
+        """PhotoImage of a mood icon at MOOD_ICON_DRAW_SCALE, resized once per icon and display scale."""
         pil_img = self.mood_icons.get(label)
         if pil_img is None:
             return None
-        # scale to display
-        disp_img = pil_img
-        base_px = MOOD_ICON_SIZE
-        if MOOD_ICON_DRAW_SCALE != 1.0:
-            # upscale logically first (nearest to keep pixels chunky)
-            scaled_px = max(1, int(base_px * MOOD_ICON_DRAW_SCALE))
-            disp_img = disp_img.resize((scaled_px, scaled_px), Image.NEAREST)
-            base_px = scaled_px
-        if self.scale != 1:
-            disp_img = disp_img.resize((base_px*self.scale, base_px*self.scale), Image.NEAREST)
-        return ImageTk.PhotoImage(disp_img)
-
-    def build_menu_layout(self):
-        self.menu_boxes.clear()
-        panel_w = MOOD_MENU_WIDTH
-        total_items = len(MOOD_MENU_ITEMS)
-        panel_h = (MOOD_MENU_TITLE_HEIGHT + MOOD_MENU_PADDING +
-                   total_items * MOOD_MENU_ITEM_HEIGHT + MOOD_MENU_PADDING)
-        # center panel
-        x1 = (self.width - panel_w)//2
-        y1 = (self.height - panel_h)//2
-        # store panel rect for drawing
-        self.menu_panel_rect = (x1, y1, x1+panel_w, y1+panel_h)
-        # item boxes (text baseline area)
-        cur_y = y1 + MOOD_MENU_TITLE_HEIGHT
-        for i, _ in enumerate(MOOD_MENU_ITEMS):
-            item_y1 = cur_y + i * MOOD_MENU_ITEM_HEIGHT
-            item_y2 = item_y1 + MOOD_MENU_ITEM_HEIGHT
-            # Reserve space on left for icon square + gap
-            left_text_x = x1 + MOOD_MENU_PADDING + MOOD_ICON_SIZE + MOOD_ICON_TEXT_GAP
-            self.menu_boxes.append((i, (left_text_x, item_y1, x1+panel_w-MOOD_MENU_PADDING, item_y2)))
-        # store icon anchor x position (square area start)
-        self.menu_icon_x = x1 + MOOD_MENU_PADDING
-
-    def draw_mood_menu(self):
+        layer = 'menu_icon:' + label
+        key = (id(pil_img), self.scale)
+        photo = self.layers.get(layer, key)
+        if photo is None:
+            if MOOD_ICON_DRAW_SCALE != 1.0:
+                # upscale logically first (nearest to keep pixels chunky); _layer_photo scales to the display
+                side = max(1, int(MOOD_ICON_SIZE * MOOD_ICON_DRAW_SCALE))
+                pil_img = pil_img.resize((side, side), Image.NEAREST)
+            photo = self._layer_photo(layer, pil_img, key)
+        return photo
+
+    def _draw_menu_sprite(self, menu, hover_index, draw_panel, slide_offset=0):
+        """Show a menu panel as one image, pre-rendered once per (menu, hover index).
+
+        draw_panel() issues the panel's usual canvas calls; the first time a
+        state is shown they are rasterized by an OverlayCompositor into a
+        logical-resolution sprite. Afterwards the panel costs one image item,
+        moved up by slide_offset logical pixels during the slide-in.
+        """
+        entry = self._menu_sprites.get((menu, hover_index))
+        if entry is None:
+            compositor = OverlayCompositor(self.scale_map, self.layers.source_of, self.pixels_per_point, self.text_runs)
+            canvas, self.canvas = self.canvas, compositor
+            compositor.begin()
+            try:
+                draw_panel()
+            finally:
+                self.canvas = canvas
+            sprite, box = compositor.end()
+            if sprite is None:
+                return
+            layer = ('menu', menu, hover_index)
+            entry = (self._layer_photo(layer, sprite, layer), box[:2])
+            self._menu_sprites[(menu, hover_index)] = entry
+        photo, (x, y) = entry
+        px = self.scale
+        self.canvas.create_image(x*px, (y - slide_offset)*px, anchor='nw', image=photo)
+        self._frame_refs.append(photo)
+
+    def draw_menu(self, menu):
+        if menu.backdrop:
+            px = self.scale
+            self.canvas.create_rectangle(0, 0, self.width*px, self.height*px,
+                                         fill=menu.backdrop, stipple="gray50", outline="")
+        self._draw_menu_sprite(menu.name, menu.hover, lambda: self._draw_menu_panel(menu), menu.slide_offset())
+        menu.dirty = False
+
+    def _draw_menu_panel(self, menu):
+        """Canvas calls for the panel of `menu` at rest (rasterized by _draw_menu_sprite)."""
         px = self.scale
-        (x1,y1,x2,y2) = self.menu_panel_rect
-        # Slide from slight upward offset (ease-out style using (1 - (1-p)^2))
-        ease = 1 - (1 - self.menu_anim_progress)**2
-        slide_offset = int((1 - ease) * 40)  # slide down distance
-        y1s = y1 - slide_offset
-        y2s = y2 - slide_offset
-        self.canvas.create_rectangle(x1*px, y1s*px, x2*px, y2s*px, fill=MOOD_MENU_BG, outline=MOOD_MENU_BORDER, width=2)
+        (x1,y1,x2,y2) = menu.panel_rect
+        self.canvas.create_rectangle(x1*px, y1*px, x2*px, y2*px, fill=MOOD_MENU_BG, outline=MOOD_MENU_BORDER, width=2)
         # Title
         if USE_BLOCKY_FONT:
-            title_width = self._get_blocky_text_width(MOOD_MENU_TITLE)
+            title_width = self._get_blocky_text_width(menu.title)
             title_x = x1 + (MOOD_MENU_WIDTH - title_width) // 2
-            self._draw_blocky_text(title_x, y1s + MOOD_MENU_PADDING, MOOD_MENU_TITLE, MOOD_MENU_TEXT_COLOR)
+            self._draw_blocky_text(title_x, y1 + MOOD_MENU_PADDING, menu.title, MOOD_MENU_TEXT_COLOR)
         else:
-            self.canvas.create_text((x1+MOOD_MENU_WIDTH/2)*px, (y1s+MOOD_MENU_PADDING+4)*px, text=MOOD_MENU_TITLE, fill=MOOD_MENU_TEXT_COLOR, font=MOOD_MENU_FONT, anchor="n")
+            self.canvas.create_text((x1+MOOD_MENU_WIDTH/2)*px, (y1+MOOD_MENU_PADDING+4)*px, text=menu.title, fill=MOOD_MENU_TEXT_COLOR, font=MOOD_MENU_FONT, anchor="n")
         # Items
-        for idx, (ix1,iy1,ix2,iy2) in self.menu_boxes:
-            # apply same vertical slide
-            iy1s = iy1 - slide_offset
-            iy2s = iy2 - slide_offset
-            hovered = (idx == self.menu_hover_index)
+        for idx, (label, desc) in enumerate(menu.items):
+            (ix1,iy1,ix2,iy2) = menu.row_box(idx)
+            hovered = (idx == menu.hover)
             if hovered:
                 # background
-                self.canvas.create_rectangle(ix1*px, iy1s*px, ix2*px, iy2s*px, fill=MOOD_MENU_HOVER_BG, outline="")
+                self.canvas.create_rectangle(ix1*px, iy1*px, ix2*px, iy2*px, fill=MOOD_MENU_HOVER_BG, outline="")
                 # left accent bar
-                self.canvas.create_rectangle((ix1- (MOOD_ICON_SIZE + MOOD_ICON_TEXT_GAP) -4)*px, iy1s*px, (ix1- (MOOD_ICON_SIZE + MOOD_ICON_TEXT_GAP) -2)*px, iy2s*px, fill=MOOD_MENU_ACCENT, outline="")
-            label, desc = MOOD_MENU_ITEMS[idx]
+                self.canvas.create_rectangle((menu.icon_x-4)*px, iy1*px, (menu.icon_x-2)*px, iy2*px, fill=MOOD_MENU_ACCENT, outline="")
             text_color = MOOD_MENU_HOVER_TEXT if hovered else MOOD_MENU_TEXT_COLOR
             inner_w = (ix2 - ix1) - MOOD_MENU_PADDING  # single side padding since ix1 already accounts for left pad + icon
             # rough char capacity using monospace width ~7 px at scale 1 for font size 12
@@ -2015,21 +4355,21 @@ class CafeApp:
             label_draw = self._truncate_text(label, max_label_chars)
             desc_draw = self._truncate_text(desc, max_desc_chars)
             # icon drawing
-            icon_photo = self._to_menu_icon_photo(label)
-            icon_box_y = iy1s + (MOOD_MENU_ITEM_HEIGHT - MOOD_ICON_SIZE)//2
+            icon_photo = self._to_menu_icon_photo(label) if menu.icons else None
             if icon_photo is not None:
                 # If draw scale enlarged, center within original MOOD_ICON_SIZE square
+                icon_box_y = iy1 + (MOOD_MENU_ITEM_HEIGHT - MOOD_ICON_SIZE)//2
                 rendered_side = int(MOOD_ICON_SIZE * MOOD_ICON_DRAW_SCALE)
                 offset = 0
                 if rendered_side > MOOD_ICON_SIZE:
                     offset = (rendered_side - MOOD_ICON_SIZE)//2
-                draw_x = self.menu_icon_x - offset
+                draw_x = menu.icon_x - offset
                 draw_y = icon_box_y - offset
                 self.canvas.create_image(draw_x*px, draw_y*px, anchor='nw', image=icon_photo)
                 self._frame_refs.append(icon_photo)
-            # left aligned text after icon
+            # left aligned text (after the icon, if any)
             text_x = ix1
-            base_y = iy1s + 6
+            base_y = iy1 + 6
             if USE_BLOCKY_FONT:
                 self._draw_blocky_text(text_x, base_y, label_draw, text_color)
                 self._draw_blocky_text(text_x, base_y + MOOD_MENU_DESC_OFFSET, desc_draw, text_color)
@@ -2093,566 +4433,40 @@ class CafeApp:
                                      width=FOCUSED_HOVER_OUTLINE_WIDTH)
 
     # -------- Blocky Font System --------
-    def _blocky_font_char_bitmap(self, char):
-        """Return a 5x7 bitmap for a blocky character. 1 = filled pixel, 0 = empty."""
-        char = char.upper()
-        bitmaps = {
-            'A': [
-                "01110",
-                "10001",
-                "10001",
-                "11111",
-                "10001",
-                "10001",
-                "00000"
-            ],
-            'B': [
-                "11110",
-                "10001",
-                "11110",
-                "11110",
-                "10001",
-                "11110",
-                "00000"
-            ],
-            'C': [
-                "01111",
-                "10000",
-                "10000",
-                "10000",
-                "10000",
-                "01111",
-                "00000"
-            ],
-            'D': [
-                "11110",
-                "10001",
-                "10001",
-                "10001",
-                "10001",
-                "11110",
-                "00000"
-            ],
-            'E': [
-                "11111",
-                "10000",
-                "11110",
-                "10000",
-                "10000",
-                "11111",
-                "00000"
-            ],
-            'F': [
-                "11111",
-                "10000",
-                "11110",
-                "10000",
-                "10000",
-                "10000",
-                "00000"
-            ],
-            'G': [
-                "01111",
-                "10000",
-                "10011",
-                "10001",
-                "10001",
-                "01111",
-                "00000"
-            ],
-            'H': [
-                "10001",
-                "10001",
-                "11111",
-                "10001",
-                "10001",
-                "10001",
-                "00000"
-            ],
-            'I': [
-                "11111",
-                "00100",
-                "00100",
-                "00100",
-                "00100",
-                "11111",
-                "00000"
-            ],
-            'J': [
-                "11111",
-                "00001",
-                "00001",
-                "00001",
-                "10001",
-                "01110",
-                "00000"
-            ],
-            'K': [
-                "10001",
-                "10010",
-                "11100",
-                "10010",
-                "10001",
-                "10001",
-                "00000"
-            ],
-            'L': [
-                "10000",
-                "10000",
-                "10000",
-                "10000",
-                "10000",
-                "11111",
-                "00000"
-            ],
-            'M': [
-                "10001",
-                "11011",
-                "10101",
-                "10001",
-                "10001",
-                "10001",
-                "00000"
-            ],
-            'N': [
-                "10001",
-                "11001",
-                "10101",
-                "10011",
-                "10001",
-                "10001",
-                "00000"
-            ],
-            'O': [
-                "01110",
-                "10001",
-                "10001",
-                "10001",
-                "10001",
-                "01110",
-                "00000"
-            ],
-            'P': [
-                "11110",
-                "10001",
-                "11110",
-                "10000",
-                "10000",
-                "10000",
-                "00000"
-            ],
-            'Q': [
-                "01110",
-                "10001",
-                "10001",
-                "10101",
-                "10010",
-                "01101",
-                "00000"
-            ],
-            'R': [
-                "11110",
-                "10001",
-                "11110",
-                "10010",
-                "10001",
-                "10001",
-                "00000"
-            ],
-            'S': [
-                "01111",
-                "10000",
-                "01110",
-                "00001",
-                "00001",
-                "11110",
-                "00000"
-            ],
-            'T': [
-                "11111",
-                "00100",
-                "00100",
-                "00100",
-                "00100",
-                "00100",
-                "00000"
-            ],
-            'U': [
-                "10001",
-                "10001",
-                "10001",
-                "10001",
-                "10001",
-                "01110",
-                "00000"
-            ],
-            'V': [
-                "10001",
-                "10001",
-                "10001",
-                "10001",
-                "01010",
-                "00100",
-                "00000"
-            ],
-            'W': [
-                "10001",
-                "10001",
-                "10001",
-                "10101",
-                "11011",
-                "10001",
-                "00000"
-            ],
-            'X': [
-                "10001",
-                "01010",
-                "00100",
-                "01010",
-                "10001",
-                "10001",
-                "00000"
-            ],
-            'Y': [
-                "10001",
-                "01010",
-                "00100",
-                "00100",
-                "00100",
-                "00100",
-                "00000"
-            ],
-            'Z': [
-                "11111",
-                "00010",
-                "00100",
-                "01000",
-                "10000",
-                "11111",
-                "00000"
-            ],
-            ' ': [
-                "00000",
-                "00000",
-                "00000",
-                "00000",
-                "00000",
-                "00000",
-                "00000"
-            ],
-            ':': [
-                "00000",
-                "00100",
-                "00000",
-                "00000",
-                "00100",
-                "00000",
-                "00000"
-            ],
-            '.': [
-                "00000",
-                "00000",
-                "00000",
-                "00000",
-                "00000",
-                "00100",
-                "00000"
-            ],
-            '0': [
-                "01110",
-                "10001",
-                "10011",
-                "10101",
-                "11001",
-                "01110",
-                "00000"
-            ],
-            '1': [
-                "00100",
-                "01100",
-                "00100",
-                "00100",
-                "00100",
-                "01110",
-                "00000"
-            ],
-            '2': [
-                "01110",
-                "10001",
-                "00010",
-                "00100",
-                "01000",
-                "11111",
-                "00000"
-            ],
-            '3': [
-                "01110",
-                "10001",
-                "00110",
-                "00001",
-                "10001",
-                "01110",
-                "00000"
-            ],
-            '4': [
-                "00010",
-                "00110",
-                "01010",
-                "11111",
-                "00010",
-                "00010",
-                "00000"
-            ],
-            '5': [
-                "11111",
-                "10000",
-                "11110",
-                "00001",
-                "10001",
-                "01110",
-                "00000"
-            ],
-            '6': [
-                "01110",
-                "10000",
-                "11110",
-                "10001",
-                "10001",
-                "01110",
-                "00000"
-            ],
-            '7': [
-                "11111",
-                "00001",
-                "00010",
-                "00100",
-                "01000",
-                "01000",
-                "00000"
-            ],
-            '8': [
-                "01110",
-                "10001",
-                "01110",
-                "10001",
-                "10001",
-                "01110",
-                "00000"
-            ],
-            '9': [
-                "01110",
-                "10001",
-                "01111",
-                "00001",
-                "00001",
-                "01110",
-                "00000"
-            ]
-        }
-        return bitmaps.get(char, bitmaps[' '])  # fallback to space
-
-    def _draw_blocky_text(self, x, y, text, color='#ffffff', bg_color=None):
-        """Draw blocky pixel text at logical coordinates (x, y)."""
-        if not USE_BLOCKY_FONT:
+    def _draw_blocky_text(self, x, y, text, color='#ffffff', bg_color=None, magnify=1):
+        """Draw blocky pixel text at logical coordinates (x, y) (see BLOCKY_TEXT_MODE)."""
+        if not USE_BLOCKY_FONT or not text:
             return
-        
-        char_width = 5 * BLOCKY_FONT_SCALE + BLOCKY_FONT_SPACING
-        char_height = 7 * BLOCKY_FONT_SCALE
         px = self.scale
-        
-        for i, char in enumerate(text):
-            bitmap = self._blocky_font_char_bitmap(char)
-            char_x = x + i * char_width
-            
-            # Draw background if specified
+        if BLOCKY_TEXT_MODE == 'vector':
             if bg_color:
-                self.canvas.create_rectangle(
-                    char_x * px, y * px,
-                    (char_x + 5 * BLOCKY_FONT_SCALE) * px,
-                    (y + char_height) * px,
-                    fill=bg_color, outline=""
-                )
-            
-            # Draw character pixels
-            for row_idx, row in enumerate(bitmap):
-                for col_idx, pixel in enumerate(row):
-                    if pixel == '1':
-                        pixel_x = char_x + col_idx * BLOCKY_FONT_SCALE
-                        pixel_y = y + row_idx * BLOCKY_FONT_SCALE
-                        self.canvas.create_rectangle(
-                            pixel_x * px, pixel_y * px,
-                            (pixel_x + BLOCKY_FONT_SCALE) * px,
-                            (pixel_y + BLOCKY_FONT_SCALE) * px,
-                            fill=color, outline=""
-                        )
-
-    def _get_blocky_text_width(self, text):
+                cell_w = BlockyFont.GLYPH_W * BLOCKY_FONT.scale * magnify
+                height = BLOCKY_FONT.height(magnify)
+                for i in range(len(text)):
+                    char_x = x + i * BLOCKY_FONT.advance(magnify)
+                    self.canvas.create_rectangle(char_x * px, y * px, (char_x + cell_w) * px, (y + height) * px,
+                                                 fill=bg_color, outline="")
+            for x1, y1, x2, y2 in BLOCKY_FONT.runs(text, magnify):
+                self.canvas.create_rectangle((x + x1) * px, (y + y1) * px, (x + x2) * px, (y + y2) * px,
+                                             fill=color, outline="")
+            return
+        photo = self._blocky_text_photo(text, color, bg_color, magnify)
+        self.canvas.create_image(x * px, y * px, anchor='nw', image=photo)
+        self._frame_refs.append(photo)
+
+    def _blocky_text_photo(self, text, color, bg_color=None, magnify=1):
+        """PhotoImage of a rendered blocky string, from the shared text run cache."""
+        key = ('blocky', text, color, bg_color, magnify, self.scale)
+        photo = self.text_runs.get(key)
+        if photo is None:
+            photo = self.text_runs.put(key, self._layer_photo(key, BLOCKY_FONT.render(text, color, magnify, bg_color)))
+        return photo
+
+    def _get_blocky_text_width(self, text, magnify=1):
         """Return the logical width of blocky text."""
-        if not text:
-            return 0
-        char_width = 5 * BLOCKY_FONT_SCALE + BLOCKY_FONT_SPACING
-        return len(text) * char_width - BLOCKY_FONT_SPACING  # remove last spacing
+        return BLOCKY_FONT.text_width(text, magnify)
 
     # -------- Pixel Font Helper --------
-    # -------- Cozy Submenu Methods --------
-    def activate_cozy_submenu(self):
-        self.cozy_submenu_active = True
-        self.cozy_submenu_hover_index = -1
-        self.build_cozy_submenu_layout()
-        
-    def build_cozy_submenu_layout(self):
-        self.cozy_submenu_boxes.clear()
-        panel_w = MOOD_MENU_WIDTH
-        total_items = len(COZY_SUBMENU_ITEMS)
-        panel_h = (MOOD_MENU_TITLE_HEIGHT + MOOD_MENU_PADDING +
-                   total_items * MOOD_MENU_ITEM_HEIGHT + MOOD_MENU_PADDING)
-        # center panel
-        x1 = (self.width - panel_w)//2
-        y1 = (self.height - panel_h)//2
-        # store panel rect for drawing
-        self.cozy_submenu_panel_rect = (x1, y1, x1+panel_w, y1+panel_h)
-        # item boxes
-        cur_y = y1 + MOOD_MENU_TITLE_HEIGHT
-        for i, _ in enumerate(COZY_SUBMENU_ITEMS):
-            item_y1 = cur_y + i * MOOD_MENU_ITEM_HEIGHT
-            item_y2 = item_y1 + MOOD_MENU_ITEM_HEIGHT
-            left_text_x = x1 + MOOD_MENU_PADDING
-            self.cozy_submenu_boxes.append((i, (left_text_x, item_y1, x1+panel_w-MOOD_MENU_PADDING, item_y2)))
-            
-    def draw_cozy_submenu(self):
-        px = self.scale
-        (x1,y1,x2,y2) = self.cozy_submenu_panel_rect
-        
-        # Draw panel background
-        self.canvas.create_rectangle(x1*px, y1*px, x2*px, y2*px, 
-                                     fill=MOOD_MENU_BG, outline=MOOD_MENU_BORDER, width=2)
-        
-        # Title
-        title_text = "Cozy Options"
-        if USE_BLOCKY_FONT:
-            title_width = self._get_blocky_text_width(title_text)
-            title_x = x1 + (MOOD_MENU_WIDTH - title_width) // 2
-            self._draw_blocky_text(title_x, y1 + MOOD_MENU_PADDING, title_text, MOOD_MENU_TEXT_COLOR)
-        else:
-            self.canvas.create_text((x1+MOOD_MENU_WIDTH/2)*px, (y1+MOOD_MENU_PADDING+4)*px, 
-                                    text=title_text, fill=MOOD_MENU_TEXT_COLOR, font=MOOD_MENU_FONT, anchor="n")
-        
-        # Items
-        for idx, (ix1,iy1,ix2,iy2) in self.cozy_submenu_boxes:
-            hovered = (idx == self.cozy_submenu_hover_index)
-            if hovered:
-                self.canvas.create_rectangle(ix1*px, iy1*px, ix2*px, iy2*px, 
-                                             fill=MOOD_MENU_HOVER_BG, outline="")
-                self.canvas.create_rectangle((ix1-4)*px, iy1*px, (ix1-2)*px, iy2*px, 
-                                             fill=MOOD_MENU_ACCENT, outline="")
-            
-            label, desc = COZY_SUBMENU_ITEMS[idx]
-            text_color = MOOD_MENU_HOVER_TEXT if hovered else MOOD_MENU_TEXT_COLOR
-            
-            text_x = ix1
-            base_y = iy1 + 6
-            if USE_BLOCKY_FONT:
-                self._draw_blocky_text(text_x, base_y, label, text_color)
-                self._draw_blocky_text(text_x, base_y + MOOD_MENU_DESC_OFFSET, desc, text_color)
-            else:
-                self.canvas.create_text(text_x*px, base_y*px, text=label, 
-                                        fill=text_color, font=MOOD_MENU_FONT, anchor='nw')
-                self.canvas.create_text(text_x*px, (base_y + MOOD_MENU_DESC_OFFSET)*px, 
-                                        text=desc, fill=text_color, font=MOOD_MENU_DESC_FONT, anchor='nw')
-    
-    # -------- Creative Submenu Methods --------
-    def activate_creative_submenu(self):
-        self.creative_submenu_active = True
-        self.creative_submenu_hover_index = -1
-        self.build_creative_submenu_layout()
-        
-    def build_creative_submenu_layout(self):
-        """Build layout boxes for creative submenu items"""
-        px = self.scale
-        
-        # Use same sizing and positioning as Cozy submenu
-        center_x = self.width // 2
-        center_y = self.height // 2
-        
-        menu_w = MOOD_MENU_WIDTH
-        # Include title height in total menu height calculation
-        menu_h = (MOOD_MENU_TITLE_HEIGHT + MOOD_MENU_PADDING +
-                  len(CREATIVE_SUBMENU_ITEMS) * MOOD_MENU_ITEM_HEIGHT + MOOD_MENU_PADDING)
-        
-        x1 = center_x - menu_w // 2
-        y1 = center_y - menu_h // 2
-        
-        self.creative_submenu_boxes = []
-        
-        for idx, (label, desc) in enumerate(CREATIVE_SUBMENU_ITEMS):
-            item_y = y1 + MOOD_MENU_TITLE_HEIGHT + MOOD_MENU_PADDING + idx * MOOD_MENU_ITEM_HEIGHT
-            item_h = MOOD_MENU_ITEM_HEIGHT - 4
-            self.creative_submenu_boxes.append((idx, (x1 + MOOD_MENU_PADDING, item_y, x1 + menu_w - MOOD_MENU_PADDING, item_y + item_h)))
-    
-    def draw_creative_submenu(self):
-        """Draw the creative submenu using same style as Cozy submenu"""
-        px = self.scale
-        
-        # Background overlay
-        self.canvas.create_rectangle(0, 0, self.width*px, self.height*px, 
-                                   fill="#1a1a1a", stipple="gray50", outline="")
-        
-        # Use same sizing and positioning as Cozy submenu
-        center_x = self.width // 2
-        center_y = self.height // 2
-        
-        menu_w = MOOD_MENU_WIDTH
-        # Include title height in total menu height calculation
-        menu_h = (MOOD_MENU_TITLE_HEIGHT + MOOD_MENU_PADDING +
-                  len(CREATIVE_SUBMENU_ITEMS) * MOOD_MENU_ITEM_HEIGHT + MOOD_MENU_PADDING)
-        
-        x1 = center_x - menu_w // 2
-        y1 = center_y - menu_h // 2
-        x2 = x1 + menu_w
-        y2 = y1 + menu_h
-        
-        # Draw panel background using same colors as Cozy
-        self.canvas.create_rectangle(x1*px, y1*px, x2*px, y2*px, 
-                                     fill=MOOD_MENU_BG, outline=MOOD_MENU_BORDER, width=2)
-        
-        # Title
-        title_text = "Creative Options"
-        if USE_BLOCKY_FONT:
-            title_width = self._get_blocky_text_width(title_text)
-            title_x = x1 + (MOOD_MENU_WIDTH - title_width) // 2
-            self._draw_blocky_text(title_x, y1 + MOOD_MENU_PADDING, title_text, MOOD_MENU_TEXT_COLOR)
-        else:
-            self.canvas.create_text((x1+MOOD_MENU_WIDTH/2)*px, (y1+MOOD_MENU_PADDING+4)*px, 
-                                    text=title_text, fill=MOOD_MENU_TEXT_COLOR, font=MOOD_MENU_FONT, anchor="n")
-        
-        # Items
-        for idx, (label, desc) in enumerate(CREATIVE_SUBMENU_ITEMS):
-            item_y = y1 + MOOD_MENU_TITLE_HEIGHT + MOOD_MENU_PADDING + idx * MOOD_MENU_ITEM_HEIGHT
-            
-            hovered = (idx == self.creative_submenu_hover_index)
-            if hovered:
-                # Use same hover styling as Cozy menu
-                ix1, iy1 = x1 + MOOD_MENU_PADDING, item_y
-                ix2, iy2 = x2 - MOOD_MENU_PADDING, item_y + MOOD_MENU_ITEM_HEIGHT - 4
-                
-                self.canvas.create_rectangle(ix1*px, iy1*px, ix2*px, iy2*px, 
-                                             fill=MOOD_MENU_HOVER_BG, outline="")
-                self.canvas.create_rectangle((ix1-4)*px, iy1*px, (ix1-2)*px, iy2*px, 
-                                             fill=MOOD_MENU_ACCENT, outline="")
-            
-            text_color = MOOD_MENU_HOVER_TEXT if hovered else MOOD_MENU_TEXT_COLOR
-            
-            text_x = x1 + MOOD_MENU_PADDING
-            base_y = item_y + 6
-            if USE_BLOCKY_FONT:
-                self._draw_blocky_text(text_x, base_y, label, text_color)
-                self._draw_blocky_text(text_x, base_y + MOOD_MENU_DESC_OFFSET, desc, text_color)
-            else:
-                self.canvas.create_text(text_x*px, base_y*px, text=label, 
-                                        fill=text_color, font=MOOD_MENU_FONT, anchor='nw')
-                self.canvas.create_text(text_x*px, (base_y + MOOD_MENU_DESC_OFFSET)*px, 
-                                        text=desc, fill=text_color, font=MOOD_MENU_DESC_FONT, anchor='nw')
-    
     def open_code_editor(self):
         """Open the source code file for editing"""
         try:
@@ -2687,69 +4501,6 @@ class CafeApp:
             # Fallback - show file path
             messagebox.showinfo("Code Editor", f"Source code file:\n{os.path.abspath(__file__)}")
     
-    # -------- Focused Submenu Methods --------
-    def activate_focused_submenu(self):
-        self.focused_submenu_active = True
-        self.focused_submenu_hover_index = -1
-        self.build_focused_submenu_layout()
-        
-    def build_focused_submenu_layout(self):
-        self.focused_submenu_boxes.clear()
-        panel_w = MOOD_MENU_WIDTH
-        total_items = len(FOCUSED_SUBMENU_ITEMS)
-        panel_h = (MOOD_MENU_TITLE_HEIGHT + MOOD_MENU_PADDING +
-                   total_items * MOOD_MENU_ITEM_HEIGHT + MOOD_MENU_PADDING)
-        # center panel
-        x1 = (self.width - panel_w)//2
-        y1 = (self.height - panel_h)//2
-        # store panel rect for drawing
-        self.focused_submenu_panel_rect = (x1, y1, x1+panel_w, y1+panel_h)
-        # item boxes
-        cur_y = y1 + MOOD_MENU_TITLE_HEIGHT
-        for i, _ in enumerate(FOCUSED_SUBMENU_ITEMS):
-            item_y1 = cur_y + i * MOOD_MENU_ITEM_HEIGHT
-            item_y2 = item_y1 + MOOD_MENU_ITEM_HEIGHT
-            left_text_x = x1 + MOOD_MENU_PADDING
-            self.focused_submenu_boxes.append((i, (left_text_x, item_y1, x1+panel_w-MOOD_MENU_PADDING, item_y2)))
-            
-    def draw_focused_submenu(self):
-        px = self.scale
-        (x1,y1,x2,y2) = self.focused_submenu_panel_rect
-        
-        # Draw panel background
-        self.canvas.create_rectangle(x1*px, y1*px, x2*px, y2*px, 
-                                     fill=MOOD_MENU_BG, outline=MOOD_MENU_BORDER, width=2)
-        
-        # Title
-        title_text = "Focused Options"
-        if USE_BLOCKY_FONT:
-            title_width = self._get_blocky_text_width(title_text)
-            title_x = x1 + (MOOD_MENU_WIDTH - title_width) // 2
-            self._draw_blocky_text(title_x, y1 + MOOD_MENU_PADDING, title_text, MOOD_MENU_TEXT_COLOR)
-        else:
-            self.canvas.create_text((x1+MOOD_MENU_WIDTH/2)*px, (y1+MOOD_MENU_PADDING+4)*px, 
-                                    text=title_text, fill=MOOD_MENU_TEXT_COLOR, font=MOOD_MENU_FONT, anchor="n")
-        
-        # Items
-        for idx, (ix1,iy1,ix2,iy2) in self.focused_submenu_boxes:
-            if idx < len(FOCUSED_SUBMENU_ITEMS):
-                label, desc = FOCUSED_SUBMENU_ITEMS[idx]
-                hovered = (idx == self.focused_submenu_hover_index)
-                if hovered:
-                    self.canvas.create_rectangle(ix1*px, iy1*px, ix2*px, iy2*px, fill=MOOD_MENU_HOVER_BG, outline="")
-                    # Draw left accent bar
-                    self.canvas.create_rectangle((ix1-4)*px, iy1*px, (ix1-2)*px, iy2*px, fill=MOOD_MENU_ACCENT, outline="")
-                text_color = MOOD_MENU_HOVER_TEXT if hovered else MOOD_MENU_TEXT_COLOR
-                
-                text_x = ix1
-                base_y = iy1 + 6
-                if USE_BLOCKY_FONT:
-                    self._draw_blocky_text(text_x, base_y, label, text_color)
-                    self._draw_blocky_text(text_x, base_y + MOOD_MENU_DESC_OFFSET, desc, text_color)
-                else:
-                    self.canvas.create_text(text_x*px, base_y*px, text=label, fill=text_color, font=MOOD_MENU_FONT, anchor='nw')
-                    self.canvas.create_text(text_x*px, (base_y + MOOD_MENU_DESC_OFFSET)*px, text=desc, fill=text_color, font=MOOD_MENU_DESC_FONT, anchor='nw')
-    
     # -------- Phone Game Methods --------
     def start_phone_game(self):
         if not self.phone_image:
@@ -2778,7 +4529,7 @@ class CafeApp:
         phone_y = (self.height - phone_h) // 2 - 60  # Move up more (~2cm)
         
         # Draw phone image
-        phone_photo = self._to_photo(self.phone_image)
+        phone_photo = self._layer_photo('phone', self.phone_image, id(self.phone_image))
         self.canvas.create_image(phone_x*px, phone_y*px, anchor="nw", image=phone_photo)
         self._frame_refs.append(phone_photo)
         
@@ -2902,8 +4653,11 @@ class CafeApp:
         
         # Dark overlay background
         overlay_alpha = 200
-        overlay = Image.new('RGBA', (self.width, self.height), (26, 26, 46, overlay_alpha))
-        overlay_photo = self._to_photo(overlay)
+        overlay_key = ('meditation', overlay_alpha)
+        overlay_photo = self.layers.get('meditation_dim', overlay_key)
+        if overlay_photo is None:
+            overlay = Image.new('RGBA', (self.width, self.height), (26, 26, 46, overlay_alpha))
+            overlay_photo = self._layer_photo('meditation_dim', overlay, overlay_key)
         self.canvas.create_image(0, 0, anchor="nw", image=overlay_photo)
         self._frame_refs.append(overlay_photo)
         
@@ -2930,25 +4684,10 @@ class CafeApp:
         time_text = self.meditation_timer.get_time_display()
         timer_y = panel_y + 40
         if USE_BLOCKY_FONT:
-            # Calculate proper character width for 2x scaled blocky font
-            char_width = (5 * BLOCKY_FONT_SCALE + BLOCKY_FONT_SPACING) * 2  # 2x scale factor
-            time_width = len(time_text) * char_width - BLOCKY_FONT_SPACING * 2  # Remove last spacing
+            # Bigger blocky text: every glyph pixel drawn 2x2
+            time_width = self._get_blocky_text_width(time_text, magnify=2)
             time_x = panel_x + (panel_w - time_width) // 2
-            # Draw bigger blocky text by drawing multiple scaled characters
-            for i, char in enumerate(time_text):
-                char_x = time_x + i * char_width
-                for row_idx, row in enumerate(self._blocky_font_char_bitmap(char)):
-                    for col_idx, pixel in enumerate(row):
-                        if pixel == '1':
-                            # Draw 2x2 pixel blocks for bigger text
-                            pixel_x = char_x + col_idx * BLOCKY_FONT_SCALE * 2
-                            pixel_y = timer_y + row_idx * BLOCKY_FONT_SCALE * 2
-                            self.canvas.create_rectangle(
-                                pixel_x * px, pixel_y * px,
-                                (pixel_x + BLOCKY_FONT_SCALE * 2) * px, 
-                                (pixel_y + BLOCKY_FONT_SCALE * 2) * px,
-                                fill=MEDITATION_ACCENT_COLOR, outline=""
-                            )
+            self._draw_blocky_text(time_x, timer_y, time_text, MEDITATION_ACCENT_COLOR, magnify=2)
         else:
             self.canvas.create_text((panel_x + panel_w//2)*px, timer_y*px, 
                                     text=time_text, fill=MEDITATION_ACCENT_COLOR,
@@ -3454,8 +5193,11 @@ class CafeApp:
         
         # Dark overlay background
         overlay_alpha = 200
-        overlay = Image.new('RGBA', (self.width, self.height), (11, 11, 15, overlay_alpha))
-        overlay_photo = self._to_photo(overlay)
+        overlay_key = ('todo', overlay_alpha)
+        overlay_photo = self.layers.get('todo_dim', overlay_key)
+        if overlay_photo is None:
+            overlay = Image.new('RGBA', (self.width, self.height), (11, 11, 15, overlay_alpha))
+            overlay_photo = self._layer_photo('todo_dim', overlay, overlay_key)
         self.canvas.create_image(0, 0, anchor="nw", image=overlay_photo)
         self._frame_refs.append(overlay_photo)
         
@@ -3617,8 +5359,7 @@ class CafeApp:
                 self.fireplace_channel = self.fireplace_sound.play(loops=-1)
                 self.fireplace_playing = True
                 # Hide menus when transitioning to fireplace scene
-                self.cozy_submenu_active = False
-                self.menu_active = False
+                self.close_menu()
                 # Trigger smooth transition to fireplace scene
                 self.scene.trigger_fade_to_fireplace()
                 print("[INFO] Fireplace started, transitioning to fireplace scene")
@@ -4177,7 +5918,7 @@ class CafeApp:
                 self.scene.state = SceneManager.STATE_INSIDE
             # 2. Reset mood selection so activation condition in draw() triggers again
             self.menu_selected_index = -1
-            self.menu_active = False  # will be re-activated automatically in draw()
+            self.close_menu()  # will be re-activated automatically in draw()
             self.cozy_music_button = None
         
         # Button layout with improved spacing and organization
@@ -4216,26 +5957,8 @@ class CafeApp:
         """Draw blocky text directly on a tkinter canvas (for notebook headers)."""
         if not USE_BLOCKY_FONT:
             return
-            
-        char_width = 5 * BLOCKY_FONT_SCALE + BLOCKY_FONT_SPACING
-        char_height = 7 * BLOCKY_FONT_SCALE
-        
-        for i, char in enumerate(text):
-            bitmap = self._blocky_font_char_bitmap(char)
-            char_x = x + i * char_width
-            
-            # Draw character pixels
-            for row_idx, row in enumerate(bitmap):
-                for col_idx, pixel in enumerate(row):
-                    if pixel == '1':
-                        pixel_x = char_x + col_idx * BLOCKY_FONT_SCALE
-                        pixel_y = y + row_idx * BLOCKY_FONT_SCALE
-                        canvas.create_rectangle(
-                            pixel_x, pixel_y,
-                            pixel_x + BLOCKY_FONT_SCALE,
-                            pixel_y + BLOCKY_FONT_SCALE,
-                            fill=color, outline=""
-                        )
+        for x1, y1, x2, y2 in BLOCKY_FONT.runs(text):
+            canvas.create_rectangle(x + x1, y + y1, x + x2, y + y2, fill=color, outline="")
 
     def open_calendar_window(self):
         print("[DEBUG] Calendar window opening...")  # Debug print
@@ -4737,7 +6460,391 @@ class CafeApp:
             print(f"[WARN] Failed to save notebook data: {e}")
 
 
+# -------- Benchmarks --------
+def _fit_frame_two_pass(frame_img: Image.Image, size, scale: int, mode: str) -> Image.Image:
+    """The previous pipeline: copy, fit to logical size (resize + crop/pad), then upscale."""
+    img = _compact_frame(frame_img)
+    target_w, target_h = size
+    fw, fh = img.size
+    if (fw, fh) != (target_w, target_h):
+        if mode == 'stretch':
+            img = img.resize((target_w, target_h), Image.NEAREST)
+        elif mode == 'letterbox':
+            scale_ratio = min(target_w / fw, target_h / fh)
+            resized = img.resize((max(1, int(fw * scale_ratio)), max(1, int(fh * scale_ratio))), Image.NEAREST)
+            canvas = Image.new('RGBA' if img.mode == 'RGBA' else 'RGB', (target_w, target_h), (0,0,0))
+            canvas.paste(resized, ((target_w - resized.width)//2, (target_h - resized.height)//2))
+            img = canvas
+        else:
+            scale_ratio = max(target_w / fw, target_h / fh)
+            new_w = max(1, int(fw * scale_ratio))
+            new_h = max(1, int(fh * scale_ratio))
+            left = (new_w - target_w)//2
+            top = (new_h - target_h)//2
+            img = img.resize((new_w, new_h), Image.NEAREST).crop((left, top, left + target_w, top + target_h))
+    if scale != 1:
+        img = img.resize((target_w*scale, target_h*scale), Image.NEAREST)
+    return img
+
+def benchmark_fit_paths(scale: int = 2, max_frames: int = 12, repeat: int = 3):
+    """Compare the two-pass and single-pass fit+upscale on the bundled GIFs, per RESIZE_MODE.
+
+    The logical size is the largest of the outside/inside GIFs, as in CafeApp.
+    Prints one line per GIF and mode and returns the results as a list of dicts.
+    """
+    base_sizes = [sz for sz in (_probe_image_size(OUTSIDE_GIF), _probe_image_size(INSIDE_GIF)) if sz]
+    size = (max(w for w, _ in base_sizes), max(h for _, h in base_sizes)) if base_sizes else (128, 96)
+    results = []
+    for path in (OUTSIDE_GIF, INSIDE_GIF, FOCUSED_GIF, FIREPLACE_GIF, COFFEE_GIF):
+        if not os.path.isfile(path):
+            print(f"[WARN] Benchmark skipping missing {path}")
+            continue
+        with Image.open(path) as im:
+            frames = [f.copy() for _, f in zip(range(max_frames), ImageSequence.Iterator(im))]
+        for mode in ('fill', 'letterbox', 'stretch'):
+            timings = {}
+            for name, fit in (('two_pass', lambda f: _fit_frame_two_pass(f, size, scale, mode)),
+                              ('single_pass', lambda f: _fit_frame(_compact_frame(f, copy=False), size, scale, mode))):
+                best = None
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    for frame in frames:
+                        fit(frame)
+                    elapsed = (time.perf_counter() - t0) * 1000.0 / len(frames)
+                    best = elapsed if best is None else min(best, elapsed)
+                timings[name] = best
+            result = {'gif': os.path.basename(path), 'source_size': frames[0].size, 'mode': mode,
+                      'scale': scale, 'two_pass_ms': timings['two_pass'], 'single_pass_ms': timings['single_pass']}
+            results.append(result)
+            print(f"{result['gif']:<14} {mode:<9} x{scale}: two-pass {timings['two_pass']:7.2f} ms/frame, "
+                  f"single-pass {timings['single_pass']:7.2f} ms/frame "
+                  f"({timings['two_pass'] / max(timings['single_pass'], 1e-6):.2f}x)")
+    return results
+
+class _HeadlessRoot:
+    """Offscreen stand-in for tk.Tk: after() callbacks run from update(), other calls are ignored.
+
+    The exception is tk.call(dst, 'copy', src, '-to', x, y, ...), the dirty-rect
+    upload of CafeApp._paste_region: it copies between _HeadlessPhoto blocks.
+    """
+
+    def __init__(self, screen_size=(1920, 1080)):
+        self.tk = self  # root.tk.call(...)
+        self.screen_size = screen_size
+        self._timers = []  # sorted (due, seq, func, args)
+        self._cancelled = set()
+        self._seq = 0
+
+    def __getattr__(self, name):
+        # title, protocol, resizable, bind, focus_set, destroy, ...
+        return lambda *args, **kwargs: None
+
+    def after(self, ms, func=None, *args):
+        self._seq += 1
+        bisect.insort(self._timers, (time.perf_counter() + ms / 1000.0, self._seq, func, args))
+        return f"after#{self._seq}"
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        self._cancelled.add(after_id)
+
+    def update(self):
+        """Run every after() callback that is due."""
+        now = time.perf_counter()
+        while self._timers and self._timers[0][0] <= now:
+            _, seq, func, args = self._timers.pop(0)
+            if f"after#{seq}" in self._cancelled:
+                self._cancelled.discard(f"after#{seq}")
+            elif func is not None:
+                func(*args)
+
+    def call(self, *args):
+        if len(args) >= 6 and args[1] == 'copy' and args[3] == '-to':
+            dst, src = _HeadlessPhoto.named(args[0]), _HeadlessPhoto.named(args[2])
+            if dst is not None and src is not None:
+                dst.copy_from(src, int(args[4]), int(args[5]))
+        return None
+
+    def winfo_screenwidth(self):
+        return self.screen_size[0]
+
+    def winfo_screenheight(self):
+        return self.screen_size[1]
+
+    def winfo_fpixels(self, distance):
+        return 96 / 72
+
+class _HeadlessCanvas:
+    """Offscreen stand-in for tk.Canvas: hands out item ids and counts calls, draws nothing."""
+
+    def __init__(self, master=None, **options):
+        self.items = set()
+        self.calls = 0
+        self._last_id = 0
+
+    def __getattr__(self, name):
+        # coords, itemconfigure, tag_raise, pack, bind, configure, ...
+        def call(*args, **options):
+            self.calls += 1
+        return call
+
+    def _create(self, *coords, **options):
+        self.calls += 1
+        self._last_id += 1
+        self.items.add(self._last_id)
+        return self._last_id
+
+    create_image = create_rectangle = create_oval = create_line = create_polygon = create_text = _create
+
+    def delete(self, *items):
+        self.calls += 1
+        if 'all' in items:
+            self.items.clear()
+        else:
+            self.items.difference_update(items)
+
+class _HeadlessPhoto:
+    """Offscreen stand-in for ImageTk.PhotoImage.
+
+    Keeps the pixels as a 32-bit RGBA block like a Tk photo, so creating,
+    pasting and region copies cost a conversion and copy comparable to a
+    real upload. The class counters (pixels converted, region copies and
+    their pixels) are read by benchmark_scenes.
+    """
+
+    _photos = weakref.WeakValueDictionary()  # Tk-style name -> live photo, for _HeadlessRoot.call
+    _count = 0
+    uploaded_pixels = 0  # pixels converted by creation and paste(), region images included
+    region_copies = 0    # 'copy -to' uploads (CafeApp._paste_region)
+    region_pixels = 0
+
+    def __init__(self, image):
+        _HeadlessPhoto._count += 1
+        self._name = f"headless{_HeadlessPhoto._count}"
+        _HeadlessPhoto._photos[self._name] = self
+        self._size = image.size
+        self._block = bytearray(self._rgba(image))
+
+    def __str__(self):
+        return self._name
+
+    @classmethod
+    def named(cls, name):
+        return cls._photos.get(name)
+
+    @staticmethod
+    def _rgba(image):
+        _HeadlessPhoto.uploaded_pixels += image.width * image.height
+        return (image if image.mode == 'RGBA' else image.convert('RGBA')).tobytes()
+
+    def width(self):
+        return self._size[0]
+
+    def height(self):
+        return self._size[1]
+
+    def paste(self, image):
+        self._block[:] = self._rgba(image)
+
+    def copy_from(self, src, x, y):
+        """Copy all of `src` into this photo at (x, y), clipped to its size."""
+        sw, sh = src._size
+        w, h = min(sw, self._size[0] - x), min(sh, self._size[1] - y)
+        if w <= 0 or h <= 0:
+            return
+        _HeadlessPhoto.region_copies += 1
+        _HeadlessPhoto.region_pixels += w * h
+        stride, src_stride = self._size[0] * 4, sw * 4
+        for row in range(h):
+            dst = (y + row) * stride + x * 4
+            self._block[dst:dst + w * 4] = src._block[row * src_stride:row * src_stride + w * 4]
+
+def _bench_enter_state(app, state):
+    """Put the scene in `state` from its first frame (fades re-armed, tears re-rolled)."""
+    app.scene.state = state
+    app.scene.fade_counter = 0
+    if state == SceneManager.STATE_TEARING:
+        app.tear.start()
+    elif state in CafeApp.CROSSFADE_SCENES:
+        app.arm_crossfade()
+
+def _resident_scene_frame_bytes(app):
+    """Bytes of the distinct frames the app's streaming GIFs and scene caches hold right now.
+
+    Every owner's lock is held while counting, so a prefetch on the worker
+    thread cannot decode or evict halfway through the snapshot.
+    """
+    frames = {}
+    with contextlib.ExitStack() as locks:
+        for gif_attr, cache_attr in app.SCENE_ATTRS:
+            gif, cache = getattr(app, gif_attr), getattr(app, cache_attr)
+            locks.enter_context(gif._lock)
+            locks.enter_context(cache._lock)
+            if gif.stream:
+                frames.update((id(img), img) for img in gif._decoded.values())
+            for store in cache._stores.values():
+                frames.update((id(img), img) for img in store.values())
+    return sum(img.width * img.height * len(img.getbands()) for img in frames.values())
+
+def _bench_close_overlays(app):
+    """Close every menu/overlay; a mood counts as picked so draw() does not reopen the menu."""
+    app.close_menu()
+    app.phone_game_active = False
+    app.meditation_active = False
+    app.todo_list_active = False
+    app.menu_selected_index = 0
+
+# Benchmark scenario -> (scene state, overlay opener as (CafeApp method, *args), or None)
+BENCH_SCENARIOS = (
+    ('outside', SceneManager.STATE_OUTSIDE, None),
+    ('fading', SceneManager.STATE_FADING, None),
+    ('inside', SceneManager.STATE_INSIDE, None),
+    ('fading_to_focused', SceneManager.STATE_FADING_TO_FOCUSED, None),
+    ('tearing', SceneManager.STATE_TEARING, None),
+    ('focused', SceneManager.STATE_FOCUSED, None),
+    ('fading_to_fireplace', SceneManager.STATE_FADING_TO_FIREPLACE, None),
+    ('fireplace', SceneManager.STATE_FIREPLACE, None),
+    ('fading_from_fireplace', SceneManager.STATE_FADING_FROM_FIREPLACE, None),
+    ('fading_to_coffee', SceneManager.STATE_FADING_TO_COFFEE, None),
+    ('coffee', SceneManager.STATE_COFFEE, None),
+    ('fading_from_coffee', SceneManager.STATE_FADING_FROM_COFFEE, None),
+    ('mood_menu', SceneManager.STATE_INSIDE, ('open_menu', 'mood')),
+    ('cozy_submenu', SceneManager.STATE_INSIDE, ('open_menu', 'cozy')),
+    ('focused_submenu', SceneManager.STATE_INSIDE, ('open_menu', 'focused')),
+    ('creative_submenu', SceneManager.STATE_INSIDE, ('open_menu', 'creative')),
+    ('meditation', SceneManager.STATE_INSIDE, ('start_meditation',)),
+    ('phone_game', SceneManager.STATE_INSIDE, ('start_phone_game',)),
+    ('todo', SceneManager.STATE_FOCUSED, ('start_todo_list',)),
+)
+
+def benchmark_scenes(frames: int = 120, warmup: int = 10, json_path: str = None, load_timeout: float = 60.0):
+    """Render every BENCH_SCENARIOS entry offscreen for `frames` frames and report JSON.
+
+    CafeApp runs on _HeadlessRoot/_HeadlessCanvas/_HeadlessPhoto without the
+    mixer, so no display or audio device is needed; photo uploads, including
+    dirty-rect region copies, still move the pixels and are timed as 'upload'.
+    Each frame is one fixed simulation step plus a full draw(); a state the
+    simulation leaves (a finished fade) is re-entered. Per scenario the result
+    has fps, frame-time percentiles, FrameProfiler phase p50s, PhotoImage
+    allocations, pixels converted to photos and copied by region uploads,
+    canvas item/call counts and text run cache hits/misses. The
+    distinct scene frames held after every frame are measured against
+    GIF_FRAME_BUDGET_MB (a [WARN] if they ever exceed it). The JSON goes to
+    json_path, or stdout (app log lines are sent to stderr meanwhile). Returns the dict.
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        root = _HeadlessRoot()
+        app = CafeApp(root, canvas_factory=_HeadlessCanvas, photo_factory=_HeadlessPhoto, audio=False)
+        deadline = time.perf_counter() + load_timeout
+        while app.loader.busy and time.perf_counter() < deadline:
+            root.update()
+            time.sleep(ASSET_POLL_MS / 1000.0)
+        if app.loader.busy:
+            print(f"[WARN] Benchmark assets still loading after {load_timeout:.0f}s")
+        profiler = app.profiler
+        step = app.frame_clock.step
+        scenarios = []
+        peak_resident = 0
+        for name, state, open_overlay in BENCH_SCENARIOS:
+            _bench_close_overlays(app)
+            _bench_enter_state(app, state)
+            if open_overlay is not None:
+                getattr(app, open_overlay[0])(*open_overlay[1:])
+            profiler.reset(max(1, frames))
+            allocations = calls = hits = misses = 0
+            uploaded = copies = copied = 0
+            max_items = 0
+            wall = 0.0
+            for i in range(warmup + frames):
+                if i == warmup:
+                    profiler.reset()
+                    allocations = app.layers.allocations
+                    hits, misses = app.text_runs.hits, app.text_runs.misses
+                    uploaded, copies, copied = (_HeadlessPhoto.uploaded_pixels, _HeadlessPhoto.region_copies,
+                                                _HeadlessPhoto.region_pixels)
+                    calls = 0
+                if app.scene.state != state:
+                    _bench_enter_state(app, state)
+                t0 = time.perf_counter()
+                profiler.begin_frame()
+                with profiler.phase('update'):
+                    app.step_simulation(step)
+                with profiler.phase('draw'):
+                    app.draw()
+                profiler.end_frame(app.canvas.frame_items)
+                if i >= warmup:
+                    wall += time.perf_counter() - t0
+                    calls += app.canvas.last_frame_calls
+                    max_items = max(max_items, app.canvas.frame_items)
+                peak_resident = max(peak_resident, _resident_scene_frame_bytes(app))
+            p50, p95, p99 = profiler.percentiles('frame')
+            items = profiler.samples['items']
+            scenarios.append({
+                'name': name,
+                'state': state,
+                'overlay': ' '.join(open_overlay) if open_overlay is not None else None,
+                'frames': frames,
+                'fps': round(frames / wall, 1) if wall > 0 else None,
+                'frame_ms': {'p50': round(p50, 3), 'p95': round(p95, 3), 'p99': round(p99, 3),
+                             'max': round(max(profiler.samples['frame'], default=0.0), 3)},
+                'phase_ms_p50': {phase: round(profiler.percentiles(phase)[0], 3) for phase in FrameProfiler.PHASES},
+                'photo_allocations': app.layers.allocations - allocations,
+                'uploads_per_frame': {
+                    'photo_pixels': round((_HeadlessPhoto.uploaded_pixels - uploaded) / max(1, frames)),
+                    'region_copies': round((_HeadlessPhoto.region_copies - copies) / max(1, frames), 2),
+                    'region_pixels': round((_HeadlessPhoto.region_pixels - copied) / max(1, frames)),
+                },
+                'canvas_items': {'mean': round(sum(items) / max(1, len(items)), 1), 'max': max_items},
+                'canvas_calls_per_frame': round(calls / max(1, frames), 1),
+                'text_runs': {'hits': app.text_runs.hits - hits, 'misses': app.text_runs.misses - misses},
+            })
+            print(f"[INFO] {name:<22} {scenarios[-1]['fps']} fps, p95 {p95:.2f} ms, "
+                  f"{scenarios[-1]['canvas_items']['mean']} items")
+        app.profiler.close()
+        app.loader.shutdown()
+        if peak_resident > GIF_FRAME_BUDGET_MB << 20:
+            print(f"[WARN] Scene frames held {peak_resident / (1 << 20):.1f} MB, over GIF_FRAME_BUDGET_MB ({GIF_FRAME_BUDGET_MB})")
+    report = {
+        'logical_size': [app.width, app.height],
+        'display_size': list(app.scale_map.display_size),
+        'retained_canvas': RETAINED_CANVAS,
+        'overlay_backend': OVERLAY_BACKEND,
+        'frames_per_scenario': frames,
+        'warmup_frames': warmup,
+        'scenarios': scenarios,
+        'text_runs': app.text_runs.stats(),
+        'scene_frame_memory': {'budget_mb': GIF_FRAME_BUDGET_MB,
+                               'peak_resident_mb': round(peak_resident / (1 << 20), 1)},
+    }
+    text = json.dumps(report, indent=2)
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return report
+
 def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Cozy cafe scene')
+    parser.add_argument('--bench-fit', action='store_true', help='benchmark GIF frame fit+upscale paths and exit')
+    parser.add_argument('--bench-scale', type=int, default=2, help='integer display scale used by --bench-fit')
+    parser.add_argument('--bench-scenes', action='store_true', help='render every scene state and overlay offscreen, print JSON and exit')
+    parser.add_argument('--bench-frames', type=int, default=120, help='measured frames per scenario for --bench-scenes')
+    parser.add_argument('--bench-json', default=None, help='write the --bench-scenes JSON to this file instead of stdout')
+    parser.add_argument('--no-frame-cache', action='store_true', help='neither read nor write the on-disk frame cache (FRAME_CACHE_ENABLED)')
+    args = parser.parse_args()
+    if args.no_frame_cache:
+        global FRAME_CACHE_ENABLED
+        FRAME_CACHE_ENABLED = False
+    if args.bench_fit:
+        benchmark_fit_paths(scale=max(1, args.bench_scale))
+        return
+    if args.bench_scenes:
+        benchmark_scenes(frames=max(1, args.bench_frames), json_path=args.bench_json)
+        return
     root = tk.Tk()
     app = CafeApp(root)
     root.mainloop()